@@ -7,8 +7,9 @@ improved error handling, performance, and ease of use.
 import json
 import logging
 import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Union
 
 import aiofiles
 from pydantic import BaseModel, Field
@@ -16,10 +17,18 @@ from pydantic import BaseModel, Field
 from .config import BenchmarkConfig, HardwareProfile, load_config
 from .execution import ExecutionEngine
 from .reporting import ReportGenerator
-from .tasks import get_task_registry
+from .tasks import BenchmarkTask, get_task_registry
 
 logger = logging.getLogger(__name__)
 
+# Hardware profiles in definition order, and their human-readable descriptions
+_PROFILES = tuple(HardwareProfile)
+_PROFILE_DESCRIPTIONS = {
+    HardwareProfile.LIGHT: "Laptop/minimal (8GB+ RAM, 2+ cores)",
+    HardwareProfile.MEDIUM: "Desktop/development (16GB+ RAM, 4+ cores)",
+    HardwareProfile.HEAVY: "Server/comprehensive (32GB+ RAM, 8+ cores)",
+}
+
 
 class BenchmarkResult(BaseModel):
     """Simplified benchmark result container."""
@@ -58,8 +67,37 @@ class BenchmarkRunner:
         self.config = config or load_config()
         self.task_registry = get_task_registry()
         self.report_generator = ReportGenerator(self.config.output_directory)
+        # Engine shared by every run while the runner is used as an async context manager
+        self._engine: Optional[ExecutionEngine] = None
+        self._engine_stack: Optional[AsyncExitStack] = None
         self._validate_config()
 
+    async def __aenter__(self):
+        """Open one execution engine for all runs made inside the ``async with`` block.
+
+        Sequential runs then share its HTTP session and response cache instead
+        of opening a new engine per run. Runs sharing the engine must not overlap.
+        """
+        stack = AsyncExitStack()
+        self._engine = await stack.enter_async_context(ExecutionEngine(self.config))
+        self._engine_stack = stack
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared execution engine."""
+        stack, self._engine, self._engine_stack = self._engine_stack, None, None
+        if stack is not None:
+            await stack.__aexit__(exc_type, exc_val, exc_tb)
+
+    @asynccontextmanager
+    async def _engine_session(self) -> AsyncIterator[ExecutionEngine]:
+        """Yield the shared engine if there is one, otherwise an engine for this run only."""
+        if self._engine is not None:
+            yield self._engine
+        else:
+            async with ExecutionEngine(self.config) as engine:
+                yield engine
+
     def _validate_config(self) -> None:
         """Validate configuration and log any issues."""
         issues = self.config.validate_runtime()
@@ -111,7 +149,7 @@ class BenchmarkRunner:
 
         try:
             # Execute benchmark
-            async with ExecutionEngine(self.config) as engine:
+            async with self._engine_session() as engine:
                 results = await engine.execute_benchmark(tasks=task_objects, profile=profile, sample_size=sample_size)
 
             end_time = time.time()
@@ -200,7 +238,7 @@ class BenchmarkRunner:
         # Get all tasks for batch run
         tasks = self.task_registry.get_all_tasks()
 
-        async with ExecutionEngine(self.config) as engine:
+        async with self._engine_session() as engine:
             results = await engine.execute_benchmark(
                 tasks=tasks, profile=batch_config.profile, sample_size=batch_config.sample_size
             )
@@ -229,7 +267,7 @@ class BenchmarkRunner:
 
     def get_available_profiles(self) -> List[str]:
         """Get list of available hardware profiles."""
-        return [profile.value for profile in HardwareProfile]
+        return [profile.value for profile in _PROFILES]
 
     def get_available_tasks(self) -> List[str]:
         """Get list of available task IDs."""
@@ -257,7 +295,7 @@ class BenchmarkRunner:
     def list_available_profiles(self) -> List[Dict[str, Any]]:
         """List all available hardware profiles."""
         profiles = []
-        for profile in HardwareProfile:
+        for profile in _PROFILES:
             instances = self.config.get_profile_instances(profile)
             profiles.append(
                 {
@@ -272,12 +310,7 @@ class BenchmarkRunner:
 
     def _get_profile_description(self, profile: HardwareProfile) -> str:
         """Get human-readable description for a profile."""
-        descriptions = {
-            HardwareProfile.LIGHT: "Laptop/minimal (8GB+ RAM, 2+ cores)",
-            HardwareProfile.MEDIUM: "Desktop/development (16GB+ RAM, 4+ cores)",
-            HardwareProfile.HEAVY: "Server/comprehensive (32GB+ RAM, 8+ cores)",
-        }
-        return descriptions.get(profile, "Unknown profile")
+        return _PROFILE_DESCRIPTIONS.get(profile, "Unknown profile")
 
     def list_available_batches(self) -> List[Dict[str, Any]]:
         """List all available batch configurations."""
@@ -377,6 +410,17 @@ class BenchmarkRunner:
 
     def validate_setup(self) -> Dict[str, Any]:
         """Validate the entire benchmark setup."""
+        # List each target directory once for all tasks
+        tasks = self.task_registry.get_all_tasks()
+        return self._validate_setup(tasks, self.task_registry.find_existing_target_files(tasks))
+
+    async def validate_setup_async(self) -> Dict[str, Any]:
+        """Validate the entire benchmark setup, listing target directories concurrently."""
+        tasks = self.task_registry.get_all_tasks()
+        return self._validate_setup(tasks, await self.task_registry.find_existing_target_files_async(tasks))
+
+    def _validate_setup(self, tasks: Sequence[BenchmarkTask], existing_files: Set[str]) -> Dict[str, Any]:
+        """Validate configuration, tasks and profiles given the target files that exist."""
         issues = []
         warnings = []
 
@@ -385,8 +429,8 @@ class BenchmarkRunner:
         issues.extend(config_issues)
 
         # Task validation
-        for task in self.task_registry.get_all_tasks():
-            task_issues = self.task_registry.validate_task(task)
+        for task in tasks:
+            task_issues = self.task_registry.validate_task(task, existing_files)
             if task_issues:
                 issues.extend([f"Task {task.task_id}: {issue}" for issue in task_issues])
 
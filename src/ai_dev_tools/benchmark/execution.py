@@ -6,9 +6,15 @@ with proper error handling and resource management.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional, Set
+from contextlib import aclosing
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import aiohttp
 
@@ -19,6 +25,34 @@ from .tasks import BenchmarkTask, TaskApproach, TaskResult, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Generation options sent with every Ollama request
+OLLAMA_OPTIONS = {"temperature": 0.1, "top_p": 0.9, "num_predict": 150}
+
+
+def install_event_loop_policy(use_uvloop: bool = True) -> bool:
+    """Install uvloop as the asyncio event loop policy when available.
+
+    uvloop is optional and does not support Windows; when it is disabled or
+    cannot be imported the stdlib event loop is left in place.
+
+    Args:
+        use_uvloop: Whether uvloop should be used at all
+
+    Returns:
+        True if the uvloop policy was installed
+    """
+    if not use_uvloop:
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class ExecutionEngine:
     """Handles execution of benchmark tasks across multiple models and containers."""
@@ -28,12 +62,27 @@ class ExecutionEngine:
         self.orchestrator = ContainerOrchestrator(str(config.docker_compose_file))
         self.metrics = MetricsCollector()
         self._active_profiles: Set[HardwareProfile] = set()
+        self._ready_instances: Dict[HardwareProfile, List[ModelInstance]] = {}
         self._session: Optional[aiohttp.ClientSession] = None
-        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Request limiters of running instances, keyed by id() since instance
+        # names may repeat across profiles and the config is shared between engines
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        # Encoded request body and response cache key by (model, prompt)
+        self._payload_cache: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+        self._response_cache: Optional[sqlite3.Connection] = None
+        # The cache is only used from worker threads, one at a time; responses
+        # are written in batches after each task's samples
+        self._response_cache_lock = threading.Lock()
+        self._pending_responses: List[Tuple[str, str, int, int, float]] = []
+        self._instances_by_profile: Dict[HardwareProfile, Tuple[ModelInstance, ...]] = {
+            profile: tuple(config.get_profile_instances(profile)) for profile in HardwareProfile
+        }
 
     async def __aenter__(self):
         """Async context manager entry."""
         self._session = aiohttp.ClientSession()
+        if self.config.response_cache_path is not None:
+            self._open_response_cache(Path(self.config.response_cache_path))
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -41,20 +90,24 @@ class ExecutionEngine:
         if self._session:
             await self._session.close()
 
+        if self._response_cache is not None:
+            await self._flush_response_cache()
+            self._response_cache.close()
+            self._response_cache = None
+
         # Clean up any active profiles
-        for profile in self._active_profiles.copy():
-            await self.stop_profile(profile)
+        await self._stop_profiles(self._active_profiles.copy())
 
     async def start_profile(self, profile: HardwareProfile) -> List[ModelInstance]:
         """Start containers for a hardware profile and return ready instances."""
         logger.info(f"Starting containers for profile: {profile.value}")
 
         try:
-            # Start containers
-            self.orchestrator.up(profile=profile.value, build=False)
+            # Start containers without blocking the event loop
+            await asyncio.to_thread(self.orchestrator.up, profile=profile.value, build=False)
 
             # Get instances for this profile
-            instances = self.config.get_profile_instances(profile)
+            instances = list(self._instances_by_profile[profile])
             if not instances:
                 raise ValueError(f"No instances configured for profile: {profile}")
 
@@ -68,9 +121,10 @@ class ExecutionEngine:
 
             # Create semaphores for concurrent request limiting
             for instance in ready_instances:
-                self._semaphores[instance.name] = asyncio.Semaphore(instance.max_concurrent)
+                self._semaphores[id(instance)] = asyncio.Semaphore(instance.max_concurrent)
 
             self._active_profiles.add(profile)
+            self._ready_instances[profile] = ready_instances
             logger.info(f"Started {len(ready_instances)} instances for profile {profile.value}")
 
             return ready_instances
@@ -79,23 +133,50 @@ class ExecutionEngine:
             logger.error(f"Failed to start profile {profile.value}: {e}")
             raise
 
+    async def prewarm(self, profiles: Iterable[HardwareProfile]) -> Set[HardwareProfile]:
+        """Start several profiles concurrently ahead of benchmarking them.
+
+        Readiness waits overlap, so the startup timeout is paid once rather than
+        once per profile. Profiles that fail to start are left inactive (the
+        failure is logged by start_profile) and execute_benchmark retries them.
+
+        Returns:
+            The requested profiles that are now active
+        """
+        profiles = list(dict.fromkeys(profiles))
+        startup_slots = asyncio.Semaphore(self.config.max_concurrent_prewarm)
+
+        async def start(profile: HardwareProfile) -> None:
+            async with startup_slots:
+                await self.start_profile(profile)
+
+        pending = [profile for profile in profiles if profile not in self._active_profiles]
+        await asyncio.gather(*(start(profile) for profile in pending), return_exceptions=True)
+
+        return {profile for profile in profiles if profile in self._active_profiles}
+
     async def stop_profile(self, profile: HardwareProfile) -> None:
         """Stop containers for a hardware profile."""
         logger.info(f"Stopping containers for profile: {profile.value}")
 
         try:
-            self.orchestrator.down(profile=profile.value)
+            await asyncio.to_thread(self.orchestrator.down, profile=profile.value)
             self._active_profiles.discard(profile)
-
-            # Clean up semaphores
-            instances = self.config.get_profile_instances(profile)
-            for instance in instances:
-                self._semaphores.pop(instance.name, None)
+            self._ready_instances.pop(profile, None)
 
         except Exception as e:
             logger.error(f"Failed to stop profile {profile.value}: {e}")
             raise
 
+        finally:
+            # Clean up semaphores, which belong to this engine's event loop
+            for instance in self._instances_by_profile[profile]:
+                self._semaphores.pop(id(instance), None)
+
+    async def _stop_profiles(self, profiles: Set[HardwareProfile]) -> None:
+        """Stop several profiles concurrently; failures are logged by stop_profile."""
+        await asyncio.gather(*(self.stop_profile(profile) for profile in profiles), return_exceptions=True)
+
     async def execute_task_baseline(
         self, task: BenchmarkTask, model_instance: ModelInstance, sample_num: int = 0
     ) -> TaskResult:
@@ -148,15 +229,17 @@ class ExecutionEngine:
             return result
 
         # Use semaphore to limit concurrent requests per instance
-        semaphore = self._semaphores.get(model_instance.name)
-        if not semaphore:
+        semaphore = self._semaphores.get(id(model_instance))
+        if semaphore is None:
             result.mark_failed(f"No semaphore available for instance: {model_instance.name}")
             return result
 
         async with semaphore:
             try:
                 # Make request to Ollama API
-                api_result = await self._make_ollama_request(model_instance, task.tools_prompt, task.timeout)
+                api_result = await self._make_ollama_request(
+                    model_instance, task.tools_prompt, task.timeout, sample_num
+                )
 
                 if api_result["success"]:
                     result.mark_completed(
@@ -164,6 +247,12 @@ class ExecutionEngine:
                         tokens_in=api_result["input_tokens"],
                         tokens_out=api_result["output_tokens"],
                     )
+                    if api_result.get("cached"):
+                        # Report the latency measured when the response was cached,
+                        # not the near-zero time of the lookup
+                        result.duration = api_result["duration"]
+                        result.end_time = result.start_time + result.duration
+                        result.metadata["cached"] = True
                 else:
                     result.mark_failed(api_result["error"])
 
@@ -172,33 +261,61 @@ class ExecutionEngine:
 
         return result
 
-    async def _make_ollama_request(self, instance: ModelInstance, prompt: str, timeout: int) -> Dict[str, Any]:
-        """Make a request to Ollama API."""
-        payload = {
-            "model": instance.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {"temperature": 0.1, "top_p": 0.9, "num_predict": 150},
-        }
+    async def _make_ollama_request(
+        self, instance: ModelInstance, prompt: str, timeout: int, sample_num: int = 0
+    ) -> Dict[str, Any]:
+        """Make a request to Ollama API.
+
+        With the response cache enabled, responses are cached per instance and
+        sample, so a cached run replays the latencies of every original sample
+        and repeated samples within a run are still sent to the model.
+        """
+        payload, payload_key = self._get_payload(instance.model, prompt)
+        cache_key = f"{payload_key}:{instance.url}:{sample_num}" if self._response_cache is not None else None
+
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self._lookup_cached_response, cache_key)
+            if cached is not None:
+                return cached
 
         start_time = time.time()
 
         try:
             async with self._session.post(
-                f"{instance.url}/api/generate", json=payload, timeout=aiohttp.ClientTimeout(total=timeout)
+                f"{instance.url}/api/generate",
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=timeout),
             ) as response:
                 end_time = time.time()
 
                 if response.status == 200:
-                    result = await response.json()
+                    if self.config.stream_responses:
+                        result = await self._read_streamed_response(response)
+                        end_time = time.time()
+                    else:
+                        result = await response.json()
 
-                    return {
+                    api_result = {
                         "success": True,
                         "response": result.get("response", ""),
                         "input_tokens": result.get("prompt_eval_count", 0),
                         "output_tokens": result.get("eval_count", 0),
                         "duration": end_time - start_time,
                     }
+
+                    if cache_key is not None:
+                        self._pending_responses.append(
+                            (
+                                cache_key,
+                                api_result["response"],
+                                api_result["input_tokens"],
+                                api_result["output_tokens"],
+                                api_result["duration"],
+                            )
+                        )
+
+                    return api_result
                 else:
                     error_text = await response.text()
                     return {
@@ -212,6 +329,109 @@ class ExecutionEngine:
         except Exception as e:
             return {"success": False, "error": str(e), "duration": time.time() - start_time}
 
+    async def _read_streamed_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        """Parse a streamed (NDJSON) Ollama response as it arrives.
+
+        Response fragments are joined as they are received and the token counts
+        are taken from the final ``done`` message, giving the same shape as a
+        non-streamed ``/api/generate`` reply. A stream that ends without that
+        message is an error, since its token counts would be missing.
+        """
+        parts = []
+        result: Optional[Dict[str, Any]] = None
+
+        async for line in response.content:
+            line = line.strip()
+            if not line:
+                continue
+
+            message = json.loads(line)
+            if "error" in message:
+                raise RuntimeError(message["error"])
+
+            parts.append(message.get("response", ""))
+            if message.get("done"):
+                result = message
+                break
+
+        if result is None:
+            raise RuntimeError("Stream ended before the final response")
+
+        result["response"] = "".join(parts)
+        return result
+
+    def _get_payload(self, model: str, prompt: str) -> Tuple[bytes, str]:
+        """Get the encoded request body for a model/prompt pair and its response cache key.
+
+        Both are computed once per pair, so repeated samples neither re-encode
+        the prompt nor re-hash the body.
+        """
+        key = (model, prompt)
+        entry = self._payload_cache.get(key)
+        if entry is None:
+            payload = json.dumps(
+                {"model": model, "prompt": prompt, "stream": self.config.stream_responses, "options": OLLAMA_OPTIONS},
+                sort_keys=True,
+            ).encode("utf-8")
+            entry = self._payload_cache[key] = (payload, hashlib.blake2b(payload).hexdigest())
+        return entry
+
+    def _open_response_cache(self, cache_path: Path) -> None:
+        """Open (creating if needed) the on-disk Ollama response cache."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(cache_path), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT, input_tokens INTEGER, output_tokens INTEGER, duration REAL)"
+            )
+            connection.commit()
+            self._response_cache = connection
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache disabled, cannot open {cache_path}: {e}")
+            self._response_cache = None
+
+    def _lookup_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached successful Ollama response, or None on a miss."""
+        try:
+            with self._response_cache_lock:
+                row = self._response_cache.execute(
+                    "SELECT response, input_tokens, output_tokens, duration FROM responses WHERE key = ?", (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        response, input_tokens, output_tokens, duration = row
+        return {
+            "success": True,
+            "response": response,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "duration": duration,
+            "cached": True,
+        }
+
+    async def _flush_response_cache(self) -> None:
+        """Write the responses received since the last flush to the on-disk cache."""
+        if self._response_cache is None or not self._pending_responses:
+            return
+
+        rows, self._pending_responses = self._pending_responses, []
+        await asyncio.to_thread(self._store_cached_responses, rows)
+
+    def _store_cached_responses(self, rows: List[Tuple[str, str, int, int, float]]) -> None:
+        """Store successful Ollama responses in the on-disk cache in one transaction."""
+        try:
+            with self._response_cache_lock:
+                self._response_cache.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", rows)
+                self._response_cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
     async def execute_task_samples(
         self,
         task: BenchmarkTask,
@@ -223,88 +443,81 @@ class ExecutionEngine:
         if approaches is None:
             approaches = [TaskApproach.BASELINE, TaskApproach.TOOLS]
 
-        results = []
-
-        # Create all task executions
+        # Create all task executions, each converting its own failure into a result
         task_coroutines = []
 
         for approach in approaches:
+            execute = self.execute_task_baseline if approach == TaskApproach.BASELINE else self.execute_task_tools
+
             for instance in instances:
                 for sample_num in range(sample_size):
-                    if approach == TaskApproach.BASELINE:
-                        coro = self.execute_task_baseline(task, instance, sample_num)
-                    else:
-                        coro = self.execute_task_tools(task, instance, sample_num)
-
-                    task_coroutines.append(coro)
+                    coro = execute(task, instance, sample_num)
+                    task_coroutines.append(self._safe_execute(coro, task.task_id, approach, instance.name))
 
         # Execute based on execution mode
         if self.config.execution_mode == ExecutionMode.SEQUENTIAL:
             # Run tasks sequentially
+            results = []
             for coro in task_coroutines:
-                result = await coro
-                results.append(result)
-                await self.metrics.add_task_result(result)
-
-        elif self.config.execution_mode == ExecutionMode.PARALLEL:
-            # Run tasks in parallel with limited concurrency
-            semaphore = asyncio.Semaphore(self.config.max_concurrent_batches * 2)
-
-            async def run_with_semaphore(coro):
-                async with semaphore:
-                    return await coro
-
-            limited_coroutines = [run_with_semaphore(coro) for coro in task_coroutines]
-            task_results = await asyncio.gather(*limited_coroutines, return_exceptions=True)
-
-            for result in task_results:
-                if isinstance(result, Exception):
-                    # Create failed result for exception
-                    failed_result = TaskResult(
-                        task_id=task.task_id,
-                        approach=TaskApproach.TOOLS,  # Default
-                        model_instance="unknown",
-                        status=TaskStatus.FAILED,
-                        start_time=time.time(),
-                        error=str(result),
-                    )
-                    results.append(failed_result)
-                else:
-                    results.append(result)
-
-                await self.metrics.add_task_result(results[-1])
-
-        else:  # ASYNC mode
-            # Run all tasks fully async
-            task_results = await asyncio.gather(*task_coroutines, return_exceptions=True)
-
-            for result in task_results:
-                if isinstance(result, Exception):
-                    # Create failed result for exception
-                    failed_result = TaskResult(
-                        task_id=task.task_id,
-                        approach=TaskApproach.TOOLS,  # Default
-                        model_instance="unknown",
-                        status=TaskStatus.FAILED,
-                        start_time=time.time(),
-                        error=str(result),
-                    )
-                    results.append(failed_result)
-                else:
-                    results.append(result)
+                results.append(await coro)
+
+        else:
+            if self.config.execution_mode == ExecutionMode.PARALLEL:
+                # Run tasks in parallel with limited concurrency
+                semaphore = asyncio.Semaphore(self.config.max_concurrent_batches * 2)
+
+                async def run_with_semaphore(coro):
+                    async with semaphore:
+                        return await coro
+
+                task_coroutines = [run_with_semaphore(coro) for coro in task_coroutines]
+
+            # ASYNC mode runs all tasks fully async
+            if hasattr(asyncio, "TaskGroup"):
+                async with asyncio.TaskGroup() as group:
+                    futures = [group.create_task(coro) for coro in task_coroutines]
+                results = [future.result() for future in futures]
+            else:  # Python 3.10
+                results = await asyncio.gather(*task_coroutines)
 
-                await self.metrics.add_task_result(results[-1])
+        for result in results:
+            self.metrics.add_task_result(result)
+
+        await self._flush_response_cache()
 
         return results
 
+    async def _safe_execute(
+        self, coro: Awaitable[TaskResult], task_id: str, approach: TaskApproach, instance_name: str
+    ) -> TaskResult:
+        """Await a task execution, turning any exception into a failed result."""
+        try:
+            return await coro
+        except Exception as e:
+            return TaskResult(
+                task_id=task_id,
+                approach=approach,
+                model_instance=instance_name,
+                status=TaskStatus.FAILED,
+                start_time=time.time(),
+                error=str(e),
+            )
+
     async def execute_benchmark(
         self,
-        tasks: List[BenchmarkTask],
+        tasks: Sequence[BenchmarkTask],
         profile: HardwareProfile,
         sample_size: Optional[int] = None,
         approaches: List[TaskApproach] = None,
+        keep_profile_active: bool = False,
     ) -> Dict[str, Any]:
-        """Execute a full benchmark across tasks and instances."""
+        """Execute a full benchmark across tasks and instances.
+
+        If the profile is already active its running instances are reused instead
+        of starting the containers again. With ``keep_profile_active`` the profile
+        is left running afterwards so a following benchmark on the same profile
+        can reuse it; the caller is then responsible for stopping it.
+        """
         if sample_size is None:
             sample_size = self.config.get_sample_size(profile)
 
@@ -318,78 +531,110 @@ class ExecutionEngine:
         await self.metrics.start_collection()
 
         try:
-            # Start profile containers
-            instances = await self.start_profile(profile)
+            # Start profile containers unless they are already up
+            if profile in self._active_profiles:
+                instances = self._ready_instances[profile]
+            else:
+                instances = await self.start_profile(profile)
+
+            benchmark_info = {
+                "profile": profile.value,
+                "total_tasks": len(tasks),
+                "sample_size": sample_size,
+                "approaches": [a.value for a in approaches],
+                "instances": len(instances),
+                "execution_mode": self.config.execution_mode.value,
+            }
 
-            # Execute all tasks
-            all_results = []
+            # Execute all tasks, serializing each task's results as they arrive so
+            # the TaskResult objects are not held alongside their dict form
+            serialized_results = []
 
             for task in tasks:
                 logger.info(f"Executing task: {task.name}")
 
                 task_results = await self.execute_task_samples(task, instances, sample_size, approaches)
 
-                all_results.extend(task_results)
+                serialized_results.extend(result.to_dict() for result in task_results)
 
             # Stop metrics collection
             await self.metrics.stop_collection()
 
-            # Calculate metrics
-            overall_metrics = self.metrics.calculate_metrics()
-            comparison_metrics = self.metrics.calculate_comparison_metrics()
-            metrics_by_task = self.metrics.get_metrics_by_task()
-            metrics_by_model = self.metrics.get_metrics_by_model()
+            benchmark_info["timestamp"] = time.time()
+            exported_metrics = self.metrics.export_metrics()
+
+            # The results are serialized and their metrics exported, so release the
+            # TaskResult objects instead of holding them until the next benchmark
+            self.metrics.reset()
 
             return {
-                "benchmark_info": {
-                    "profile": profile.value,
-                    "total_tasks": len(tasks),
-                    "sample_size": sample_size,
-                    "approaches": [a.value for a in approaches],
-                    "instances": len(instances),
-                    "execution_mode": self.config.execution_mode.value,
-                    "timestamp": time.time(),
-                },
-                "results": [result.to_dict() for result in all_results],
-                "overall_metrics": overall_metrics.to_dict(),
-                "comparison_metrics": comparison_metrics.to_dict(),
-                "metrics_by_task": {k: v.to_dict() for k, v in metrics_by_task.items()},
-                "metrics_by_model": {k: v.to_dict() for k, v in metrics_by_model.items()},
+                "benchmark_info": benchmark_info,
+                "results": serialized_results,
+                **exported_metrics,
             }
 
         except Exception as e:
             logger.error(f"Benchmark execution failed: {e}")
             raise
         finally:
-            # Always stop the profile
-            if profile in self._active_profiles:
+            # Stop the profile unless the caller wants to reuse it
+            if not keep_profile_active and profile in self._active_profiles:
                 await self.stop_profile(profile)
 
     async def execute_batch(
-        self, batch_configs: List[Dict[str, Any]], tasks: List[BenchmarkTask]
+        self, batch_configs: List[Dict[str, Any]], tasks: Sequence[BenchmarkTask]
     ) -> List[Dict[str, Any]]:
         """Execute multiple benchmark configurations in batch."""
+        async with aclosing(self.iter_batch(batch_configs, tasks)) as batch:
+            return [result async for result in batch]
+
+    async def iter_batch(
+        self, batch_configs: List[Dict[str, Any]], tasks: Sequence[BenchmarkTask]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute multiple benchmark configurations, yielding each result as it finishes.
+
+        Results come in execution order (grouped by profile). Consume with
+        ``contextlib.aclosing`` so profiles are stopped promptly even if
+        iteration ends early.
+        """
         logger.info(f"Starting batch execution with {len(batch_configs)} configurations")
 
-        results = []
+        # Group configurations by profile (keeping first-seen order) so each
+        # profile's containers are started and stopped only once
+        profile_order: Dict[Any, int] = {}
+        for config in batch_configs:
+            profile_order.setdefault(config.get("profile"), len(profile_order))
+        ordered_configs = sorted(batch_configs, key=lambda c: profile_order[c.get("profile")])
+        previously_active = self._active_profiles.copy()
 
-        for i, config in enumerate(batch_configs):
-            logger.info(f"Executing batch {i + 1}/{len(batch_configs)}: {config.get('name', 'unknown')}")
+        try:
+            for i, config in enumerate(ordered_configs):
+                logger.info(f"Executing batch {i + 1}/{len(ordered_configs)}: {config.get('name', 'unknown')}")
+
+                try:
+                    profile = HardwareProfile(config["profile"])
+                    sample_size = config.get("sample_size", self.config.get_sample_size(profile))
+
+                    # Keep the profile up for the next configuration of its group, and
+                    # leave profiles that were running before the batch to their owner
+                    next_config = ordered_configs[i + 1] if i + 1 < len(ordered_configs) else None
+                    keep_active = profile in previously_active or (
+                        next_config is not None and next_config.get("profile") == config["profile"]
+                    )
 
-            try:
-                profile = HardwareProfile(config["profile"])
-                sample_size = config.get("sample_size", self.config.get_sample_size(profile))
+                    result = await self.execute_benchmark(tasks, profile, sample_size, keep_profile_active=keep_active)
 
-                result = await self.execute_benchmark(tasks, profile, sample_size)
+                    result["batch_info"] = config
 
-                result["batch_info"] = config
-                results.append(result)
+                except Exception as e:
+                    logger.error(f"Batch configuration failed: {e}")
+                    result = {"batch_info": config, "error": str(e), "success": False}
 
-            except Exception as e:
-                logger.error(f"Batch configuration failed: {e}")
-                results.append({"batch_info": config, "error": str(e), "success": False})
+                yield result
 
-        return results
+        finally:
+            # Stop any profile this batch left running
+            await self._stop_profiles(self._active_profiles - previously_active)
 
     def get_active_profiles(self) -> Set[HardwareProfile]:
         """Get currently active profiles."""
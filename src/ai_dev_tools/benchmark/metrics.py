@@ -4,18 +4,55 @@ Metrics collection and analysis for AI Development Tools benchmarking.
 Provides comprehensive metrics collection, statistical analysis, and performance tracking.
 """
 
-import asyncio
-import statistics
+import math
+import re
 import time
-from collections import defaultdict
+from collections import Counter
 from contextlib import contextmanager
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
-from .tasks import TaskApproach, TaskResult
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+try:
+    from pytdigest import TDigest
+except ImportError:
+    TDigest = None
 
-@dataclass
+from .tasks import TaskApproach, TaskResult, TaskStatus
+
+# Duration percentiles reported for every metrics calculation
+PERCENTILES = (25, 50, 75, 90, 95, 99)
+
+# Error categories in classification priority order
+ERROR_TYPES = ("timeout", "connection", "http", "json", "model")
+_ERROR_PATTERN = re.compile("|".join(f"({error_type})" for error_type in ERROR_TYPES), re.IGNORECASE)
+
+
+def _calculate_percentiles(durations: List[float]) -> Dict[str, float]:
+    """Calculate the reported duration percentiles from a single sort.
+
+    With NumPy, the "weibull" method matches the exclusive method of
+    statistics.quantiles inside the data range. Without it, percentiles fall
+    back to nearest-rank lookups into the sorted durations.
+    """
+    if len(durations) < 2:
+        return {}
+
+    if np is not None:
+        values = np.percentile(durations, PERCENTILES, method="weibull")
+    else:
+        ordered = sorted(durations)
+        n = len(ordered)
+        values = [ordered[max(math.ceil(q * n / 100) - 1, 0)] for q in PERCENTILES]
+    return {f"p{q}": float(value) for q, value in zip(PERCENTILES, values)}
+
+
+@dataclass(slots=True)
 class BenchmarkMetrics:
     """Comprehensive metrics for a benchmark run."""
 
@@ -56,36 +93,25 @@ class BenchmarkMetrics:
     percentiles: Dict[str, float] = field(default_factory=dict)
     error_types: Dict[str, int] = field(default_factory=dict)
 
+    # Serialized field names, filled in once the dataclass is built
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _get_fields: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to dictionary for serialization."""
-        return {
-            "total_tasks": self.total_tasks,
-            "completed_tasks": self.completed_tasks,
-            "failed_tasks": self.failed_tasks,
-            "success_rate": self.success_rate,
-            "total_duration": self.total_duration,
-            "average_task_duration": self.average_task_duration,
-            "min_duration": self.min_duration,
-            "max_duration": self.max_duration,
-            "duration_std": self.duration_std,
-            "total_tokens": self.total_tokens,
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
-            "average_tokens_per_task": self.average_tokens_per_task,
-            "tokens_per_second": self.tokens_per_second,
-            "throughput": self.throughput,
-            "efficiency_score": self.efficiency_score,
-            "timeout_count": self.timeout_count,
-            "retry_count": self.retry_count,
-            "error_rate": self.error_rate,
-            "concurrent_peak": self.concurrent_peak,
-            "resource_utilization": self.resource_utilization,
-            "percentiles": self.percentiles,
-            "error_types": self.error_types,
-        }
+        """Convert metrics to dictionary for serialization.
+
+        Values are plain ``int``/``float``/``dict`` objects (never NumPy
+        scalars), so the result can go straight to ``orjson.dumps`` or
+        ``json.dumps`` without a ``default`` hook.
+        """
+        return dict(zip(self._FIELDS, self._get_fields(self)))
+
 
+BenchmarkMetrics._FIELDS = tuple(f.name for f in fields(BenchmarkMetrics))
+BenchmarkMetrics._get_fields = attrgetter(*BenchmarkMetrics._FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class ComparisonMetrics:
     """Metrics comparing baseline vs tools performance."""
 
@@ -107,106 +133,113 @@ class ComparisonMetrics:
     # Sample information
     sample_size: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert comparison metrics to dictionary."""
-        return {
-            "token_reduction_percent": self.token_reduction_percent,
-            "time_reduction_percent": self.time_reduction_percent,
-            "efficiency_improvement_percent": self.efficiency_improvement_percent,
-            "baseline_metrics": self.baseline_metrics.to_dict(),
-            "tools_metrics": self.tools_metrics.to_dict(),
-            "statistical_significance": self.statistical_significance,
-            "confidence_interval": self.confidence_interval,
-            "sample_size": self.sample_size,
-        }
+    # Serialized field names and the nested metrics among them, filled in once the dataclass is built
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _NESTED_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _get_fields: ClassVar[Callable[[Any], Tuple[Any, ...]]]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert comparison metrics to dictionary of plain JSON types (see BenchmarkMetrics.to_dict)."""
+        data = dict(zip(self._FIELDS, self._get_fields(self)))
+        for name in self._NESTED_FIELDS:
+            data[name] = data[name].to_dict()
+        return data
 
-class MetricsCollector:
-    """Comprehensive metrics collection and analysis."""
-
-    def __init__(self):
-        self.task_results: List[TaskResult] = []
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
-        self.concurrent_tasks: int = 0
-        self.max_concurrent: int = 0
-        self.retry_counts: Dict[str, int] = defaultdict(int)
-        self._lock = asyncio.Lock()
-
-    async def start_collection(self) -> None:
-        """Start metrics collection."""
-        async with self._lock:
-            self.start_time = time.time()
-            self.task_results.clear()
-            self.concurrent_tasks = 0
-            self.max_concurrent = 0
-            self.retry_counts.clear()
-
-    async def stop_collection(self) -> None:
-        """Stop metrics collection."""
-        async with self._lock:
-            self.end_time = time.time()
-
-    @contextmanager
-    def track_concurrent_task(self):
-        """Context manager to track concurrent task execution."""
-        self.concurrent_tasks += 1
-        self.max_concurrent = max(self.max_concurrent, self.concurrent_tasks)
-        try:
-            yield
-        finally:
-            self.concurrent_tasks -= 1
 
-    async def add_task_result(self, result: TaskResult) -> None:
-        """Add a task result to the collection."""
-        async with self._lock:
-            self.task_results.append(result)
+ComparisonMetrics._FIELDS = tuple(f.name for f in fields(ComparisonMetrics))
+ComparisonMetrics._NESTED_FIELDS = tuple(f.name for f in fields(ComparisonMetrics) if is_dataclass(f.type))
+ComparisonMetrics._get_fields = attrgetter(*ComparisonMetrics._FIELDS)
 
-    async def record_retry(self, task_id: str) -> None:
-        """Record a retry attempt for a task."""
-        async with self._lock:
-            self.retry_counts[task_id] += 1
 
-    def calculate_metrics(self, filter_approach: Optional[TaskApproach] = None) -> BenchmarkMetrics:
-        """Calculate comprehensive metrics from collected results."""
-        if filter_approach:
-            results = [r for r in self.task_results if r.approach == filter_approach]
-        else:
-            results = self.task_results
+@dataclass(slots=True)
+class _MetricsAccumulator:
+    """Running totals for a single metrics calculation."""
 
-        if not results:
+    total_tasks: int = 0
+    completed_tasks: int = 0
+    failed_tasks: int = 0
+    timeout_tasks: int = 0
+    total_tokens: int = 0
+    total_input_tokens: int = 0
+    total_output_tokens: int = 0
+    duration_sum: float = 0.0
+    duration_mean: float = 0.0
+    duration_m2: float = 0.0  # sum of squared deviations from the running mean (Welford)
+    min_duration: float = 0.0
+    max_duration: float = 0.0
+    durations: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def add(self, r: TaskResult) -> None:
+        """Accumulate a single task result."""
+        self.total_tasks += 1
+        status = r.status
+        if status is TaskStatus.COMPLETED:
+            self.completed_tasks += 1
+        elif status is TaskStatus.FAILED:
+            self.failed_tasks += 1
+        elif status is TaskStatus.TIMEOUT:
+            self.timeout_tasks += 1
+
+        self.total_tokens += r.total_tokens
+        self.total_input_tokens += r.input_tokens
+        self.total_output_tokens += r.output_tokens
+
+        d = r.duration
+        if d is not None:
+            if self.durations:
+                if d < self.min_duration:
+                    self.min_duration = d
+                elif d > self.max_duration:
+                    self.max_duration = d
+            else:
+                self.min_duration = self.max_duration = d
+            self.durations.append(d)
+            self.duration_sum += d
+            delta = d - self.duration_mean
+            self.duration_mean += delta / len(self.durations)
+            self.duration_m2 += delta * (d - self.duration_mean)
+
+        if r.error:
+            self.errors.append(r.error)
+
+    def duration_moments(self) -> Tuple[int, float, float]:
+        """Return the count, mean and sample standard deviation of the accumulated durations."""
+        n = len(self.durations)
+        if not n:
+            return 0, 0.0, 0.0
+
+        std = math.sqrt(self.duration_m2 / (n - 1)) if n > 1 else 0.0
+        return n, self.duration_mean, std
+
+    def finalize(
+        self,
+        start_time: Optional[float],
+        end_time: Optional[float],
+        retry_total: int = 0,
+        max_concurrent: int = 0,
+    ) -> BenchmarkMetrics:
+        """Build metrics from the accumulated totals."""
+        total_tasks = self.total_tasks
+        completed_tasks = self.completed_tasks
+        total_tokens = self.total_tokens
+        if not total_tasks:
             return BenchmarkMetrics()
 
-        # Basic counts
-        total_tasks = len(results)
-        completed_tasks = len([r for r in results if r.status.value == "completed"])
-        failed_tasks = len([r for r in results if r.status.value == "failed"])
-        timeout_tasks = len([r for r in results if r.status.value == "timeout"])
+        # Error analysis
+        error_types = Counter(map(MetricsCollector._classify_error, self.errors))
 
-        success_rate = completed_tasks / total_tasks if total_tasks > 0 else 0.0
-        error_rate = failed_tasks / total_tasks if total_tasks > 0 else 0.0
+        success_rate = completed_tasks / total_tasks
+        error_rate = self.failed_tasks / total_tasks
 
         # Duration metrics
-        completed_results = [r for r in results if r.duration is not None]
-        if completed_results:
-            durations = [r.duration for r in completed_results]
-            total_duration = sum(durations)
-            average_duration = statistics.mean(durations)
-            min_duration = min(durations)
-            max_duration = max(durations)
-            duration_std = statistics.stdev(durations) if len(durations) > 1 else 0.0
-
-            # Calculate percentiles
-            percentiles = {}
-            if len(durations) >= 2:
-                percentiles = {
-                    "p25": statistics.quantiles(durations, n=4)[0],
-                    "p50": statistics.median(durations),
-                    "p75": statistics.quantiles(durations, n=4)[2],
-                    "p90": statistics.quantiles(durations, n=10)[8],
-                    "p95": statistics.quantiles(durations, n=20)[18],
-                    "p99": statistics.quantiles(durations, n=100)[98],
-                }
+        n, average_duration, duration_std = self.duration_moments()
+        if n:
+            # Sums and extrema were accumulated alongside the counts
+            total_duration = self.duration_sum
+            min_duration = float(self.min_duration)
+            max_duration = float(self.max_duration)
+            percentiles = _calculate_percentiles(self.durations)
         else:
             total_duration = 0.0
             average_duration = 0.0
@@ -215,36 +248,25 @@ class MetricsCollector:
             duration_std = 0.0
             percentiles = {}
 
-        # Token metrics
-        total_tokens = sum(r.total_tokens for r in results)
-        total_input_tokens = sum(r.input_tokens for r in results)
-        total_output_tokens = sum(r.output_tokens for r in results)
         average_tokens_per_task = total_tokens / completed_tasks if completed_tasks > 0 else 0.0
 
         # Performance metrics
-        overall_duration = (self.end_time or time.time()) - (self.start_time or time.time())
+        overall_duration = end_time - start_time if start_time is not None and end_time is not None else 0.0
         throughput = completed_tasks / overall_duration if overall_duration > 0 else 0.0
         tokens_per_second = total_tokens / overall_duration if overall_duration > 0 else 0.0
 
         # Efficiency score (composite metric)
-        efficiency_score = self._calculate_efficiency_score(
+        efficiency_score = MetricsCollector._calculate_efficiency_score(
             success_rate, throughput, tokens_per_second, average_duration
         )
 
-        # Error analysis
-        error_types = defaultdict(int)
-        for result in results:
-            if result.error:
-                error_type = self._classify_error(result.error)
-                error_types[error_type] += 1
-
         # Resource utilization
-        resource_utilization = self.max_concurrent / 10.0  # Assuming max 10 concurrent tasks
+        resource_utilization = max_concurrent / 10.0  # Assuming max 10 concurrent tasks
 
         return BenchmarkMetrics(
             total_tasks=total_tasks,
             completed_tasks=completed_tasks,
-            failed_tasks=failed_tasks,
+            failed_tasks=self.failed_tasks,
             success_rate=success_rate,
             total_duration=total_duration,
             average_task_duration=average_duration,
@@ -252,49 +274,221 @@ class MetricsCollector:
             max_duration=max_duration,
             duration_std=duration_std,
             total_tokens=total_tokens,
-            total_input_tokens=total_input_tokens,
-            total_output_tokens=total_output_tokens,
+            total_input_tokens=self.total_input_tokens,
+            total_output_tokens=self.total_output_tokens,
             average_tokens_per_task=average_tokens_per_task,
             tokens_per_second=tokens_per_second,
             throughput=throughput,
             efficiency_score=efficiency_score,
-            timeout_count=timeout_tasks,
-            retry_count=sum(self.retry_counts.values()),
+            timeout_count=self.timeout_tasks,
+            retry_count=retry_total,
             error_rate=error_rate,
-            concurrent_peak=self.max_concurrent,
+            concurrent_peak=max_concurrent,
             resource_utilization=resource_utilization,
             percentiles=percentiles,
             error_types=dict(error_types),
         )
 
-    def calculate_comparison_metrics(self) -> ComparisonMetrics:
-        """Calculate comparison metrics between baseline and tools."""
-        baseline_metrics = self.calculate_metrics(TaskApproach.BASELINE)
-        tools_metrics = self.calculate_metrics(TaskApproach.TOOLS)
 
-        # Calculate improvement percentages
-        token_reduction = self._calculate_reduction_percent(baseline_metrics.total_tokens, tools_metrics.total_tokens)
-        time_reduction = self._calculate_reduction_percent(
-            baseline_metrics.total_duration, tools_metrics.total_duration
+class MetricsCollector:
+    """Comprehensive metrics collection and analysis."""
+
+    def __init__(self):
+        self.task_results: List[TaskResult] = []
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.concurrent_tasks: int = 0
+        self.max_concurrent: int = 0
+        self.retry_counts: Counter[str] = Counter()
+        self._metrics_cache: Dict[Tuple[Any, ...], BenchmarkMetrics] = {}
+        self._groups_cache: Optional[Tuple[Any, ...]] = None
+        # Duration digests, overall (None) and per approach, when pytdigest is installed.
+        # They are updated when polled, covering the first _digested results.
+        self._digests: Dict[Optional[TaskApproach], Any] = {}
+        self._digested = 0
+
+    async def start_collection(self) -> None:
+        """Start metrics collection.
+
+        Collection start and end use the monotonic clock so the collection
+        window is immune to wall-clock adjustments.
+        """
+        self.start_time = time.monotonic()
+        self.task_results.clear()
+        self.concurrent_tasks = 0
+        self.max_concurrent = 0
+        self.retry_counts.clear()
+        self._digests.clear()
+        self._digested = 0
+        self._invalidate_caches()
+
+    async def stop_collection(self) -> None:
+        """Stop metrics collection."""
+        self.end_time = time.monotonic()
+        self._invalidate_caches()
+
+    @contextmanager
+    def track_concurrent_task(self):
+        """Context manager to track concurrent task execution."""
+        self.concurrent_tasks += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent_tasks)
+        try:
+            yield
+        finally:
+            self.concurrent_tasks -= 1
+
+    def add_task_result(self, result: TaskResult) -> None:
+        """Add a task result to the collection.
+
+        No lock is needed: results are added from the event loop thread and
+        list.append is atomic under the GIL.
+        """
+        self.task_results.append(result)
+        self._invalidate_caches()
+
+    def record_retry(self, task_id: str) -> None:
+        """Record a retry attempt for a task (lock-free, see add_task_result)."""
+        self.retry_counts[task_id] += 1
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached metrics and groupings after the collection changes."""
+        self._metrics_cache.clear()
+        self._groups_cache = None
+
+    def calculate_metrics(self, filter_approach: Optional[TaskApproach] = None) -> BenchmarkMetrics:
+        """Calculate comprehensive metrics from collected results.
+
+        Results are cached until the collection changes. Metrics are only
+        cached once collection has stopped, since until then throughput is
+        measured against the current time.
+        """
+        key = (
+            id(self.task_results),
+            len(self.task_results),
+            filter_approach,
+            self.start_time,
+            self.end_time,
+            self.max_concurrent,
         )
-        efficiency_improvement = self._calculate_improvement_percent(
-            baseline_metrics.efficiency_score, tools_metrics.efficiency_score
+        metrics = self._metrics_cache.get(key)
+        if metrics is None:
+            metrics = self._metrics_from_results(
+                self.task_results,
+                self.start_time,
+                self.end_time if self.end_time is not None else time.monotonic(),
+                retry_total=self.retry_counts.total(),
+                max_concurrent=self.max_concurrent,
+                filter_approach=filter_approach,
+            )
+            if self.end_time is not None:
+                self._metrics_cache[key] = metrics
+        return metrics
+
+    @staticmethod
+    def _metrics_from_results(
+        results: List[TaskResult],
+        start_time: Optional[float],
+        end_time: Optional[float],
+        retry_total: int = 0,
+        max_concurrent: int = 0,
+        filter_approach: Optional[TaskApproach] = None,
+    ) -> BenchmarkMetrics:
+        """Calculate metrics for a list of results collected between start and end time."""
+        accumulator = _MetricsAccumulator()
+        for r in results:
+            if filter_approach and r.approach is not filter_approach:
+                continue
+            accumulator.add(r)
+        return accumulator.finalize(start_time, end_time, retry_total, max_concurrent)
+
+    def _calculate_two_approach_metrics(
+        self,
+    ) -> Tuple[BenchmarkMetrics, BenchmarkMetrics, Tuple[int, float, float], Tuple[int, float, float]]:
+        """Calculate baseline and tools metrics, plus their duration moments, in one pass."""
+        baseline = _MetricsAccumulator()
+        tools = _MetricsAccumulator()
+        for r in self.task_results:
+            approach = r.approach
+            if approach is TaskApproach.BASELINE:
+                baseline.add(r)
+            elif approach is TaskApproach.TOOLS:
+                tools.add(r)
+
+        retry_total = self.retry_counts.total()
+        end_time = self.end_time if self.end_time is not None else time.monotonic()
+        return (
+            baseline.finalize(self.start_time, end_time, retry_total, self.max_concurrent),
+            tools.finalize(self.start_time, end_time, retry_total, self.max_concurrent),
+            baseline.duration_moments(),
+            tools.duration_moments(),
         )
 
-        # Calculate statistical significance (simplified)
-        baseline_durations = [
-            r.duration for r in self.task_results if r.approach == TaskApproach.BASELINE and r.duration is not None
-        ]
-        tools_durations = [
-            r.duration for r in self.task_results if r.approach == TaskApproach.TOOLS and r.duration is not None
-        ]
+    def get_live_percentiles(self, filter_approach: Optional[TaskApproach] = None) -> Dict[str, float]:
+        """Get duration percentiles without sorting every collected duration.
+
+        With pytdigest installed, percentiles are approximated from t-digests
+        that each poll extends with the results added since the previous one,
+        so they are cheap to poll while a benchmark is running. Otherwise they
+        are calculated exactly.
+        """
+        if TDigest is None:
+            return self.calculate_metrics(filter_approach).percentiles
 
-        statistical_significance = self._calculate_statistical_significance(baseline_durations, tools_durations)
+        self._update_digests()
+        digest = self._digests.get(filter_approach)
+        if digest is None or digest.weight < 2:
+            return {}
+
+        values = digest.inverse_cdf([q / 100 for q in PERCENTILES])
+        return {f"p{q}": float(value) for q, value in zip(PERCENTILES, values)}
+
+    def _update_digests(self) -> None:
+        """Fold the durations of results added since the last update into the digests."""
+        new_durations: Dict[Optional[TaskApproach], List[float]] = {}
+        for result in self.task_results[self._digested :]:
+            if result.duration is not None:
+                new_durations.setdefault(None, []).append(result.duration)
+                new_durations.setdefault(result.approach, []).append(result.duration)
+        self._digested = len(self.task_results)
+
+        for key, durations in new_durations.items():
+            digest = self._digests.get(key)
+            if digest is None:
+                digest = self._digests[key] = TDigest()
+            # pytdigest depends on NumPy, so np is available here
+            digest.update(np.array(durations))
+
+    def calculate_comparison_metrics(self) -> ComparisonMetrics:
+        """Calculate comparison metrics between baseline and tools."""
+        baseline_metrics, tools_metrics, baseline_moments, tools_moments = self._calculate_two_approach_metrics()
+
+        # Calculate improvement percentages (reductions and improvements are positive when tools do better)
+        b, t = baseline_metrics, tools_metrics
+        token_reduction = (b.total_tokens - t.total_tokens) / b.total_tokens * 100.0 if b.total_tokens else 0.0
+        time_reduction = (b.total_duration - t.total_duration) / b.total_duration * 100.0 if b.total_duration else 0.0
+        efficiency_improvement = (
+            (t.efficiency_score - b.efficiency_score) / b.efficiency_score * 100.0 if b.efficiency_score else 0.0
+        )
 
-        # Calculate confidence intervals
-        confidence_interval = self._calculate_confidence_intervals(baseline_durations, tools_durations)
+        # Calculate statistical significance (simplified) and confidence intervals
+        # from the duration moments shared by both estimates
+        baseline_count, baseline_mean, baseline_std = baseline_moments
+        tools_count, tools_mean, tools_std = tools_moments
+        statistical_significance = 0.0
+        confidence_interval: Dict[str, float] = {}
+        if baseline_count >= 2 and tools_count >= 2:
+            statistical_significance = self._calculate_statistical_significance(
+                baseline_mean, baseline_std, tools_mean, tools_std
+            )
+            confidence_interval = self._calculate_confidence_intervals(
+                baseline_mean,
+                baseline_std / math.sqrt(baseline_count),
+                tools_mean,
+                tools_std / math.sqrt(tools_count),
+            )
 
-        sample_size = min(len(baseline_durations), len(tools_durations))
+        sample_size = min(baseline_count, tools_count)
 
         return ComparisonMetrics(
             token_reduction_percent=token_reduction,
@@ -309,48 +503,74 @@ class MetricsCollector:
 
     def get_metrics_by_task(self) -> Dict[str, BenchmarkMetrics]:
         """Get metrics broken down by task ID."""
-        metrics_by_task = {}
+        return self._calculate_group_metrics(self._group_results()[0])
 
-        # Group results by task_id
-        task_groups = defaultdict(list)
-        for result in self.task_results:
-            task_groups[result.task_id].append(result)
+    def get_metrics_by_model(self) -> Dict[str, BenchmarkMetrics]:
+        """Get metrics broken down by model instance."""
+        return self._calculate_group_metrics(self._group_results()[1])
 
-        # Calculate metrics for each task
-        for task_id, results in task_groups.items():
-            # Create a temporary collector for this task
-            temp_collector = MetricsCollector()
-            temp_collector.task_results = results
-            temp_collector.start_time = min(r.start_time for r in results)
-            temp_collector.end_time = max(r.end_time for r in results if r.end_time is not None)
+    def _group_results(self) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+        """Group collected results by task ID and by model instance in a single sweep.
 
-            metrics_by_task[task_id] = temp_collector.calculate_metrics()
+        Groupings are cached until the collection changes.
 
-        return metrics_by_task
+        Returns:
+            Tuple of ``(by_task, by_model)``, each mapping a key to
+            ``[results, earliest start, latest end]``
+        """
+        key = (id(self.task_results), len(self.task_results))
+        if self._groups_cache is not None and self._groups_cache[0] == key:
+            return self._groups_cache[1]
 
-    def get_metrics_by_model(self) -> Dict[str, BenchmarkMetrics]:
-        """Get metrics broken down by model instance."""
-        metrics_by_model = {}
-
-        # Group results by model_instance
-        model_groups = defaultdict(list)
+        by_task: Dict[str, List[Any]] = {}
+        by_model: Dict[str, List[Any]] = {}
         for result in self.task_results:
-            model_groups[result.model_instance].append(result)
-
-        # Calculate metrics for each model
-        for model_instance, results in model_groups.items():
-            # Create a temporary collector for this model
-            temp_collector = MetricsCollector()
-            temp_collector.task_results = results
-            temp_collector.start_time = min(r.start_time for r in results)
-            temp_collector.end_time = max(r.end_time for r in results if r.end_time is not None)
+            start, end = result.start_time, result.end_time
+            for grouping, group_key in ((by_task, result.task_id), (by_model, result.model_instance)):
+                group = grouping.get(group_key)
+                if group is None:
+                    grouping[group_key] = [[result], start, end]
+                    continue
+
+                group[0].append(result)
+                if start < group[1]:
+                    group[1] = start
+                if end is not None and (group[2] is None or end > group[2]):
+                    group[2] = end
+
+        groups = (by_task, by_model)
+        self._groups_cache = (key, groups)
+        return groups
+
+    def _calculate_group_metrics(self, groups: Dict[str, List[Any]]) -> Dict[str, BenchmarkMetrics]:
+        """Calculate metrics for each group of results over the group's own time span.
+
+        Result timestamps are wall-clock times, so groups with no finished
+        result are measured up to the current wall-clock time.
+        """
+        now = time.time()
+        return {
+            key: self._metrics_from_results(results, start, end if end is not None else now)
+            for key, (results, start, end) in groups.items()
+        }
 
-            metrics_by_model[model_instance] = temp_collector.calculate_metrics()
+    def export_metrics(self) -> Dict[str, Any]:
+        """Calculate all metrics and return them in serialized form.
 
-        return metrics_by_model
+        Returns:
+            Dictionary with ``overall_metrics``, ``comparison_metrics``,
+            ``metrics_by_task`` and ``metrics_by_model`` as plain dicts
+        """
+        return {
+            "overall_metrics": self.calculate_metrics().to_dict(),
+            "comparison_metrics": self.calculate_comparison_metrics().to_dict(),
+            "metrics_by_task": {task_id: m.to_dict() for task_id, m in self.get_metrics_by_task().items()},
+            "metrics_by_model": {model: m.to_dict() for model, m in self.get_metrics_by_model().items()},
+        }
 
+    @staticmethod
     def _calculate_efficiency_score(
-        self, success_rate: float, throughput: float, tokens_per_second: float, avg_duration: float
+        success_rate: float, throughput: float, tokens_per_second: float, avg_duration: float
     ) -> float:
         """Calculate composite efficiency score."""
         if avg_duration == 0:
@@ -380,86 +600,48 @@ class MetricsCollector:
 
         return efficiency_score
 
-    def _calculate_reduction_percent(self, baseline: float, tools: float) -> float:
-        """Calculate percentage reduction (positive = improvement)."""
-        if baseline == 0:
-            return 0.0
-        return ((baseline - tools) / baseline) * 100.0
-
-    def _calculate_improvement_percent(self, baseline: float, tools: float) -> float:
-        """Calculate percentage improvement (positive = better)."""
-        if baseline == 0:
-            return 0.0
-        return ((tools - baseline) / baseline) * 100.0
-
-    def _classify_error(self, error: str) -> str:
+    @staticmethod
+    def _classify_error(error: str) -> str:
         """Classify error type for statistics."""
-        error_lower = error.lower()
-
-        if "timeout" in error_lower:
-            return "timeout"
-        elif "connection" in error_lower:
-            return "connection"
-        elif "http" in error_lower:
-            return "http"
-        elif "json" in error_lower:
-            return "json"
-        elif "model" in error_lower:
-            return "model"
-        else:
-            return "unknown"
+        # Scan once; when several keywords occur the earliest in ERROR_TYPES wins
+        priority = min((match.lastindex for match in _ERROR_PATTERN.finditer(error)), default=0)
+        return ERROR_TYPES[priority - 1] if priority else "unknown"
 
-    def _calculate_statistical_significance(self, baseline_values: List[float], tools_values: List[float]) -> float:
-        """Calculate statistical significance (simplified t-test approximation)."""
-        if len(baseline_values) < 2 or len(tools_values) < 2:
-            return 0.0
+    def _calculate_statistical_significance(
+        self, baseline_mean: float, baseline_std: float, tools_mean: float, tools_std: float
+    ) -> float:
+        """Calculate statistical significance (simplified t-test approximation).
 
-        try:
-            baseline_mean = statistics.mean(baseline_values)
-            tools_mean = statistics.mean(tools_values)
-            baseline_std = statistics.stdev(baseline_values)
-            tools_std = statistics.stdev(tools_values)
-
-            # Simplified t-test approximation
-            pooled_std = ((baseline_std**2) + (tools_std**2)) ** 0.5
-            if pooled_std == 0:
-                return 0.0
-
-            t_stat = abs(baseline_mean - tools_mean) / pooled_std
-
-            # Convert to approximate p-value (very simplified)
-            # This is not a proper statistical test but gives an indication
-            return max(0.0, 1.0 - (t_stat / 5.0))
-        except:
+        The caller ensures both samples hold at least two values.
+        """
+        # Simplified t-test approximation
+        pooled_std = math.sqrt(baseline_std**2 + tools_std**2)
+        if pooled_std == 0:
             return 0.0
 
+        t_stat = abs(baseline_mean - tools_mean) / pooled_std
+
+        # Convert to approximate p-value (very simplified)
+        # This is not a proper statistical test but gives an indication
+        return max(0.0, 1.0 - (t_stat / 5.0))
+
     def _calculate_confidence_intervals(
-        self, baseline_values: List[float], tools_values: List[float]
+        self, baseline_mean: float, baseline_sem: float, tools_mean: float, tools_sem: float
     ) -> Dict[str, float]:
-        """Calculate confidence intervals for the difference."""
-        if len(baseline_values) < 2 or len(tools_values) < 2:
-            return {}
+        """Calculate confidence intervals for the difference from each approach's mean and standard error.
 
-        try:
-            baseline_mean = statistics.mean(baseline_values)
-            tools_mean = statistics.mean(tools_values)
-            baseline_std = statistics.stdev(baseline_values)
-            tools_std = statistics.stdev(tools_values)
-
-            # 95% confidence interval approximation
-            margin_of_error = (
-                1.96 * ((baseline_std**2 / len(baseline_values)) + (tools_std**2 / len(tools_values))) ** 0.5
-            )
+        The caller ensures both samples hold at least two values.
+        """
+        # 95% confidence interval approximation
+        margin_of_error = 1.96 * math.sqrt(baseline_sem**2 + tools_sem**2)
 
-            difference = baseline_mean - tools_mean
+        difference = baseline_mean - tools_mean
 
-            return {
-                "lower_bound": difference - margin_of_error,
-                "upper_bound": difference + margin_of_error,
-                "difference": difference,
-            }
-        except:
-            return {}
+        return {
+            "lower_bound": difference - margin_of_error,
+            "upper_bound": difference + margin_of_error,
+            "difference": difference,
+        }
 
     def reset(self) -> None:
         """Reset the metrics collector."""
@@ -469,16 +651,24 @@ class MetricsCollector:
         self.concurrent_tasks = 0
         self.max_concurrent = 0
         self.retry_counts.clear()
+        self._digests.clear()
+        self._digested = 0
+        self._invalidate_caches()
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of current metrics state."""
-        return {
+        """Get a summary of current metrics state.
+
+        Duration percentiles are only included when pytdigest is installed;
+        without it they would need a full calculate_metrics pass.
+        """
+        summary = {
             "total_results": len(self.task_results),
             "collection_active": self.start_time is not None and self.end_time is None,
             "concurrent_tasks": self.concurrent_tasks,
             "max_concurrent": self.max_concurrent,
-            "total_retries": sum(self.retry_counts.values()),
-            "collection_duration": (self.end_time or time.time()) - (self.start_time or time.time())
-            if self.start_time
-            else 0,
+            "total_retries": self.retry_counts.total(),
+            "collection_duration": (self.end_time or time.monotonic()) - self.start_time if self.start_time else 0,
         }
+        if TDigest is not None:
+            summary["duration_percentiles"] = self.get_live_percentiles()
+        return summary
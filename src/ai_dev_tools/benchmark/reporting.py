@@ -4,22 +4,404 @@ Reporting and visualization for AI Development Tools benchmarking.
 Provides flexible report generation, data visualization, and export capabilities.
 """
 
+import codecs
+import csv
+import io
 import json
-import statistics
+import math
 import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+
+    # Indent like json.dumps(indent=2); datetimes and dataclasses still go through default=str
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    orjson = None
 
 from .config import OutputFormat
 
+# Batch statistics and the comparison metric each one aggregates
+_BATCH_STAT_METRICS = (
+    ("token_reduction", "token_reduction_percent"),
+    ("time_reduction", "time_reduction_percent"),
+    ("efficiency_improvement", "efficiency_improvement_percent"),
+)
+
+# CSV report columns, taken from each task result
+_CSV_FIELDNAMES = (
+    "task_id",
+    "approach",
+    "model_instance",
+    "status",
+    "duration",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "sample_num",
+    "start_time",
+    "end_time",
+    "error",
+)
+
+# Batch summary table header and row templates
+_SUMMARY_TABLE_HEADER = (
+    "| Configuration | Profile | Status | Token Reduction | Time Reduction | Efficiency |",
+    "|---------------|---------|--------|-----------------|----------------|------------|",
+)
+_SUMMARY_TABLE_ROW = "| {} | {} | Success | {:.1f}% | {:.1f}% | {:.1f}% |".format
+_SUMMARY_TABLE_FAILED_ROW = "| {} | {} | Failed | N/A | N/A | N/A |".format
+
+# ASCII dashboard and chart box lines
+_DASH_TOP = "┌─────────────────────────────────────────────────────────────┐"
+_DASH_SEP = "├─────────────────────────────────────────────────────────────┤"
+_DASH_BOT = "└─────────────────────────────────────────────────────────────┘"
+_DASH_TITLE = "│                 Performance Dashboard                       │"
+_DASH_IMPROVEMENTS = "│                   Improvements                              │"
+_CHART_TITLE = "│                 Baseline vs Tools                           │"
+# Progress bars by fill character, indexed by the number of filled cells
+_BAR_LENGTH = 20
+_BARS = {
+    char: tuple(f"[{char * filled}{'░' * (_BAR_LENGTH - filled)}]" for filled in range(_BAR_LENGTH + 1))
+    for char in "█▓"
+}
+# Charted metrics: label, metric key, unit, display scale and whether lower is better
+_CHART_COMPARED_METRICS = (
+    ("Duration", "average_task_duration", "s", 1, True),
+    ("Tokens", "total_tokens", "", 1, True),
+    ("Success Rate", "success_rate", "%", 100, False),
+    ("Throughput", "throughput", "tasks/s", 1, False),
+)
+
+# Options for report files: a large buffer so big reports reach the disk in few
+# write calls, and no newline translation since writers emit "\n" themselves
+_WRITE_OPTIONS = {"encoding": "utf-8", "buffering": 1 << 20, "newline": ""}
+
+# Defaults for benchmark info and metric fields missing from report data
+_INFO_DEFAULTS = {"total_tasks": 0, "sample_size": 0, "execution_mode": "unknown"}
+_METRIC_DEFAULTS = dict.fromkeys(
+    (
+        "success_rate",
+        "total_tasks",
+        "completed_tasks",
+        "failed_tasks",
+        "average_task_duration",
+        "total_tokens",
+        "throughput",
+        "efficiency_score",
+        "token_reduction_percent",
+        "time_reduction_percent",
+        "efficiency_improvement_percent",
+        "sample_size",
+    ),
+    0,
+)
+
+# Section templates, each formatted with a single format_map call
+_MARKDOWN_HEADER = """# AI Development Tools Benchmark Report
+
+**Profile:** {profile}
+**Generated:** {generated}
+**Tasks:** {total_tasks}
+**Sample Size:** {sample_size}
+**Execution Mode:** {execution_mode}
+"""
+_MARKDOWN_OVERALL = """## Overall Performance
+
+- **Success Rate:** {success_rate:.1%}
+- **Total Tasks:** {total_tasks}
+- **Completed Tasks:** {completed_tasks}
+- **Failed Tasks:** {failed_tasks}
+- **Average Duration:** {average_task_duration:.2f}s
+- **Total Tokens:** {total_tokens:,}
+- **Throughput:** {throughput:.2f} tasks/sec
+- **Efficiency Score:** {efficiency_score:.2f}
+"""
+_MARKDOWN_COMPARISON = """## Baseline vs Tools Comparison
+
+- **Token Reduction:** {token_reduction_percent:.1f}%
+- **Time Reduction:** {time_reduction_percent:.1f}%
+- **Efficiency Improvement:** {efficiency_improvement_percent:.1f}%
+- **Sample Size:** {sample_size}
+"""
+_MARKDOWN_COMPARISON_ROW = "| {0} | {1:.2f}{3} | {2:.2f}{3} | {4:+.1f}% |".format
+# Label, metric key, unit, display scale and whether lower is better
+_MARKDOWN_COMPARED_METRICS = (
+    ("Average Duration", "average_task_duration", "s", 1, True),
+    ("Total Tokens", "total_tokens", "", 1, False),
+    ("Success Rate", "success_rate", "%", 100, False),
+    ("Throughput", "throughput", "tasks/s", 1, False),
+    ("Efficiency Score", "efficiency_score", "", 1, False),
+)
+_MARKDOWN_GROUP = """### {name}
+
+- **Success Rate:** {success_rate:.1%}
+- **Average Duration:** {average_task_duration:.2f}s
+- **Total Tokens:** {total_tokens:,}
+- **Efficiency Score:** {efficiency_score:.2f}
+"""
+# Batch report run sections: failed, successful with and without comparison metrics
+_MARKDOWN_BATCH_RUN_FAILED = "### Run {0}: {1}\n\n**Status:** Failed\n**Error:** {2}\n".format
+_MARKDOWN_BATCH_RUN = (
+    "### Run {0}: {1}\n\n**Status:** Success\n"
+    "**Token Reduction:** {2:.1f}%\n**Time Reduction:** {3:.1f}%\n**Efficiency Improvement:** {4:.1f}%\n"
+).format
+_MARKDOWN_BATCH_RUN_BARE = "### Run {0}: {1}\n\n**Status:** Success\n".format
+
+_CONSOLE_HEADER = f"""🚀 AI Development Tools Benchmark Report
+{"=" * 60}
+Profile: {{profile}}
+Tasks: {{total_tasks}}
+Sample Size: {{sample_size}}
+"""
+_CONSOLE_OVERALL = f"""📊 Overall Performance:
+{"-" * 30}
+Success Rate: {{success_rate:.1%}}
+Total Tasks: {{total_tasks}}
+Average Duration: {{average_task_duration:.2f}}s
+Total Tokens: {{total_tokens:,}}
+Throughput: {{throughput:.2f}} tasks/sec
+Efficiency Score: {{efficiency_score:.2f}}
+"""
+_CONSOLE_COMPARISON = f"""🎯 Baseline vs Tools:
+{"-" * 20}
+Token Reduction: {{token_reduction_percent:.1f}}%
+Time Reduction: {{time_reduction_percent:.1f}}%
+Efficiency Improvement: {{efficiency_improvement_percent:.1f}}%
+"""
+_CONSOLE_GROUP = """{name}:
+  Success: {success_rate:.1%}
+  Duration: {average_task_duration:.2f}s
+  Tokens: {total_tokens:,}"""
+
+
+def _report_timestamps() -> Tuple[datetime, str, str]:
+    """Return the current time with its report display and filename forms."""
+    now = datetime.now()
+    return now, now.strftime("%Y-%m-%d %H:%M:%S"), now.strftime("%Y%m%d_%H%M%S")
+
+
+def _orjson_encode(data: Any) -> Optional[bytes]:
+    """Encode report data with orjson, or return None to use the json module instead."""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which the json module still handles
+        return None
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize report data as indented JSON."""
+    encoded = _orjson_encode(data)
+    if encoded is None:
+        return json.dumps(data, indent=2, default=str)
+    return encoded.decode()
+
+
+def _json_dump(data: Any, fp: TextIO) -> None:
+    """Write report data as indented JSON to a text stream.
+
+    orjson's bytes go straight to the binary buffer of a UTF-8 file, without
+    being decoded into a second full-size string first. Without orjson the
+    json module streams the document in chunks.
+    """
+    encoded = _orjson_encode(data)
+    if encoded is None:
+        json.dump(data, fp, indent=2, default=str)
+    elif isinstance(fp, io.TextIOWrapper) and codecs.lookup(fp.encoding).name == "utf-8":
+        fp.flush()
+        fp.buffer.write(encoded)
+    else:
+        fp.write(encoded.decode())
+
+
+def _column_stats(column: Sequence[float]) -> Tuple[float, float, float, float, float]:
+    """Return mean, median, sample std, min and max of a column.
+
+    Mean, variance (Welford) and extrema come from a single pass; the median
+    needs one sort.
+    """
+    n = len(column)
+    mean = m2 = 0.0
+    low = high = column[0]
+    for i, value in enumerate(column, 1):
+        delta = value - mean
+        mean += delta / i
+        m2 += delta * (value - mean)
+        if value < low:
+            low = value
+        elif value > high:
+            high = value
+
+    ordered = sorted(column)
+    middle = n // 2
+    median = ordered[middle] if n % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    return mean, median, std, low, high
+
+
+def _summarize_columns(rows: List[Tuple[float, ...]]) -> Dict[str, Dict[str, float]]:
+    """Summarize each column of batch comparison rows (one column per _BATCH_STAT_METRICS entry)."""
+    if np is not None:
+        values = np.asarray(rows, dtype=np.float64)
+        columns = zip(
+            values.mean(axis=0),
+            np.median(values, axis=0),
+            values.std(axis=0, ddof=1) if len(rows) > 1 else np.zeros(values.shape[1]),
+            values.min(axis=0),
+            values.max(axis=0),
+        )
+    else:
+        columns = (_column_stats(column) for column in zip(*rows))
+
+    return {
+        name: {"mean": float(mean), "median": float(median), "std": float(std), "min": float(low), "max": float(high)}
+        for (name, _), (mean, median, std, low, high) in zip(_BATCH_STAT_METRICS, columns)
+    }
+
+
+class _LineWriter:
+    """Write lines to a text stream with the same separators as ``"\\n".join(lines)``."""
+
+    __slots__ = ("_fp", "_separator")
+
+    def __init__(self, fp: TextIO):
+        self._fp = fp
+        self._separator = ""
+
+    def append(self, line: str) -> None:
+        self._fp.write(self._separator + line)
+        self._separator = "\n"
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+
+class _BatchAggregator:
+    """Accumulate batch statistics one configuration result at a time.
+
+    Only the comparison percentages of successful configurations are kept,
+    so results can be aggregated as they stream past.
+    """
+
+    __slots__ = ("total", "successful", "rows")
+
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.rows: List[Tuple[float, ...]] = []
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.total += 1
+        if not result.get("overall_metrics"):
+            return
+        self.successful += 1
+        comparison = result.get("comparison_metrics")
+        if comparison:
+            self.rows.append(tuple(comparison.get(key, 0) for _, key in _BATCH_STAT_METRICS))
+
+    def to_dict(self, batch_results: Any, timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """Build the batch report data around ``batch_results``."""
+        if not self.successful:
+            return {"batch_results": batch_results, "aggregated_stats": {}}
+
+        aggregated_stats = {}
+        if self.rows:
+            aggregated_stats = {
+                **_summarize_columns(self.rows),
+                "total_configurations": self.total,
+                "successful_configurations": self.successful,
+                "success_rate": self.successful / self.total,
+            }
+
+        return {
+            "batch_results": batch_results,
+            "aggregated_stats": aggregated_stats,
+            "summary": {
+                "total_runs": self.total,
+                "successful_runs": self.successful,
+                "timestamp": timestamp if timestamp is not None else time.time(),
+            },
+        }
+
+
+class BatchReportWriter:
+    """Write a JSON batch report incrementally, one configuration result at a time.
+
+    The finished file matches a JSON report from ``generate_batch_report``, but
+    each result reaches the disk as soon as it is added and only its comparison
+    percentages are kept for the final statistics.
+    """
+
+    def __init__(self, fp: TextIO, path: Optional[Path] = None):
+        self.path = path
+        self._fp = fp
+        self._aggregator = _BatchAggregator()
+        self._closed = False
+        fp.write('{\n  "batch_results": [')
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """Append one configuration result to the report."""
+        separator = ",\n    " if self._aggregator.total else "\n    "
+        self._fp.write(separator + _json_dumps(result).replace("\n", "\n    "))
+        self._aggregator.add(result)
+
+    def close(self) -> None:
+        """Write the aggregated statistics and summary, completing the document."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._fp.write("\n  ]" if self._aggregator.total else "]")
+        data = self._aggregator.to_dict(None)
+        del data["batch_results"]
+        for key, value in data.items():
+            self._fp.write(f",\n  {_json_dumps(key)}: " + _json_dumps(value).replace("\n", "\n  "))
+        self._fp.write("\n}")
+
 
 class ReportGenerator:
     """Generates comprehensive benchmark reports in multiple formats."""
 
+    # Output directories already created by any generator in this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+
     def __init__(self, output_dir: Union[str, Path] = "benchmark_results"):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_output_dir()
 
     def generate_report(
         self,
@@ -35,80 +417,108 @@ class ReportGenerator:
             except ValueError:
                 raise ValueError(f"Unsupported format: {format_type}")
 
+        # One timestamp shared by the filename and the report body
+        _, generated, stamp = _report_timestamps()
+
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             profile = benchmark_data.get("benchmark_info", {}).get("profile", "unknown")
-            filename = f"benchmark_{profile}_{timestamp}"
+            filename = f"benchmark_{profile}_{stamp}"
 
         filepath = self.output_dir / f"{filename}.{format_type.value}"
 
         if format_type == OutputFormat.JSON:
-            content = self._generate_json_report(benchmark_data)
+            write = self._write_json_report
         elif format_type == OutputFormat.MARKDOWN:
-            content = self._generate_markdown_report(benchmark_data)
+            write = partial(self._write_markdown_report, generated=generated)
         elif format_type == OutputFormat.CSV:
-            content = self._generate_csv_report(benchmark_data)
+            write = self._write_csv_report
         elif format_type == OutputFormat.CONSOLE:
-            content = self._generate_console_report(benchmark_data)
+            write = self._write_console_report
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
-        # Write to file (except for console format)
+        # Stream to file (except for console format, which is returned)
         if format_type != OutputFormat.CONSOLE:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._write_file(filepath, write, benchmark_data)
             return str(filepath)
         else:
-            return content
+            return self._render(write, benchmark_data)
+
+    def _ensure_output_dir(self, force: bool = False) -> None:
+        """Create the output directory unless a generator already did."""
+        directory = self.output_dir.absolute()
+        if force or directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
+    def _open_file(self, filepath: Path) -> TextIO:
+        """Open a report file for writing."""
+        try:
+            return open(filepath, "w", **_WRITE_OPTIONS)
+        except FileNotFoundError:
+            # The output directory was removed after it was first created
+            self._ensure_output_dir(force=True)
+            return open(filepath, "w", **_WRITE_OPTIONS)
+
+    def _write_file(
+        self, filepath: Path, write: Callable[[Dict[str, Any], TextIO], None], data: Dict[str, Any]
+    ) -> None:
+        """Stream a report straight into a file instead of building it in memory first."""
+        with self._open_file(filepath) as f:
+            write(data, f)
+
+    def _render(self, write: Callable[[Dict[str, Any], TextIO], None], data: Dict[str, Any]) -> str:
+        """Render a report into a string."""
+        output = io.StringIO()
+        write(data, output)
+        return output.getvalue()
 
     def _generate_json_report(self, data: Dict[str, Any]) -> str:
         """Generate JSON format report."""
-        return json.dumps(data, indent=2, default=str)
+        return _json_dumps(data)
+
+    def _write_json_report(self, data: Dict[str, Any], fp: TextIO) -> None:
+        """Render JSON format report, writing it to a text stream."""
+        _json_dump(data, fp)
 
     def _generate_markdown_report(self, data: Dict[str, Any]) -> str:
         """Generate Markdown format report."""
-        lines = []
+        return self._render(self._write_markdown_report, data)
 
-        # Title and metadata
+    def _write_markdown_report(self, data: Dict[str, Any], fp: TextIO, generated: Optional[str] = None) -> None:
+        """Render Markdown format report, writing it to a text stream.
+
+        Args:
+            data: Benchmark data to report on
+            fp: Text stream to write to
+            generated: Report generation time to show, defaults to now
+        """
         benchmark_info = data.get("benchmark_info", {})
-        profile = benchmark_info.get("profile", "unknown")
+        overall_metrics = data.get("overall_metrics", {})
+        comparison_metrics = data.get("comparison_metrics", {})
+        metrics_by_task = data.get("metrics_by_task", {})
+        metrics_by_model = data.get("metrics_by_model", {})
 
-        lines.append("# AI Development Tools Benchmark Report")
-        lines.append("")
-        lines.append(f"**Profile:** {profile.upper()}")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Tasks:** {benchmark_info.get('total_tasks', 0)}")
-        lines.append(f"**Sample Size:** {benchmark_info.get('sample_size', 0)}")
-        lines.append(f"**Execution Mode:** {benchmark_info.get('execution_mode', 'unknown')}")
-        lines.append("")
+        # Title and metadata
+        lines = _LineWriter(fp)
+        lines.append(
+            _MARKDOWN_HEADER.format_map(
+                {
+                    **_INFO_DEFAULTS,
+                    **benchmark_info,
+                    "profile": benchmark_info.get("profile", "unknown").upper(),
+                    "generated": generated or _report_timestamps()[1],
+                }
+            )
+        )
 
         # Overall metrics
-        overall_metrics = data.get("overall_metrics", {})
         if overall_metrics:
-            lines.append("## Overall Performance")
-            lines.append("")
-            lines.append(f"- **Success Rate:** {overall_metrics.get('success_rate', 0):.1%}")
-            lines.append(f"- **Total Tasks:** {overall_metrics.get('total_tasks', 0)}")
-            lines.append(f"- **Completed Tasks:** {overall_metrics.get('completed_tasks', 0)}")
-            lines.append(f"- **Failed Tasks:** {overall_metrics.get('failed_tasks', 0)}")
-            lines.append(f"- **Average Duration:** {overall_metrics.get('average_task_duration', 0):.2f}s")
-            lines.append(f"- **Total Tokens:** {overall_metrics.get('total_tokens', 0):,}")
-            lines.append(f"- **Throughput:** {overall_metrics.get('throughput', 0):.2f} tasks/sec")
-            lines.append(f"- **Efficiency Score:** {overall_metrics.get('efficiency_score', 0):.2f}")
-            lines.append("")
+            lines.append(_MARKDOWN_OVERALL.format_map({**_METRIC_DEFAULTS, **overall_metrics}))
 
         # Comparison metrics
-        comparison_metrics = data.get("comparison_metrics", {})
         if comparison_metrics:
-            lines.append("## Baseline vs Tools Comparison")
-            lines.append("")
-            lines.append(f"- **Token Reduction:** {comparison_metrics.get('token_reduction_percent', 0):.1f}%")
-            lines.append(f"- **Time Reduction:** {comparison_metrics.get('time_reduction_percent', 0):.1f}%")
-            lines.append(
-                f"- **Efficiency Improvement:** {comparison_metrics.get('efficiency_improvement_percent', 0):.1f}%"
-            )
-            lines.append(f"- **Sample Size:** {comparison_metrics.get('sample_size', 0)}")
-            lines.append("")
+            lines.append(_MARKDOWN_COMPARISON.format_map({**_METRIC_DEFAULTS, **comparison_metrics}))
 
             # Detailed comparison
             baseline_metrics = comparison_metrics.get("baseline_metrics", {})
@@ -119,190 +529,105 @@ class ReportGenerator:
             lines.append("| Metric | Baseline | Tools | Improvement |")
             lines.append("|--------|----------|-------|-------------|")
 
-            metrics_to_compare = [
-                ("Average Duration", "average_task_duration", "s"),
-                ("Total Tokens", "total_tokens", ""),
-                ("Success Rate", "success_rate", "%"),
-                ("Throughput", "throughput", "tasks/s"),
-                ("Efficiency Score", "efficiency_score", ""),
-            ]
-
-            for metric_name, key, unit in metrics_to_compare:
-                baseline_val = baseline_metrics.get(key, 0)
-                tools_val = tools_metrics.get(key, 0)
-
-                if key == "success_rate":
-                    baseline_val *= 100
-                    tools_val *= 100
+            for metric_name, key, unit, scale, lower_is_better in _MARKDOWN_COMPARED_METRICS:
+                baseline_val = baseline_metrics.get(key, 0) * scale
+                tools_val = tools_metrics.get(key, 0) * scale
 
                 if baseline_val > 0:
-                    if key in ["average_task_duration"]:
-                        # Lower is better
+                    if lower_is_better:
                         improvement = ((baseline_val - tools_val) / baseline_val) * 100
                     else:
-                        # Higher is better
                         improvement = ((tools_val - baseline_val) / baseline_val) * 100
                 else:
                     improvement = 0
 
-                lines.append(
-                    f"| {metric_name} | {baseline_val:.2f}{unit} | {tools_val:.2f}{unit} | {improvement:+.1f}% |"
-                )
+                lines.append(_MARKDOWN_COMPARISON_ROW(metric_name, baseline_val, tools_val, unit, improvement))
 
             lines.append("")
 
         # Task breakdown
-        metrics_by_task = data.get("metrics_by_task", {})
         if metrics_by_task:
             lines.append("## Performance by Task")
             lines.append("")
-
             for task_id, task_metrics in metrics_by_task.items():
-                lines.append(f"### {task_id}")
-                lines.append("")
-                lines.append(f"- **Success Rate:** {task_metrics.get('success_rate', 0):.1%}")
-                lines.append(f"- **Average Duration:** {task_metrics.get('average_task_duration', 0):.2f}s")
-                lines.append(f"- **Total Tokens:** {task_metrics.get('total_tokens', 0):,}")
-                lines.append(f"- **Efficiency Score:** {task_metrics.get('efficiency_score', 0):.2f}")
-                lines.append("")
+                lines.append(_MARKDOWN_GROUP.format_map({**_METRIC_DEFAULTS, **task_metrics, "name": task_id}))
 
         # Model breakdown
-        metrics_by_model = data.get("metrics_by_model", {})
         if metrics_by_model:
             lines.append("## Performance by Model")
             lines.append("")
-
             for model_name, model_metrics in metrics_by_model.items():
-                lines.append(f"### {model_name}")
-                lines.append("")
-                lines.append(f"- **Success Rate:** {model_metrics.get('success_rate', 0):.1%}")
-                lines.append(f"- **Average Duration:** {model_metrics.get('average_task_duration', 0):.2f}s")
-                lines.append(f"- **Total Tokens:** {model_metrics.get('total_tokens', 0):,}")
-                lines.append(f"- **Efficiency Score:** {model_metrics.get('efficiency_score', 0):.2f}")
-                lines.append("")
+                lines.append(_MARKDOWN_GROUP.format_map({**_METRIC_DEFAULTS, **model_metrics, "name": model_name}))
 
         # Error analysis
-        overall_metrics = data.get("overall_metrics", {})
         error_types = overall_metrics.get("error_types", {})
         if error_types:
             lines.append("## Error Analysis")
             lines.append("")
-
-            for error_type, count in error_types.items():
-                lines.append(f"- **{error_type}:** {count}")
-
+            lines.extend(f"- **{error_type}:** {count}" for error_type, count in error_types.items())
             lines.append("")
 
-        return "\n".join(lines)
-
     def _generate_csv_report(self, data: Dict[str, Any]) -> str:
         """Generate CSV format report."""
-        output = []
+        return self._render(self._write_csv_report, data)
 
+    def _write_csv_report(self, data: Dict[str, Any], fp: TextIO) -> None:
+        """Render CSV format report, writing it to a text stream."""
         # Get results
         results = data.get("results", [])
         if not results:
-            return "No results found"
-
-        # CSV header
-        fieldnames = [
-            "task_id",
-            "approach",
-            "model_instance",
-            "status",
-            "duration",
-            "input_tokens",
-            "output_tokens",
-            "total_tokens",
-            "sample_num",
-            "start_time",
-            "end_time",
-            "error",
-        ]
-
-        # Write header
-        output.append(",".join(fieldnames))
-
-        # Write data rows
-        for result in results:
-            row = []
-            for field in fieldnames:
-                value = result.get(field, "")
-                if value is None:
-                    value = ""
-                row.append(str(value))
-            output.append(",".join(row))
-
-        return "\n".join(output)
+            fp.write("No results found")
+            return
+
+        # Let the C csv writer handle conversion and quoting of embedded commas/quotes
+        writer = csv.DictWriter(fp, fieldnames=_CSV_FIELDNAMES, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(results)
 
     def _generate_console_report(self, data: Dict[str, Any]) -> str:
         """Generate console-friendly report."""
-        lines = []
+        return self._render(self._write_console_report, data)
 
-        # Title
+    def _write_console_report(self, data: Dict[str, Any], fp: TextIO) -> None:
+        """Render console-friendly report, writing it to a text stream."""
         benchmark_info = data.get("benchmark_info", {})
-        profile = benchmark_info.get("profile", "unknown")
+        overall_metrics = data.get("overall_metrics", {})
+        comparison_metrics = data.get("comparison_metrics", {})
+        metrics_by_task = data.get("metrics_by_task", {})
+        metrics_by_model = data.get("metrics_by_model", {})
 
-        lines.append("🚀 AI Development Tools Benchmark Report")
-        lines.append("=" * 60)
-        lines.append(f"Profile: {profile.upper()}")
-        lines.append(f"Tasks: {benchmark_info.get('total_tasks', 0)}")
-        lines.append(f"Sample Size: {benchmark_info.get('sample_size', 0)}")
-        lines.append("")
+        # Title
+        lines = _LineWriter(fp)
+        lines.append(
+            _CONSOLE_HEADER.format_map(
+                {**_INFO_DEFAULTS, **benchmark_info, "profile": benchmark_info.get("profile", "unknown").upper()}
+            )
+        )
 
         # Overall metrics
-        overall_metrics = data.get("overall_metrics", {})
         if overall_metrics:
-            lines.append("📊 Overall Performance:")
-            lines.append("-" * 30)
-            lines.append(f"Success Rate: {overall_metrics.get('success_rate', 0):.1%}")
-            lines.append(f"Total Tasks: {overall_metrics.get('total_tasks', 0)}")
-            lines.append(f"Average Duration: {overall_metrics.get('average_task_duration', 0):.2f}s")
-            lines.append(f"Total Tokens: {overall_metrics.get('total_tokens', 0):,}")
-            lines.append(f"Throughput: {overall_metrics.get('throughput', 0):.2f} tasks/sec")
-            lines.append(f"Efficiency Score: {overall_metrics.get('efficiency_score', 0):.2f}")
-            lines.append("")
+            lines.append(_CONSOLE_OVERALL.format_map({**_METRIC_DEFAULTS, **overall_metrics}))
 
         # Comparison metrics
-        comparison_metrics = data.get("comparison_metrics", {})
         if comparison_metrics:
-            lines.append("🎯 Baseline vs Tools:")
-            lines.append("-" * 20)
-            lines.append(f"Token Reduction: {comparison_metrics.get('token_reduction_percent', 0):.1f}%")
-            lines.append(f"Time Reduction: {comparison_metrics.get('time_reduction_percent', 0):.1f}%")
-            lines.append(f"Efficiency Improvement: {comparison_metrics.get('efficiency_improvement_percent', 0):.1f}%")
-            lines.append("")
+            lines.append(_CONSOLE_COMPARISON.format_map({**_METRIC_DEFAULTS, **comparison_metrics}))
 
         # Task performance
-        metrics_by_task = data.get("metrics_by_task", {})
         if metrics_by_task:
             lines.append("📋 Task Performance:")
             lines.append("-" * 20)
-
             for task_id, task_metrics in metrics_by_task.items():
-                lines.append(f"{task_id}:")
-                lines.append(f"  Success: {task_metrics.get('success_rate', 0):.1%}")
-                lines.append(f"  Duration: {task_metrics.get('average_task_duration', 0):.2f}s")
-                lines.append(f"  Tokens: {task_metrics.get('total_tokens', 0):,}")
-
+                lines.append(_CONSOLE_GROUP.format_map({**_METRIC_DEFAULTS, **task_metrics, "name": task_id}))
             lines.append("")
 
         # Model performance
-        metrics_by_model = data.get("metrics_by_model", {})
         if metrics_by_model:
             lines.append("🤖 Model Performance:")
             lines.append("-" * 20)
-
             for model_name, model_metrics in metrics_by_model.items():
-                lines.append(f"{model_name}:")
-                lines.append(f"  Success: {model_metrics.get('success_rate', 0):.1%}")
-                lines.append(f"  Duration: {model_metrics.get('average_task_duration', 0):.2f}s")
-                lines.append(f"  Tokens: {model_metrics.get('total_tokens', 0):,}")
-
+                lines.append(_CONSOLE_GROUP.format_map({**_METRIC_DEFAULTS, **model_metrics, "name": model_name}))
             lines.append("")
 
-        return "\n".join(lines)
-
     def generate_batch_report(
         self,
         batch_results: List[Dict[str, Any]],
@@ -310,97 +635,83 @@ class ReportGenerator:
         filename: Optional[str] = None,
     ) -> str:
         """Generate a report for batch benchmark results."""
+        # One timestamp shared by the filename, the summary and the report body
+        now, generated, stamp = _report_timestamps()
+
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"batch_report_{timestamp}"
+            filename = f"batch_report_{stamp}"
 
         filepath = self.output_dir / f"{filename}.{format_type.value}"
 
         # Aggregate batch data
-        batch_data = self._aggregate_batch_data(batch_results)
+        batch_data = self._aggregate_batch_data(batch_results, timestamp=now.timestamp())
 
         if format_type == OutputFormat.JSON:
-            content = self._generate_json_report(batch_data)
+            write = self._write_json_report
         elif format_type == OutputFormat.MARKDOWN:
-            content = self._generate_batch_markdown_report(batch_data)
+            write = partial(self._write_batch_markdown_report, generated=generated)
         elif format_type == OutputFormat.CONSOLE:
-            content = self._generate_batch_console_report(batch_data)
+            write = self._write_batch_console_report
         else:
             raise ValueError(f"Unsupported format for batch report: {format_type}")
 
-        # Write to file (except for console format)
+        # Stream to file (except for console format, which is returned)
         if format_type != OutputFormat.CONSOLE:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._write_file(filepath, write, batch_data)
             return str(filepath)
         else:
-            return content
-
-    def _aggregate_batch_data(self, batch_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Aggregate data from multiple batch results."""
-        successful_results = [r for r in batch_results if r.get("overall_metrics")]
-
-        if not successful_results:
-            return {"batch_results": batch_results, "aggregated_stats": {}}
+            return self._render(write, batch_data)
 
-        # Aggregate overall metrics
-        all_token_reductions = []
-        all_time_reductions = []
-        all_efficiency_improvements = []
+    @contextmanager
+    def stream_batch_report(self, filename: Optional[str] = None) -> Iterator[BatchReportWriter]:
+        """Open a JSON batch report that results are written to as they arrive.
 
-        for result in successful_results:
-            comparison = result.get("comparison_metrics", {})
-            if comparison:
-                all_token_reductions.append(comparison.get("token_reduction_percent", 0))
-                all_time_reductions.append(comparison.get("time_reduction_percent", 0))
-                all_efficiency_improvements.append(comparison.get("efficiency_improvement_percent", 0))
+        The report is completed when the context exits, also on error, so a
+        failed batch still leaves a valid report of the results so far.
+        """
+        if filename is None:
+            filename = f"batch_report_{_report_timestamps()[2]}"
 
-        aggregated_stats = {}
-        if all_token_reductions:
-            aggregated_stats = {
-                "token_reduction": {
-                    "mean": statistics.mean(all_token_reductions),
-                    "median": statistics.median(all_token_reductions),
-                    "std": statistics.stdev(all_token_reductions) if len(all_token_reductions) > 1 else 0,
-                    "min": min(all_token_reductions),
-                    "max": max(all_token_reductions),
-                },
-                "time_reduction": {
-                    "mean": statistics.mean(all_time_reductions),
-                    "median": statistics.median(all_time_reductions),
-                    "std": statistics.stdev(all_time_reductions) if len(all_time_reductions) > 1 else 0,
-                    "min": min(all_time_reductions),
-                    "max": max(all_time_reductions),
-                },
-                "efficiency_improvement": {
-                    "mean": statistics.mean(all_efficiency_improvements),
-                    "median": statistics.median(all_efficiency_improvements),
-                    "std": statistics.stdev(all_efficiency_improvements) if len(all_efficiency_improvements) > 1 else 0,
-                    "min": min(all_efficiency_improvements),
-                    "max": max(all_efficiency_improvements),
-                },
-                "total_configurations": len(batch_results),
-                "successful_configurations": len(successful_results),
-                "success_rate": len(successful_results) / len(batch_results) if batch_results else 0,
-            }
+        filepath = self.output_dir / f"{filename}.{OutputFormat.JSON.value}"
 
-        return {
-            "batch_results": batch_results,
-            "aggregated_stats": aggregated_stats,
-            "summary": {
-                "total_runs": len(batch_results),
-                "successful_runs": len(successful_results),
-                "timestamp": time.time(),
-            },
-        }
+        with self._open_file(filepath) as f:
+            writer = BatchReportWriter(f, filepath)
+            try:
+                yield writer
+            finally:
+                writer.close()
+
+    def _aggregate_batch_data(
+        self, batch_results: List[Dict[str, Any]], timestamp: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Aggregate data from multiple batch results.
+
+        Args:
+            batch_results: Results of each batch configuration
+            timestamp: Summary timestamp, defaults to now
+        """
+        aggregator = _BatchAggregator()
+        for result in batch_results:
+            aggregator.add(result)
+        return aggregator.to_dict(batch_results, timestamp)
 
     def _generate_batch_markdown_report(self, data: Dict[str, Any]) -> str:
         """Generate Markdown report for batch results."""
-        lines = []
+        return self._render(self._write_batch_markdown_report, data)
+
+    def _write_batch_markdown_report(self, data: Dict[str, Any], fp: TextIO, generated: Optional[str] = None) -> None:
+        """Render Markdown report for batch results, writing it to a text stream.
+
+        Args:
+            data: Aggregated batch data
+            fp: Text stream to write to
+            generated: Report generation time to show, defaults to now
+        """
+        lines = _LineWriter(fp)
 
         lines.append("# Batch Benchmark Report")
         lines.append("")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"**Generated:** {generated or _report_timestamps()[1]}")
 
         summary = data.get("summary", {})
         lines.append(f"**Total Runs:** {summary.get('total_runs', 0)}")
@@ -430,33 +741,35 @@ class ReportGenerator:
             lines.append("## Individual Results")
             lines.append("")
 
+            # One template call per run, in run order
             for i, result in enumerate(batch_results, 1):
-                benchmark_info = result.get("benchmark_info", {})
-                profile = benchmark_info.get("profile", "unknown")
-
-                lines.append(f"### Run {i}: {profile.upper()}")
-                lines.append("")
+                profile = result.get("benchmark_info", {}).get("profile", "unknown").upper()
 
                 if "error" in result:
-                    lines.append("**Status:** Failed")
-                    lines.append(f"**Error:** {result['error']}")
-                else:
-                    lines.append("**Status:** Success")
-                    comparison = result.get("comparison_metrics", {})
-                    if comparison:
-                        lines.append(f"**Token Reduction:** {comparison.get('token_reduction_percent', 0):.1f}%")
-                        lines.append(f"**Time Reduction:** {comparison.get('time_reduction_percent', 0):.1f}%")
-                        lines.append(
-                            f"**Efficiency Improvement:** {comparison.get('efficiency_improvement_percent', 0):.1f}%"
-                        )
+                    lines.append(_MARKDOWN_BATCH_RUN_FAILED(i, profile, result["error"]))
+                    continue
 
-                lines.append("")
-
-        return "\n".join(lines)
+                comparison = result.get("comparison_metrics", {})
+                if comparison:
+                    lines.append(
+                        _MARKDOWN_BATCH_RUN(
+                            i,
+                            profile,
+                            comparison.get("token_reduction_percent", 0),
+                            comparison.get("time_reduction_percent", 0),
+                            comparison.get("efficiency_improvement_percent", 0),
+                        )
+                    )
+                else:
+                    lines.append(_MARKDOWN_BATCH_RUN_BARE(i, profile))
 
     def _generate_batch_console_report(self, data: Dict[str, Any]) -> str:
         """Generate console report for batch results."""
-        lines = []
+        return self._render(self._write_batch_console_report, data)
+
+    def _write_batch_console_report(self, data: Dict[str, Any], fp: TextIO) -> None:
+        """Render console report for batch results, writing it to a text stream."""
+        lines = _LineWriter(fp)
 
         lines.append("🚀 Batch Benchmark Report")
         lines.append("=" * 40)
@@ -480,60 +793,46 @@ class ReportGenerator:
 
             lines.append("")
 
-        return "\n".join(lines)
-
     def export_raw_data(self, data: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Export raw benchmark data for further analysis."""
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"raw_data_{timestamp}"
+            filename = f"raw_data_{_report_timestamps()[2]}"
 
         filepath = self.output_dir / f"{filename}.json"
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        self._write_file(filepath, self._write_json_report, data)
 
         return str(filepath)
 
     def create_summary_table(self, batch_results: List[Dict[str, Any]]) -> str:
         """Create a summary table of batch results."""
-        lines = []
-
-        # Header
-        lines.append("| Configuration | Profile | Status | Token Reduction | Time Reduction | Efficiency |")
-        lines.append("|---------------|---------|--------|-----------------|----------------|------------|")
+        lines = list(_SUMMARY_TABLE_HEADER)
 
         # Data rows
         for result in batch_results:
             batch_info = result.get("batch_info", {})
-            config_name = batch_info.get("name", "unknown")
+            name = batch_info.get("name", "unknown")
             profile = batch_info.get("profile", "unknown")
 
             if "error" in result:
-                status = "Failed"
-                token_reduction = "N/A"
-                time_reduction = "N/A"
-                efficiency = "N/A"
+                lines.append(_SUMMARY_TABLE_FAILED_ROW(name, profile))
             else:
-                status = "Success"
                 comparison = result.get("comparison_metrics", {})
-                token_reduction = f"{comparison.get('token_reduction_percent', 0):.1f}%"
-                time_reduction = f"{comparison.get('time_reduction_percent', 0):.1f}%"
-                efficiency = f"{comparison.get('efficiency_improvement_percent', 0):.1f}%"
-
-            lines.append(
-                f"| {config_name} | {profile} | {status} | {token_reduction} | {time_reduction} | {efficiency} |"
-            )
+                lines.append(
+                    _SUMMARY_TABLE_ROW(
+                        name,
+                        profile,
+                        comparison.get("token_reduction_percent", 0),
+                        comparison.get("time_reduction_percent", 0),
+                        comparison.get("efficiency_improvement_percent", 0),
+                    )
+                )
 
         return "\n".join(lines)
 
     def generate_performance_dashboard(self, data: Dict[str, Any]) -> str:
         """Generate a simple ASCII dashboard for performance metrics."""
-        lines = []
-
-        lines.append("┌─────────────────────────────────────────────────────────────┐")
-        lines.append("│                 Performance Dashboard                       │")
-        lines.append("├─────────────────────────────────────────────────────────────┤")
+        lines = [_DASH_TOP, _DASH_TITLE, _DASH_SEP]
 
         # Overall metrics
         overall_metrics = data.get("overall_metrics", {})
@@ -544,63 +843,49 @@ class ReportGenerator:
             avg_duration = overall_metrics.get("average_task_duration", 0)
             throughput = overall_metrics.get("throughput", 0)
 
-            lines.append(f"│ Success Rate:     {success_rate:.1%} {self._create_bar(success_rate, 0.8)} │")
-            lines.append(f"│ Avg Duration:     {avg_duration:.2f}s                               │")
-            lines.append(f"│ Throughput:       {throughput:.2f} tasks/sec                       │")
+            lines += (
+                f"│ Success Rate:     {success_rate:.1%} {self._create_bar(success_rate, 0.8)} │",
+                f"│ Avg Duration:     {avg_duration:.2f}s                               │",
+                f"│ Throughput:       {throughput:.2f} tasks/sec                       │",
+            )
 
         if comparison_metrics:
             token_reduction = comparison_metrics.get("token_reduction_percent", 0) / 100
             time_reduction = comparison_metrics.get("time_reduction_percent", 0) / 100
 
-            lines.append("├─────────────────────────────────────────────────────────────┤")
-            lines.append("│                   Improvements                              │")
-            lines.append("├─────────────────────────────────────────────────────────────┤")
-            lines.append(f"│ Token Reduction:  {token_reduction:.1%} {self._create_bar(token_reduction, 0.3)} │")
-            lines.append(f"│ Time Reduction:   {time_reduction:.1%} {self._create_bar(time_reduction, 0.3)} │")
+            lines += (
+                _DASH_SEP,
+                _DASH_IMPROVEMENTS,
+                _DASH_SEP,
+                f"│ Token Reduction:  {token_reduction:.1%} {self._create_bar(token_reduction, 0.3)} │",
+                f"│ Time Reduction:   {time_reduction:.1%} {self._create_bar(time_reduction, 0.3)} │",
+            )
 
-        lines.append("└─────────────────────────────────────────────────────────────┘")
+        lines.append(_DASH_BOT)
 
         return "\n".join(lines)
 
     def _create_bar(self, value: float, threshold: float = 0.5) -> str:
         """Create a simple ASCII progress bar."""
-        bar_length = 20
-        filled_length = int(bar_length * min(value, 1.0))
-
-        if value >= threshold:
-            bar_char = "█"
-        else:
-            bar_char = "▓"
+        filled_length = int(_BAR_LENGTH * min(value, 1.0))
+        bar_char = "█" if value >= threshold else "▓"
 
-        bar = bar_char * filled_length + "░" * (bar_length - filled_length)
-        return f"[{bar}]"
+        if filled_length >= 0:
+            return _BARS[bar_char][filled_length]
+        # Negative values keep the empty cells past the full bar width
+        return f"[{'░' * (_BAR_LENGTH - filled_length)}]"
 
     def generate_comparison_chart(self, comparison_data: Dict[str, Any]) -> str:
         """Generate a simple ASCII chart comparing baseline vs tools."""
-        lines = []
-
-        lines.append("┌─────────────────────────────────────────────────────────────┐")
-        lines.append("│                 Baseline vs Tools                           │")
-        lines.append("├─────────────────────────────────────────────────────────────┤")
+        lines = [_DASH_TOP, _CHART_TITLE, _DASH_SEP]
 
         baseline_metrics = comparison_data.get("baseline_metrics", {})
         tools_metrics = comparison_data.get("tools_metrics", {})
 
         # Compare key metrics
-        metrics_to_compare = [
-            ("Duration", "average_task_duration", "s", True),  # Lower is better
-            ("Tokens", "total_tokens", "", True),  # Lower is better
-            ("Success Rate", "success_rate", "%", False),  # Higher is better
-            ("Throughput", "throughput", "tasks/s", False),  # Higher is better
-        ]
-
-        for metric_name, key, unit, lower_is_better in metrics_to_compare:
-            baseline_val = baseline_metrics.get(key, 0)
-            tools_val = tools_metrics.get(key, 0)
-
-            if key == "success_rate":
-                baseline_val *= 100
-                tools_val *= 100
+        for metric_name, key, unit, scale, lower_is_better in _CHART_COMPARED_METRICS:
+            baseline_val = baseline_metrics.get(key, 0) * scale
+            tools_val = tools_metrics.get(key, 0) * scale
 
             # Create comparison visualization
             if baseline_val > 0:
@@ -620,9 +905,9 @@ class ReportGenerator:
                 f"│ {metric_name:<12} │ Baseline: {baseline_val:8.2f}{unit:<6} │ Tools: {tools_val:8.2f}{unit:<6} │"
             )
             lines.append(f"│              │ Winner: {winner:<8} │ Improvement: {improvement:+6.1f}% │")
-            lines.append("├─────────────────────────────────────────────────────────────┤")
+            lines.append(_DASH_SEP)
 
-        lines.append("└─────────────────────────────────────────────────────────────┘")
+        lines.append(_DASH_BOT)
 
         return "\n".join(lines)
 
@@ -635,24 +920,24 @@ class ReportGenerator:
         lines.append("📈 Trend Analysis")
         lines.append("=" * 20)
 
-        # Extract key metrics over time
-        timestamps = []
-        token_reductions = []
-        time_reductions = []
-        success_rates = []
-
+        # Extract key metrics over time, one (token, time, success) row per run
+        runs = []
         for data in historical_data:
             comparison = data.get("comparison_metrics", {})
             overall = data.get("overall_metrics", {})
 
             if comparison and overall:
-                timestamps.append(data.get("benchmark_info", {}).get("timestamp", 0))
-                token_reductions.append(comparison.get("token_reduction_percent", 0))
-                time_reductions.append(comparison.get("time_reduction_percent", 0))
-                success_rates.append(overall.get("success_rate", 0) * 100)
+                runs.append(
+                    (
+                        comparison.get("token_reduction_percent", 0),
+                        comparison.get("time_reduction_percent", 0),
+                        overall.get("success_rate", 0) * 100,
+                    )
+                )
 
-        if len(timestamps) >= 2:
+        if len(runs) >= 2:
             # Calculate trends
+            token_reductions, time_reductions, success_rates = zip(*runs)
             token_trend = self._calculate_trend(token_reductions)
             time_trend = self._calculate_trend(time_reductions)
             success_trend = self._calculate_trend(success_rates)
@@ -684,18 +969,24 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
-    def _calculate_trend(self, values: List[float]) -> str:
-        """Calculate trend direction from a list of values."""
-        if len(values) < 2:
+    def _calculate_trend(self, values: Sequence[float]) -> str:
+        """Calculate trend direction from a list of values.
+
+        Fits a least-squares line through all values, so a noisy first or last
+        run does not decide the trend on its own.
+        """
+        n = len(values)
+        if n < 2:
             return "No trend data"
 
-        # Simple trend calculation
-        start_value = values[0]
-        end_value = values[-1]
+        # Slope against run index, with indices centered for numerical stability
+        center = (n - 1) / 2
+        slope = sum((i - center) * value for i, value in enumerate(values)) / (n * (n * n - 1) / 12)
+        change = slope * (n - 1)
 
-        if abs(end_value - start_value) < 0.1:
+        if abs(change) < 0.1:
             return "Stable"
-        elif end_value > start_value:
+        elif change > 0:
             return "Improving ↗"
         else:
             return "Declining ↘"
@@ -5,17 +5,42 @@ Provides the primary interface for executing benchmarks with full
 configuration management, error handling, and reporting.
 """
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import AsyncExitStack, aclosing, asynccontextmanager
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
 
-from .config import BenchmarkConfig, HardwareProfile, OutputFormat, load_config
+from .config import BenchmarkConfig, HardwareProfile, OutputFormat, WorkflowType, load_config
 from .execution import ExecutionEngine
 from .reporting import ReportGenerator
-from .tasks import get_task_registry
+from .tasks import BenchmarkTask, get_task_registry
 
 logger = logging.getLogger(__name__)
 
+# Workflow types by value, for resolving custom task registrations
+_WORKFLOW_BY_VALUE = {workflow.value: workflow for workflow in WorkflowType}
+
+# Hardware profiles in definition order, and their human-readable descriptions
+_PROFILES = tuple(HardwareProfile)
+_PROFILE_DESCRIPTIONS = {
+    HardwareProfile.LIGHT: "Laptop/minimal (8GB+ RAM, 2+ cores)",
+    HardwareProfile.MEDIUM: "Desktop/development (16GB+ RAM, 4+ cores)",
+    HardwareProfile.HEAVY: "Server/comprehensive (32GB+ RAM, 8+ cores)",
+}
+
+# Profile comparison fields and the comparison metric each one is read from
+_PROFILE_COMPARISON_FIELDS = ("token_reduction", "time_reduction", "efficiency_improvement", "sample_size")
+_PROFILE_COMPARISON_KEYS = (
+    "token_reduction_percent",
+    "time_reduction_percent",
+    "efficiency_improvement_percent",
+    "sample_size",
+)
+_get_profile_comparison = itemgetter(*_PROFILE_COMPARISON_KEYS)
+_NO_PROFILE_COMPARISON = (0,) * len(_PROFILE_COMPARISON_KEYS)
+
 
 class BenchmarkRunner:
     """Main benchmark runner with comprehensive configuration and execution management."""
@@ -24,8 +49,37 @@ class BenchmarkRunner:
         self.config = config or load_config()
         self.task_registry = get_task_registry()
         self.report_generator = ReportGenerator(self.config.output_directory)
+        # Engine shared by every run while the runner is used as an async context manager
+        self._engine: Optional[ExecutionEngine] = None
+        self._engine_stack: Optional[AsyncExitStack] = None
         self._validate_config()
 
+    async def __aenter__(self):
+        """Open one execution engine for all runs made inside the ``async with`` block.
+
+        Sequential runs then share its HTTP session and response cache instead
+        of opening a new engine per run. Runs sharing the engine must not overlap.
+        """
+        stack = AsyncExitStack()
+        self._engine = await stack.enter_async_context(ExecutionEngine(self.config))
+        self._engine_stack = stack
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared execution engine."""
+        stack, self._engine, self._engine_stack = self._engine_stack, None, None
+        if stack is not None:
+            await stack.__aexit__(exc_type, exc_val, exc_tb)
+
+    @asynccontextmanager
+    async def _engine_session(self) -> AsyncIterator[ExecutionEngine]:
+        """Yield the shared engine if there is one, otherwise an engine for this run only."""
+        if self._engine is not None:
+            yield self._engine
+        else:
+            async with ExecutionEngine(self.config) as engine:
+                yield engine
+
     def _validate_config(self) -> None:
         """Validate configuration and report any issues."""
         issues = self.config.validate_runtime()
@@ -34,6 +88,23 @@ class BenchmarkRunner:
             for issue in issues:
                 logger.warning(f"  - {issue}")
 
+    def _resolve_tasks(self, task_ids: Optional[List[str]] = None) -> Sequence[BenchmarkTask]:
+        """Look up the tasks to run (all registered tasks if None), raising ValueError if none are found."""
+        if task_ids:
+            tasks = []
+            for task_id in task_ids:
+                task = self.task_registry.get_task(task_id)
+                if task:
+                    tasks.append(task)
+                else:
+                    logger.warning(f"Task not found: {task_id}")
+        else:
+            tasks = self.task_registry.get_all_tasks_cached()
+
+        if not tasks:
+            raise ValueError("No tasks to run")
+        return tasks
+
     async def run_single_benchmark(
         self,
         profile: HardwareProfile,
@@ -58,19 +129,7 @@ class BenchmarkRunner:
         logger.info(f"Starting single benchmark for profile: {profile.value}")
 
         # Get tasks to run
-        if task_ids:
-            tasks = []
-            for task_id in task_ids:
-                task = self.task_registry.get_task(task_id)
-                if task:
-                    tasks.append(task)
-                else:
-                    logger.warning(f"Task not found: {task_id}")
-        else:
-            tasks = self.task_registry.get_all_tasks()
-
-        if not tasks:
-            raise ValueError("No tasks to run")
+        tasks = self._resolve_tasks(task_ids)
 
         # Use config defaults if not specified
         if sample_size is None:
@@ -82,7 +141,7 @@ class BenchmarkRunner:
         logger.info(f"Running {len(tasks)} tasks with {sample_size} samples each")
 
         # Execute benchmark
-        async with ExecutionEngine(self.config) as engine:
+        async with self._engine_session() as engine:
             results = await engine.execute_benchmark(tasks=tasks, profile=profile, sample_size=sample_size)
 
         # Generate report
@@ -119,19 +178,7 @@ class BenchmarkRunner:
             raise ValueError(f"Batch configuration not found: {batch_name}")
 
         # Get tasks to run
-        if task_ids:
-            tasks = []
-            for task_id in task_ids:
-                task = self.task_registry.get_task(task_id)
-                if task:
-                    tasks.append(task)
-                else:
-                    logger.warning(f"Task not found: {task_id}")
-        else:
-            tasks = self.task_registry.get_all_tasks()
-
-        if not tasks:
-            raise ValueError("No tasks to run")
+        tasks = self._resolve_tasks(task_ids)
 
         # Use config defaults if not specified
         if output_format is None:
@@ -140,7 +187,7 @@ class BenchmarkRunner:
         logger.info(f"Running {len(tasks)} tasks for batch: {batch_name}")
 
         # Execute batch benchmark
-        async with ExecutionEngine(self.config) as engine:
+        async with self._engine_session() as engine:
             results = await engine.execute_benchmark(
                 tasks=tasks, profile=batch_config.profile, sample_size=batch_config.sample_size
             )
@@ -177,31 +224,33 @@ class BenchmarkRunner:
             output_filename: Output filename (auto-generated if None)
 
         Returns:
-            List of benchmark results for each configuration
+            List of benchmark results for each configuration. With JSON output
+            the per-sample ``results`` of each configuration are only written
+            to the report and are left out of the returned results.
         """
         logger.info(f"Starting custom batch with {len(configurations)} configurations")
 
         # Get tasks to run
-        if task_ids:
-            tasks = []
-            for task_id in task_ids:
-                task = self.task_registry.get_task(task_id)
-                if task:
-                    tasks.append(task)
-                else:
-                    logger.warning(f"Task not found: {task_id}")
-        else:
-            tasks = self.task_registry.get_all_tasks()
-
-        if not tasks:
-            raise ValueError("No tasks to run")
+        tasks = self._resolve_tasks(task_ids)
 
         # Use config defaults if not specified
         if output_format is None:
             output_format = self.config.output_format
 
-        # Execute batch benchmarks
-        async with ExecutionEngine(self.config) as engine:
+        # Execute batch benchmarks; JSON reports are written as each configuration finishes
+        async with self._engine_session() as engine:
+            if output_format == OutputFormat.JSON:
+                results = []
+                with self.report_generator.stream_batch_report(output_filename) as report:
+                    async with aclosing(engine.iter_batch(configurations, tasks)) as batch:
+                        async for result in batch:
+                            report.add(result)
+                            # The samples are on disk now, keep only the metrics
+                            result.pop("results", None)
+                            results.append(result)
+                logger.info(f"Custom batch report saved to: {report.path}")
+                return results
+
             results = await engine.execute_batch(configurations, tasks)
 
         # Generate batch report
@@ -211,6 +260,74 @@ class BenchmarkRunner:
 
         return results
 
+    def _instances_disjoint(self, profiles: Sequence[HardwareProfile]) -> bool:
+        """Check that no two profiles use a model instance at the same host and port."""
+        seen: Set[tuple] = set()
+        for profile in profiles:
+            addresses = {(instance.host, instance.port) for instance in self.config.get_profile_instances(profile)}
+            if not seen.isdisjoint(addresses):
+                return False
+            seen |= addresses
+        return True
+
+    async def _run_profile(
+        self,
+        engine: ExecutionEngine,
+        profile: HardwareProfile,
+        tasks: Sequence[BenchmarkTask],
+        sample_size: Optional[int],
+    ) -> Dict[str, Any]:
+        """Benchmark one profile of a comparison on the given engine."""
+        logger.info(f"Running benchmark for profile: {profile.value}")
+
+        profile_sample_size = sample_size or self.config.get_sample_size(profile)
+
+        return await engine.execute_benchmark(tasks=tasks, profile=profile, sample_size=profile_sample_size)
+
+    async def _run_profiles_concurrently(
+        self,
+        profiles: List[HardwareProfile],
+        tasks: Sequence[BenchmarkTask],
+        sample_size: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Benchmark profiles with disjoint instances concurrently, each on its own engine.
+
+        An engine collects metrics for one benchmark at a time. Every engine is
+        opened and its profile's containers started up front, so readiness waits
+        overlap instead of queuing behind the max_concurrent_profiles slots.
+        """
+        profile_slots = asyncio.Semaphore(self.config.max_concurrent_profiles)
+        startup_slots = asyncio.Semaphore(self.config.max_concurrent_prewarm)
+
+        async def prewarm(engine: ExecutionEngine, profile: HardwareProfile) -> None:
+            async with startup_slots:
+                await engine.prewarm([profile])
+
+        async def run_profile(engine: ExecutionEngine, profile: HardwareProfile) -> Dict[str, Any]:
+            async with profile_slots:
+                return await self._run_profile(engine, profile, tasks, sample_size)
+
+        async with AsyncExitStack() as stack:
+            engines = [await stack.enter_async_context(ExecutionEngine(self.config)) for _ in profiles]
+
+            await asyncio.gather(*(prewarm(engine, profile) for engine, profile in zip(engines, profiles)))
+
+            if hasattr(asyncio, "TaskGroup"):
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        futures = [
+                            group.create_task(run_profile(engine, profile))
+                            for engine, profile in zip(engines, profiles)
+                        ]
+                except BaseExceptionGroup as errors:  # Only reached on Python 3.11+, where TaskGroup exists
+                    # Raise the first failure itself, as gather does on Python 3.10
+                    raise errors.exceptions[0] from None
+                return [future.result() for future in futures]
+            else:  # Python 3.10
+                return await asyncio.gather(
+                    *(run_profile(engine, profile) for engine, profile in zip(engines, profiles))
+                )
+
     async def run_comparison_benchmark(
         self,
         profiles: List[HardwareProfile],
@@ -235,38 +352,27 @@ class BenchmarkRunner:
         logger.info(f"Starting comparison benchmark across {len(profiles)} profiles")
 
         # Get tasks to run
-        if task_ids:
-            tasks = []
-            for task_id in task_ids:
-                task = self.task_registry.get_task(task_id)
-                if task:
-                    tasks.append(task)
-                else:
-                    logger.warning(f"Task not found: {task_id}")
-        else:
-            tasks = self.task_registry.get_all_tasks()
-
-        if not tasks:
-            raise ValueError("No tasks to run")
+        tasks = self._resolve_tasks(task_ids)
 
         # Use config defaults if not specified
         if output_format is None:
             output_format = self.config.output_format
 
-        # Execute benchmarks for each profile
-        results_by_profile = {}
+        # A profile listed twice is benchmarked once (its results would overwrite each other)
+        unique_profiles = list(dict.fromkeys(profiles))
 
-        async with ExecutionEngine(self.config) as engine:
-            for profile in profiles:
-                logger.info(f"Running benchmark for profile: {profile.value}")
-
-                profile_sample_size = sample_size or self.config.get_sample_size(profile)
-
-                profile_results = await engine.execute_benchmark(
-                    tasks=tasks, profile=profile, sample_size=profile_sample_size
-                )
+        # Profiles share one compose project, so stopping a profile that shares an
+        # instance with another would take it down mid-run, and profiles sending
+        # requests to one server would skew each other's timings
+        if self.config.max_concurrent_profiles > 1 and self._instances_disjoint(unique_profiles):
+            profile_results = await self._run_profiles_concurrently(unique_profiles, tasks, sample_size)
+        else:
+            profile_results = []
+            async with self._engine_session() as engine:
+                for profile in unique_profiles:
+                    profile_results.append(await self._run_profile(engine, profile, tasks, sample_size))
 
-                results_by_profile[profile.value] = profile_results
+        results_by_profile = {profile.value: results for profile, results in zip(unique_profiles, profile_results)}
 
         # Create comparison report
         comparison_data = {
@@ -287,14 +393,17 @@ class BenchmarkRunner:
         comparison = {}
 
         for profile_name, profile_results in results_by_profile.items():
-            comparison_metrics = profile_results.get("comparison_metrics", {})
+            comparison_metrics = profile_results.get("comparison_metrics")
 
-            comparison[profile_name] = {
-                "token_reduction": comparison_metrics.get("token_reduction_percent", 0),
-                "time_reduction": comparison_metrics.get("time_reduction_percent", 0),
-                "efficiency_improvement": comparison_metrics.get("efficiency_improvement_percent", 0),
-                "sample_size": comparison_metrics.get("sample_size", 0),
-            }
+            if not comparison_metrics:
+                values = _NO_PROFILE_COMPARISON
+            else:
+                try:
+                    values = _get_profile_comparison(comparison_metrics)
+                except KeyError:  # Partial metrics, e.g. from an older saved report
+                    values = tuple(comparison_metrics.get(key, 0) for key in _PROFILE_COMPARISON_KEYS)
+
+            comparison[profile_name] = dict(zip(_PROFILE_COMPARISON_FIELDS, values))
 
         return comparison
 
@@ -316,7 +425,7 @@ class BenchmarkRunner:
     def list_available_profiles(self) -> List[Dict[str, Any]]:
         """List all available hardware profiles."""
         profiles = []
-        for profile in HardwareProfile:
+        for profile in _PROFILES:
             instances = self.config.get_profile_instances(profile)
             profiles.append(
                 {
@@ -331,12 +440,7 @@ class BenchmarkRunner:
 
     def _get_profile_description(self, profile: HardwareProfile) -> str:
         """Get human-readable description for a profile."""
-        descriptions = {
-            HardwareProfile.LIGHT: "Laptop/minimal (8GB+ RAM, 2+ cores)",
-            HardwareProfile.MEDIUM: "Desktop/development (16GB+ RAM, 4+ cores)",
-            HardwareProfile.HEAVY: "Server/comprehensive (32GB+ RAM, 8+ cores)",
-        }
-        return descriptions.get(profile, "Unknown profile")
+        return _PROFILE_DESCRIPTIONS.get(profile, "Unknown profile")
 
     def list_available_batches(self) -> List[Dict[str, Any]]:
         """List all available batch configurations."""
@@ -358,7 +462,7 @@ class BenchmarkRunner:
         """Get a summary of the current configuration."""
         return {
             "profiles": len(self.config.profiles),
-            "tasks": len(self.task_registry.get_all_tasks()),
+            "tasks": len(self.task_registry.get_all_tasks_cached()),
             "batches": len(self.config.batch_configurations),
             "output_directory": str(self.config.output_directory),
             "execution_mode": self.config.execution_mode.value,
@@ -381,9 +485,9 @@ class BenchmarkRunner:
     ) -> bool:
         """Add a custom task to the registry."""
         try:
-            from .config import WorkflowType
-
-            workflow_enum = WorkflowType(workflow_type)
+            workflow_enum = _WORKFLOW_BY_VALUE.get(workflow_type)
+            if workflow_enum is None:
+                raise ValueError(f"{workflow_type!r} is not a valid WorkflowType")
 
             task = self.task_registry.create_custom_task(
                 task_id=task_id,
@@ -414,6 +518,17 @@ class BenchmarkRunner:
 
     def validate_setup(self) -> Dict[str, Any]:
         """Validate the entire benchmark setup."""
+        # List each target directory once for all tasks
+        tasks = self.task_registry.get_all_tasks_cached()
+        return self._validate_setup(tasks, self.task_registry.find_existing_target_files(tasks))
+
+    async def validate_setup_async(self) -> Dict[str, Any]:
+        """Validate the entire benchmark setup, listing target directories concurrently."""
+        tasks = self.task_registry.get_all_tasks_cached()
+        return self._validate_setup(tasks, await self.task_registry.find_existing_target_files_async(tasks))
+
+    def _validate_setup(self, tasks: Sequence[BenchmarkTask], existing_files: Set[str]) -> Dict[str, Any]:
+        """Validate configuration, tasks and profiles given the target files that exist."""
         issues = []
         warnings = []
 
@@ -422,8 +537,8 @@ class BenchmarkRunner:
         issues.extend(config_issues)
 
         # Task validation
-        for task in self.task_registry.get_all_tasks():
-            task_issues = self.task_registry.validate_task(task)
+        for task in tasks:
+            task_issues = self.task_registry.validate_task(task, existing_files)
             if task_issues:
                 issues.extend([f"Task {task.task_id}: {issue}" for issue in task_issues])
 
@@ -438,6 +553,6 @@ class BenchmarkRunner:
             "issues": issues,
             "warnings": warnings,
             "profiles_available": len(self.config.profiles),
-            "tasks_available": len(self.task_registry.get_all_tasks()),
+            "tasks_available": len(self.task_registry.get_all_tasks_cached()),
             "batches_available": len(self.config.batch_configurations),
         }
@@ -4,11 +4,16 @@ Task management for AI Development Tools benchmarking.
 Provides extensible task registry, task definitions, and task execution logic.
 """
 
+import asyncio
+import os
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Iterable, List, Optional, Set, Tuple
 
 from .config import WorkflowType
 
@@ -30,7 +35,7 @@ class TaskApproach(str, Enum):
     TOOLS = "tools"  # Using AI development tools
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of a single task execution."""
 
@@ -55,10 +60,26 @@ class TaskResult:
     sample_num: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Monotonic start in nanoseconds, set by BenchmarkTask.create_result
+    _start_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def _finish(self) -> None:
+        """Record end time and duration.
+
+        The duration comes from the monotonic clock when the start was
+        recorded there, so wall-clock adjustments cannot distort it; the wall
+        end time is then derived from it rather than read again.
+        """
+        if self._start_ns is not None:
+            self.duration = (time.monotonic_ns() - self._start_ns) / 1e9
+            self.end_time = self.start_time + self.duration
+        else:
+            self.end_time = time.time()
+            self.duration = self.end_time - self.start_time
+
     def mark_completed(self, response: str = "", tokens_in: int = 0, tokens_out: int = 0) -> None:
         """Mark task as completed with results."""
-        self.end_time = time.time()
-        self.duration = self.end_time - self.start_time
+        self._finish()
         self.status = TaskStatus.COMPLETED
         self.response = response
         self.input_tokens = tokens_in
@@ -67,32 +88,40 @@ class TaskResult:
 
     def mark_failed(self, error: str) -> None:
         """Mark task as failed with error."""
-        self.end_time = time.time()
-        self.duration = self.end_time - self.start_time
+        self._finish()
         self.status = TaskStatus.FAILED
         self.error = error
 
+    # Serialized field names, filled in once the dataclass is built
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _get_fields: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "task_id": self.task_id,
-            "approach": self.approach.value,
-            "model_instance": self.model_instance,
-            "status": self.status.value,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "duration": self.duration,
-            "response": self.response,
-            "input_tokens": self.input_tokens,
-            "output_tokens": self.output_tokens,
-            "total_tokens": self.total_tokens,
-            "error": self.error,
-            "sample_num": self.sample_num,
-            "metadata": self.metadata,
-        }
+        return dict(zip(self._FIELDS, self._get_fields(self)))
+
+
+TaskResult._FIELDS = tuple(f.name for f in fields(TaskResult) if not f.name.startswith("_"))
+# Enum fields are serialized by value, read from the member's _value_ attribute
+# directly rather than through the slower Enum.value property
+TaskResult._get_fields = attrgetter(
+    *(f"{name}._value_" if name in ("approach", "status") else name for name in TaskResult._FIELDS)
+)
+
+
+def _intern_strings(outputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of outputs with str values (and str items of list values) interned."""
+    interned = {}
+    for key, value in outputs.items():
+        if type(value) is str:
+            value = sys.intern(value)
+        elif type(value) is list:
+            value = [sys.intern(item) if type(item) is str else item for item in value]
+        interned[key] = value
+    return interned
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkTask:
     """Definition of a benchmark task."""
 
@@ -121,7 +150,7 @@ class BenchmarkTask:
 
     def create_result(self, approach: TaskApproach, model_instance: str, sample_num: int = 0) -> TaskResult:
         """Create a new task result instance."""
-        return TaskResult(
+        result = TaskResult(
             task_id=self.task_id,
             approach=approach,
             model_instance=model_instance,
@@ -129,6 +158,8 @@ class BenchmarkTask:
             start_time=time.time(),
             sample_num=sample_num,
         )
+        result._start_ns = time.monotonic_ns()
+        return result
 
 
 class TaskRegistry:
@@ -136,6 +167,10 @@ class TaskRegistry:
 
     def __init__(self):
         self._tasks: Dict[str, BenchmarkTask] = {}
+        # Bumped on every change, so cached views know when to rebuild
+        self._version = 0
+        self._all_tasks_cache: Optional[Tuple[int, Tuple[BenchmarkTask, ...]]] = None
+        self._workflow_index_cache: Optional[Tuple[int, Dict[WorkflowType, Tuple[BenchmarkTask, ...]]]] = None
         self._load_default_tasks()
 
     def _load_default_tasks(self) -> None:
@@ -209,8 +244,15 @@ class TaskRegistry:
             self._tasks[task.task_id] = task
 
     def register_task(self, task: BenchmarkTask) -> None:
-        """Register a new benchmark task."""
+        """Register a new benchmark task.
+
+        The registered task is a copy whose expected outputs have their string
+        values interned, so tasks sharing values such as ``"HIGH"`` hold one
+        copy of each. The given task is left unchanged.
+        """
+        task = replace(task, expected_outputs=_intern_strings(task.expected_outputs))
         self._tasks[task.task_id] = task
+        self._version += 1
 
     def get_task(self, task_id: str) -> Optional[BenchmarkTask]:
         """Get a task by ID."""
@@ -220,9 +262,29 @@ class TaskRegistry:
         """Get all registered tasks."""
         return list(self._tasks.values())
 
+    def get_all_tasks_cached(self) -> Tuple[BenchmarkTask, ...]:
+        """Get all registered tasks as a tuple reused until the registry changes."""
+        cached = self._all_tasks_cache
+        if cached is None or cached[0] != self._version:
+            cached = self._all_tasks_cache = (self._version, tuple(self._tasks.values()))
+        return cached[1]
+
+    def _workflow_index(self) -> Dict[WorkflowType, Tuple[BenchmarkTask, ...]]:
+        """Get tasks grouped by workflow type, regrouped only after the registry changes."""
+        cached = self._workflow_index_cache
+        if cached is None or cached[0] != self._version:
+            index: Dict[WorkflowType, List[BenchmarkTask]] = {}
+            for task in self._tasks.values():
+                index.setdefault(task.workflow_type, []).append(task)
+            cached = self._workflow_index_cache = (
+                self._version,
+                {workflow_type: tuple(tasks) for workflow_type, tasks in index.items()},
+            )
+        return cached[1]
+
     def get_tasks_by_workflow(self, workflow_type: WorkflowType) -> List[BenchmarkTask]:
         """Get tasks by workflow type."""
-        return [task for task in self._tasks.values() if task.workflow_type == workflow_type]
+        return list(self._workflow_index().get(workflow_type, ()))
 
     def list_task_ids(self) -> List[str]:
         """Get list of all task IDs."""
@@ -232,12 +294,14 @@ class TaskRegistry:
         """Remove a task from registry."""
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._version += 1
             return True
         return False
 
     def clear_tasks(self) -> None:
         """Clear all tasks from registry."""
         self._tasks.clear()
+        self._version += 1
 
     def create_custom_task(
         self,
@@ -269,8 +333,72 @@ class TaskRegistry:
         self.register_task(task)
         return task
 
-    def validate_task(self, task: BenchmarkTask) -> List[str]:
-        """Validate a task configuration."""
+    def find_existing_target_files(self, tasks: Iterable[BenchmarkTask]) -> Set[str]:
+        """Return which target files of the given tasks exist.
+
+        Each directory holding target files is listed once with ``os.scandir``
+        instead of stat-ing every file; paths not found in a listing (e.g. on
+        case-insensitive filesystems) fall back to an individual check.
+        """
+        existing = set()
+        for directory, names in self._target_files_by_directory(tasks).items():
+            existing |= self._existing_in_directory(directory, names)
+        return existing
+
+    async def find_existing_target_files_async(self, tasks: Iterable[BenchmarkTask]) -> Set[str]:
+        """Return which target files of the given tasks exist, listing directories concurrently.
+
+        Like find_existing_target_files, but each directory is listed in a worker
+        thread so slow filesystems cost about the slowest listing, not their sum.
+        """
+        by_directory = self._target_files_by_directory(tasks)
+        listings = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._existing_in_directory, directory, names)
+                for directory, names in by_directory.items()
+            )
+        )
+        return set().union(*listings)
+
+    @staticmethod
+    def _target_files_by_directory(tasks: Iterable[BenchmarkTask]) -> Dict[str, Dict[str, List[str]]]:
+        """Group target files by directory, keyed by their name in that directory."""
+        by_directory: Dict[str, Dict[str, List[str]]] = {}
+        for task in tasks:
+            for file_path in task.target_files:
+                path = Path(file_path)
+                by_directory.setdefault(str(path.parent), {}).setdefault(path.name, []).append(file_path)
+        return by_directory
+
+    @staticmethod
+    def _existing_in_directory(directory: str, names: Dict[str, List[str]]) -> Set[str]:
+        """Return the target files in one directory that exist."""
+        try:
+            with os.scandir(directory) as entries:
+                # Symlinks only count when their target exists, like Path.exists()
+                listed = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in names and (not entry.is_symlink() or os.path.exists(entry.path))
+                }
+        except OSError:
+            listed = set()
+
+        return {
+            file_path
+            for name, file_paths in names.items()
+            for file_path in file_paths
+            if name in listed or Path(file_path).exists()
+        }
+
+    def validate_task(self, task: BenchmarkTask, existing_files: Optional[Set[str]] = None) -> List[str]:
+        """Validate a task configuration.
+
+        Args:
+            task: Task to validate
+            existing_files: Target files known to exist, from find_existing_target_files;
+                each target file is checked on disk if omitted
+        """
         issues = []
 
         if not task.task_id or not task.task_id.strip():
@@ -293,31 +421,41 @@ class TaskRegistry:
 
         # Check target files exist if specified
         for file_path in task.target_files:
-            if not Path(file_path).exists():
+            if existing_files is not None:
+                found = file_path in existing_files
+            else:
+                found = Path(file_path).exists()
+            if not found:
                 issues.append(f"Target file not found: {file_path}")
 
         return issues
 
+    async def validate_task_async(self, task: BenchmarkTask) -> List[str]:
+        """Validate a task configuration, checking its target files concurrently."""
+        return self.validate_task(task, await self.find_existing_target_files_async([task]))
+
     def get_task_stats(self) -> Dict[str, Any]:
         """Get statistics about registered tasks."""
-        workflow_counts = {}
-        total_tasks = len(self._tasks)
-
-        for task in self._tasks.values():
-            workflow_type = task.workflow_type.value
-            workflow_counts[workflow_type] = workflow_counts.get(workflow_type, 0) + 1
+        workflow_counts = {workflow_type.value: len(tasks) for workflow_type, tasks in self._workflow_index().items()}
 
         return {
-            "total_tasks": total_tasks,
+            "total_tasks": len(self._tasks),
             "workflow_distribution": workflow_counts,
             "task_ids": list(self._tasks.keys()),
         }
 
 
-# Global task registry instance
-_task_registry = TaskRegistry()
+# Global task registry instance, built on first use so importing this module
+# does not construct the default tasks
+_task_registry: Optional[TaskRegistry] = None
+_task_registry_lock = threading.Lock()
 
 
 def get_task_registry() -> TaskRegistry:
     """Get the global task registry instance."""
+    global _task_registry
+    if _task_registry is None:
+        with _task_registry_lock:
+            if _task_registry is None:
+                _task_registry = TaskRegistry()
     return _task_registry
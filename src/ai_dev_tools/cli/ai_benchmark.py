@@ -11,66 +11,226 @@ Key features:
 - Performance regression testing
 """
 
+import hashlib
 import json
+import os
+import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
 
 import click
 
-from ..core.ai_helper import AIHelper
-from ..core.baseline_simulator import BaselineSimulator
-from ..core.benchmark_suite import BenchmarkSuite, create_benchmark_report
 from ..core.metrics_collector import (
     MetricsCollector,
     WorkflowType,
+    dumps_indented_json,
+    dumps_indented_json_bytes,
+    load_json_file,
 )
-from ..core.ollama_client import ModelSize
+
+# Workflow types that can be benchmarked on their own (the manual baseline cannot), by value
+_WORKFLOW_BY_VALUE = {wt.value: wt for wt in WorkflowType if wt is not WorkflowType.BASELINE_MANUAL}
+_WORKFLOW_CHOICES = tuple(_WORKFLOW_BY_VALUE)
+
+# Keys read from a comparison's improvements and verdict, in report order
+_IMPROVEMENT_KEYS = (
+    "token_reduction_percent",
+    "time_reduction_percent",
+    "efficiency_increase_percent",
+    "success_rate_improvement",
+)
+_VERDICT_KEYS = ("more_token_efficient", "faster", "more_reliable")
+_get_improvements = itemgetter(*_IMPROVEMENT_KEYS)
+_get_verdict = itemgetter(*_VERDICT_KEYS)
+
+# Seconds a cached baseline suite stays valid for compare
+_BASELINE_CACHE_TTL = 900
+
+# Sections of the human-readable report, joined by newlines
+_HUMAN_HEADER = "🚀 AI Development Tools Benchmark Results\n" + "=" * 50
+_HUMAN_COMPARISON = (
+    "\n📊 Performance Comparison:\n"
+    "Token Efficiency: {token:.1f}% improvement\n"
+    "Execution Speed: {time:.1f}% improvement\n"
+    "Overall Efficiency: {efficiency:.1f}% improvement\n"
+    "Success Rate: {success:.1f}% improvement\n"
+    "\n✅ Verdict:\n"
+    "More Token Efficient: {token_efficient}\n"
+    "Faster Execution: {faster}\n"
+    "More Reliable: {reliable}"
+).format
+_HUMAN_ROI = (
+    "\n💰 ROI Analysis:\n"
+    "Token Savings per Workflow: {tokens:.0f}\n"
+    "Time Savings per Workflow: {time:.1f}s\n"
+    "Cost Impact: {cost}"
+).format
+_HUMAN_SUMMARY = (
+    "\n📈 Summary Statistics:\n"
+    "Total Workflows: {workflows}\n"
+    "Success Rate: {success_rate:.1f}%\n"
+    "Average Tokens: {tokens:.0f}\n"
+    "Average Duration: {duration:.1f}s"
+).format
+
+
+def echo_benchmark_output(results: Dict[str, Any], format_type: str) -> None:
+    """Write formatted benchmark results to stdout
+
+    The json format is written as the serializer's UTF-8 bytes, skipping the
+    decode to str and the re-encode on output.
+    """
+    if format_type == "json":
+        click.echo(dumps_indented_json_bytes(results))
+    else:
+        click.echo(format_benchmark_output(results, format_type))
+
+
+def _comparison_values(
+    section: Dict[str, Any], get_values: Callable[[Dict[str, Any]], tuple], keys: tuple, default: Any
+) -> tuple:
+    """Read keys from a comparison section in one call, defaulting any that are missing"""
+    try:
+        return get_values(section)
+    except KeyError:  # Partial comparison, e.g. from an older saved report
+        return tuple(section.get(key, default) for key in keys)
 
 
 def format_benchmark_output(results: Dict[str, Any], format_type: str) -> str:
     """Format benchmark results for output"""
     if format_type == "json":
-        return json.dumps(results, indent=2)
+        return dumps_indented_json(results)
     elif format_type == "compact":
         return json.dumps(results)
     else:  # human-readable
-        output = []
-        output.append("🚀 AI Development Tools Benchmark Results")
-        output.append("=" * 50)
+        sections = [_HUMAN_HEADER]
 
         if "comparison" in results:
             comp = results["comparison"]
-            improvements = comp.get("improvements", {})
-            verdict = comp.get("verdict", {})
-
-            output.append("\n📊 Performance Comparison:")
-            output.append(f"Token Efficiency: {improvements.get('token_reduction_percent', 0):.1f}% improvement")
-            output.append(f"Execution Speed: {improvements.get('time_reduction_percent', 0):.1f}% improvement")
-            output.append(f"Overall Efficiency: {improvements.get('efficiency_increase_percent', 0):.1f}% improvement")
-            output.append(f"Success Rate: {improvements.get('success_rate_improvement', 0):.1f}% improvement")
+            token, time_, efficiency, success = _comparison_values(
+                comp.get("improvements", {}), _get_improvements, _IMPROVEMENT_KEYS, 0
+            )
+            token_efficient, faster, reliable = _comparison_values(
+                comp.get("verdict", {}), _get_verdict, _VERDICT_KEYS, None
+            )
 
-            output.append("\n✅ Verdict:")
-            output.append(f"More Token Efficient: {'Yes' if verdict.get('more_token_efficient') else 'No'}")
-            output.append(f"Faster Execution: {'Yes' if verdict.get('faster') else 'No'}")
-            output.append(f"More Reliable: {'Yes' if verdict.get('more_reliable') else 'No'}")
+            sections.append(
+                _HUMAN_COMPARISON(
+                    token=token,
+                    time=time_,
+                    efficiency=efficiency,
+                    success=success,
+                    token_efficient="Yes" if token_efficient else "No",
+                    faster="Yes" if faster else "No",
+                    reliable="Yes" if reliable else "No",
+                )
+            )
 
             if "roi_analysis" in comp:
                 roi = comp["roi_analysis"]
-                output.append("\n💰 ROI Analysis:")
-                output.append(f"Token Savings per Workflow: {roi.get('token_savings_per_workflow', 0):.0f}")
-                output.append(f"Time Savings per Workflow: {roi.get('time_savings_per_workflow', 0):.1f}s")
-                output.append(f"Cost Impact: {roi.get('estimated_cost_savings', 'N/A')}")
+                sections.append(
+                    _HUMAN_ROI(
+                        tokens=roi.get("token_savings_per_workflow", 0),
+                        time=roi.get("time_savings_per_workflow", 0),
+                        cost=roi.get("estimated_cost_savings", "N/A"),
+                    )
+                )
 
         if "summary" in results:
             summary = results["summary"]
-            output.append("\n📈 Summary Statistics:")
-            output.append(f"Total Workflows: {summary.get('total_workflows', 0)}")
-            output.append(f"Success Rate: {summary.get('success_rate', 0):.1f}%")
-            output.append(f"Average Tokens: {summary.get('average_tokens_per_workflow', 0):.0f}")
-            output.append(f"Average Duration: {summary.get('average_duration_per_workflow', 0):.1f}s")
+            sections.append(
+                _HUMAN_SUMMARY(
+                    workflows=summary.get("total_workflows", 0),
+                    success_rate=summary.get("success_rate", 0),
+                    tokens=summary.get("average_tokens_per_workflow", 0),
+                    duration=summary.get("average_duration_per_workflow", 0),
+                )
+            )
+
+        return "\n".join(sections)
+
 
-        return "\n".join(output)
+def _fail(command: str, message: str, error: Exception, format_type: str) -> int:
+    """Report a failed command on stderr, as one JSON line for machine-readable formats
+
+    Returns the error exit code.
+    """
+    if format_type in ("json", "compact"):
+        click.echo(json.dumps({"command": command, "error": str(error)}), err=True)
+    else:
+        click.echo(f"{message}: {error}", err=True)
+    return 255
+
+
+def _call_concurrently(call: Callable[[], Any], count: int) -> Iterator[Any]:
+    """Run call() count times on a thread pool, yielding results in call order
+
+    At most twice as many calls as workers are in flight, so finished results
+    are not all held at once. Calls not yet started are cancelled when
+    iteration stops early, e.g. because a call raised.
+    """
+    if count <= 0:
+        return
+
+    # Same worker count as ThreadPoolExecutor's default, capped at the number of calls
+    workers = min(count, 32, (os.cpu_count() or 1) + 4)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for _ in range(count):
+            pending.append(executor.submit(call))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def write_workflow_results(
+    out: TextIO, workflow: str, iterations: int, results: Iterable[Dict[str, Any]], format_type: str
+) -> None:
+    """Write single-workflow results to a file as they are produced
+
+    Writes the same document as format_benchmark_output for a dict with
+    workflow_type, iterations, results and timestamp keys, but each result
+    is written as soon as it arrives instead of being collected first.
+    """
+    if format_type == "human":
+        # The human-readable report does not list individual results
+        for _ in results:
+            pass
+        out.write(format_benchmark_output({"workflow_type": workflow, "iterations": iterations}, format_type))
+        return
+
+    pretty = format_type == "json"
+    header = {"workflow_type": workflow, "iterations": iterations}
+    if pretty:
+        out.write(dumps_indented_json(header)[:-2] + ',\n  "results": [')
+    else:
+        out.write(json.dumps(header)[:-1] + ', "results": [')
+
+    count = 0
+    for result in results:
+        if pretty:
+            out.write(("," if count else "") + "\n    " + dumps_indented_json(result).replace("\n", "\n    "))
+        else:
+            out.write((", " if count else "") + json.dumps(result))
+        count += 1
+
+    timestamp = json.dumps(datetime.now().isoformat())
+    if pretty:
+        out.write(("\n  ]" if count else "]") + f',\n  "timestamp": {timestamp}\n}}')
+    else:
+        out.write(f'], "timestamp": {timestamp}}}')
 
 
 @click.group()
@@ -94,13 +254,78 @@ def ai_benchmark(ctx, metrics_dir: str):
     """
     ctx.ensure_object(dict)
     ctx.obj["metrics_dir"] = metrics_dir
-    ctx.obj["collector"] = MetricsCollector(metrics_dir)
+
+
+def _collector(obj: Dict[str, Any]) -> MetricsCollector:
+    """Get the invocation's metrics collector, creating it on first use"""
+    collector = obj.get("collector")
+    if collector is None:
+        collector = obj["collector"] = MetricsCollector(obj["metrics_dir"])
+    return collector
+
+
+def _baseline_fingerprint(project_path: str, iterations: int) -> str:
+    """Key a baseline suite by the project's git HEAD, path and iteration count"""
+    try:
+        head = subprocess.run(
+            ["git", "-C", project_path, "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        head = ""
+    key = f"{head}\0{os.path.abspath(project_path)}\0{iterations}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _run_baseline_suite(obj: Dict[str, Any], project_path: str, iterations: int = 5, use_cache: bool = True) -> Dict:
+    """
+    Run the baseline suite, reusing a recent run for the same project state
+
+    Suites are cached under <metrics-dir>/baseline_cache for _BASELINE_CACHE_TTL
+    seconds. A cache hit does not record the simulated workflows into the collector,
+    so callers must not read them back from it.
+    """
+    from ..core.baseline_simulator import BaselineSimulator
+
+    if use_cache:
+        cache_file = (
+            Path(obj["metrics_dir"]) / "baseline_cache" / f"{_baseline_fingerprint(project_path, iterations)}.json"
+        )
+        try:
+            if time.time() - cache_file.stat().st_mtime < _BASELINE_CACHE_TTL:
+                return load_json_file(cache_file)
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry, run the suite
+
+    suite = BaselineSimulator(_collector(obj)).run_baseline_suite(project_path=project_path, iterations=iterations)
+
+    if use_cache:
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_name = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(dumps_indented_json(suite))
+            os.replace(tmp_name, cache_file)
+        except OSError:
+            # The cache is best effort, but don't leave the temporary file behind
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    return suite
 
 
 @ai_benchmark.command()
 @click.option(
     "--workflow",
-    type=click.Choice([wt.value for wt in WorkflowType if wt != WorkflowType.BASELINE_MANUAL]),
+    type=click.Choice(_WORKFLOW_CHOICES),
     help="Specific workflow type to benchmark",
 )
 @click.option(
@@ -123,41 +348,45 @@ def baseline(ctx, workflow: Optional[str], iterations: int, format: str):
     Simulates how AI agents would work WITHOUT our tools to establish
     baseline measurements for token usage and execution time.
     """
-    collector = ctx.obj["collector"]
+    sys.exit(_baseline_impl(ctx.obj, workflow, iterations, format))
+
+
+def _baseline_impl(obj: Dict[str, Any], workflow: Optional[str], iterations: int, format: str) -> int:
+    """Run the baseline command, returning its exit code"""
+    from ..core.baseline_simulator import BaselineSimulator
+
+    collector = _collector(obj)
     simulator = BaselineSimulator(collector)
 
     try:
         if workflow:
-            # Run single workflow type
-            workflow_type = WorkflowType(workflow)
-            results = []
-            for i in range(iterations):
-                result = simulator.simulate_workflow(workflow_type)
-                results.append(result)
-
-            output_results = {
-                "workflow_type": workflow,
-                "iterations": iterations,
-                "results": results,
-                "timestamp": datetime.now().isoformat(),
-            }
+            # Run single workflow type, with iterations overlapping since each one
+            # mostly waits. Results are spooled to disk in order as they complete
+            # so nothing reaches stdout unless every iteration succeeds.
+            workflow_type = _WORKFLOW_BY_VALUE[workflow]
+            results = _call_concurrently(partial(simulator.simulate_workflow, workflow_type), iterations)
+            with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+                write_workflow_results(spool, workflow, iterations, results, format)
+                spool.seek(0)
+                for chunk in iter(partial(spool.read, 1 << 16), ""):
+                    click.echo(chunk, nl=False)
+            click.echo()
         else:
             # Run complete baseline suite
             output_results = simulator.run_baseline_suite(iterations=iterations)
             output_results["timestamp"] = datetime.now().isoformat()
 
-        click.echo(format_benchmark_output(output_results, format))
-        sys.exit(0)
+            echo_benchmark_output(output_results, format)
+        return 0
 
     except Exception as e:
-        click.echo(f"Baseline simulation failed: {str(e)}", err=True)
-        sys.exit(255)
+        return _fail("baseline", "Baseline simulation failed", e, format)
 
 
 @ai_benchmark.command()
 @click.option(
     "--workflow",
-    type=click.Choice([wt.value for wt in WorkflowType if wt != WorkflowType.BASELINE_MANUAL]),
+    type=click.Choice(_WORKFLOW_CHOICES),
     help="Specific workflow type to benchmark",
 )
 @click.option(
@@ -179,20 +408,28 @@ def current(ctx, workflow: Optional[str], project_path: str, format: str):
     Measures the actual performance of our AI development tools
     for comparison against baseline manual workflows.
     """
-    collector = ctx.obj["collector"]
+    sys.exit(_current_impl(ctx.obj, workflow, project_path, format))
+
+
+def _current_impl(obj: Dict[str, Any], workflow: Optional[str], project_path: str, format: str) -> int:
+    """Run the current command, returning its exit code"""
+    from ..core.ai_helper import AIHelper
+
+    collector = _collector(obj)
 
     try:
         if workflow:
-            workflow_type = WorkflowType(workflow)
+            workflow_type = _WORKFLOW_BY_VALUE[workflow]
 
             # Run specific workflow with metrics collection
             if workflow_type == WorkflowType.PROJECT_ANALYSIS:
                 helper = AIHelper(project_path)
                 with collector.measure_workflow(WorkflowType.UNIFIED_WORKFLOW) as context:
                     result = helper.analyze_project()
-                    context.record_tokens(50, 200)  # Estimated tokens for exit code workflow
-                    context.record_files_processed(10)  # Estimated files processed
-                    context.add_metadata("tool_result", result.to_dict())
+                    # Estimated tokens and files processed for exit code workflow
+                    context.record(50, 200, files_processed=10)
+                # Serialize outside the measured window; the recorded workflow shares this metadata dict
+                context.add_metadata("tool_result", result.to_dict())
 
             # Add more workflow implementations as needed
 
@@ -207,12 +444,11 @@ def current(ctx, workflow: Optional[str], project_path: str, format: str):
             "project_path": project_path,
         }
 
-        click.echo(format_benchmark_output(output_results, format))
-        sys.exit(0)
+        echo_benchmark_output(output_results, format)
+        return 0
 
     except Exception as e:
-        click.echo(f"Current benchmark failed: {str(e)}", err=True)
-        sys.exit(255)
+        return _fail("current", "Current benchmark failed", e, format)
 
 
 @ai_benchmark.command()
@@ -237,6 +473,11 @@ def current(ctx, workflow: Optional[str], project_path: str, format: str):
     default="human",
     help="Output format (default: human-readable)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run a fresh baseline simulation instead of reusing a recent one",
+)
 @click.pass_context
 def compare(
     ctx,
@@ -244,6 +485,7 @@ def compare(
     current_file: Optional[str],
     project_path: str,
     format: str,
+    no_cache: bool,
 ):
     """
     Compare baseline vs current performance
@@ -251,38 +493,53 @@ def compare(
     Provides comprehensive comparison analysis showing the efficiency
     gains of our AI development tools over manual workflows.
     """
-    collector = ctx.obj["collector"]
-    simulator = BaselineSimulator(collector)
+    sys.exit(_compare_impl(ctx.obj, baseline_file, current_file, project_path, format, no_cache))
+
 
+def _compare_impl(
+    obj: Dict[str, Any],
+    baseline_file: Optional[str],
+    current_file: Optional[str],
+    project_path: str,
+    format: str,
+    no_cache: bool,
+) -> int:
+    """Run the compare command, returning its exit code"""
+    from ..core.baseline_simulator import BaselineSimulator
+
+    # With both files given the comparison is read-only: no collector,
+    # simulator or AIHelper is created
     try:
         # Get baseline results
         if baseline_file:
-            with open(baseline_file) as f:
-                baseline_data = json.load(f)
-                baseline_results = baseline_data.get("summary", baseline_data)
+            baseline_data = load_json_file(baseline_file)
+            baseline_results = baseline_data.get("summary", baseline_data)
         else:
             click.echo("Running baseline simulation...", err=True)
-            baseline_suite = simulator.run_baseline_suite(project_path=project_path)
+            baseline_suite = _run_baseline_suite(obj, project_path, use_cache=not no_cache)
             baseline_results = baseline_suite["summary"]
 
         # Get current results
         if current_file:
-            with open(current_file) as f:
-                current_data = json.load(f)
-                current_results = current_data.get("current_performance", current_data)
+            current_data = load_json_file(current_file)
+            current_results = current_data.get("current_performance", current_data)
         else:
+            from ..core.ai_helper import AIHelper
+
             click.echo("Running current tool benchmark...", err=True)
             # Run a quick benchmark of current tools
+            collector = _collector(obj)
             helper = AIHelper(project_path)
             with collector.measure_workflow(WorkflowType.UNIFIED_WORKFLOW) as context:
                 helper.analyze_project()
-                context.record_tokens(50, 200)  # Estimated tokens
-                context.record_files_processed(10)
+                context.record(50, 200, files_processed=10)  # Estimated tokens
 
-            current_results = collector.get_metrics_summary()
+            # Only this run's tool workflow: a fresh baseline simulation also
+            # records its workflows into the collector, a cached one does not
+            current_results = collector.get_metrics_summary(WorkflowType.UNIFIED_WORKFLOW)
 
         # Perform comparison
-        comparison = simulator.compare_with_current(current_results, {"summary": baseline_results})
+        comparison = BaselineSimulator.compare_with_current(current_results, {"summary": baseline_results})
 
         output_results = {
             "comparison": comparison,
@@ -290,18 +547,19 @@ def compare(
             "project_path": project_path,
         }
 
-        click.echo(format_benchmark_output(output_results, format))
+        echo_benchmark_output(output_results, format)
 
         # Exit with appropriate code based on performance
-        verdict = comparison.get("verdict", {})
-        if verdict.get("more_token_efficient") and verdict.get("faster"):
-            sys.exit(0)  # Success - tools are better
+        token_efficient, faster, _ = _comparison_values(
+            comparison.get("verdict", {}), _get_verdict, _VERDICT_KEYS, None
+        )
+        if token_efficient and faster:
+            return 0  # Success - tools are better
         else:
-            sys.exit(1)  # Performance regression detected
+            return 1  # Performance regression detected
 
     except Exception as e:
-        click.echo(f"Comparison failed: {str(e)}", err=True)
-        sys.exit(255)
+        return _fail("compare", "Comparison failed", e, format)
 
 
 @ai_benchmark.command()
@@ -323,16 +581,21 @@ def export(ctx, output_file: Optional[str], format: str):
     Exports all collected benchmark metrics for analysis,
     reporting, or historical comparison.
     """
-    collector = ctx.obj["collector"]
+    sys.exit(_export_impl(ctx.obj, output_file, format))
+
+
+def _export_impl(obj: Dict[str, Any], output_file: Optional[str], format: str) -> int:
+    """Run the export command, returning its exit code"""
+    collector = _collector(obj)
 
     try:
         export_path = collector.export_metrics(output_file)
         click.echo(f"Metrics exported to: {export_path}")
-        sys.exit(0)
+        return 0
 
     except Exception as e:
         click.echo(f"Export failed: {str(e)}", err=True)
-        sys.exit(255)
+        return 255
 
 
 @ai_benchmark.command()
@@ -343,16 +606,21 @@ def clear(ctx):
 
     Resets the metrics collector to start fresh measurements.
     """
-    collector = ctx.obj["collector"]
+    sys.exit(_clear_impl(ctx.obj))
+
+
+def _clear_impl(obj: Dict[str, Any]) -> int:
+    """Run the clear command, returning its exit code"""
+    collector = _collector(obj)
 
     try:
         collector.clear_metrics()
         click.echo("All metrics cleared successfully")
-        sys.exit(0)
+        return 0
 
     except Exception as e:
         click.echo(f"Clear failed: {str(e)}", err=True)
-        sys.exit(255)
+        return 255
 
 
 @ai_benchmark.command()
@@ -386,49 +654,52 @@ def regression_test(ctx, threshold: float, baseline_file: str, project_path: str
     - 1: Performance regression detected
     - 255: Test failed to run
     """
+    sys.exit(_regression_test_impl(ctx.obj, threshold, baseline_file, project_path))
+
+
+def _regression_test_impl(obj: Dict[str, Any], threshold: float, baseline_file: str, project_path: str) -> int:
+    """Run the regression-test command, returning its exit code"""
+    from ..core.ai_helper import AIHelper
+    from ..core.baseline_simulator import BaselineSimulator
+
     try:
         # Load baseline
-        with open(baseline_file) as f:
-            baseline_data = json.load(f)
+        baseline_data = load_json_file(baseline_file)
 
         # Run current benchmark
-        collector = ctx.obj["collector"]
+        collector = _collector(obj)
         helper = AIHelper(project_path)
 
         with collector.measure_workflow(WorkflowType.UNIFIED_WORKFLOW) as context:
             helper.analyze_project()
-            context.record_tokens(50, 200)
-            context.record_files_processed(10)
+            context.record(50, 200, files_processed=10)
 
         current_results = collector.get_metrics_summary()
 
         # Compare performance
-        simulator = BaselineSimulator()
-        comparison = simulator.compare_with_current(current_results, baseline_data.get("summary", baseline_data))
+        comparison = BaselineSimulator.compare_with_current(
+            current_results, baseline_data.get("summary", baseline_data)
+        )
 
-        improvements = comparison.get("improvements", {})
+        token_reduction, time_reduction, _, _ = _comparison_values(
+            comparison.get("improvements", {}), _get_improvements, _IMPROVEMENT_KEYS, 0
+        )
 
         # Check for regressions
-        token_regression = improvements.get("token_reduction_percent", 0) < -threshold
-        time_regression = improvements.get("time_reduction_percent", 0) < -threshold
-
-        if token_regression or time_regression:
+        if token_reduction < -threshold or time_reduction < -threshold:
             click.echo("❌ Performance regression detected!", err=True)
-            click.echo(
-                f"Token efficiency change: {improvements.get('token_reduction_percent', 0):.1f}%",
-                err=True,
-            )
+            click.echo(f"Token efficiency change: {token_reduction:.1f}%", err=True)
             click.echo(f"Threshold: {threshold}%", err=True)
-            sys.exit(1)
+            return 1
         else:
             click.echo("✅ No performance regression detected")
-            click.echo(f"Token efficiency: {improvements.get('token_reduction_percent', 0):.1f}%")
-            click.echo(f"Time efficiency: {improvements.get('time_reduction_percent', 0):.1f}%")
-            sys.exit(0)
+            click.echo(f"Token efficiency: {token_reduction:.1f}%")
+            click.echo(f"Time efficiency: {time_reduction:.1f}%")
+            return 0
 
     except Exception as e:
         click.echo(f"Regression test failed: {str(e)}", err=True)
-        sys.exit(255)
+        return 255
 
 
 @ai_benchmark.command()
@@ -476,6 +747,20 @@ def standardized(
 
     Exit code: 0=success, 255=error
     """
+    sys.exit(_standardized_impl(models, ollama_hosts, test_codebase, output_file, format))
+
+
+def _standardized_impl(
+    models: str,
+    ollama_hosts: str,
+    test_codebase: str,
+    output_file: Optional[str],
+    format: str,
+) -> int:
+    """Run the standardized command, returning its exit code"""
+    from ..core.benchmark_suite import BenchmarkSuite, create_benchmark_report
+    from ..core.ollama_client import ModelSize
+
     try:
         # Parse model list
         model_list = []
@@ -509,7 +794,7 @@ def standardized(
 
         if not model_list:
             click.echo("Error: No valid models specified", err=True)
-            sys.exit(255)
+            return 255
 
         # Parse host list
         host_list = [h.strip() for h in ollama_hosts.split(",")]
@@ -528,7 +813,7 @@ def standardized(
 
         # Generate report
         if format == "json":
-            output = json.dumps(results, indent=2)
+            output = dumps_indented_json(results)
         elif format == "compact":
             output = json.dumps(results)
         else:  # human
@@ -543,11 +828,10 @@ def standardized(
         # Print to stdout
         click.echo(output)
 
-        sys.exit(0)
+        return 0
 
     except Exception as e:
-        click.echo(f"Benchmark failed: {str(e)}", err=True)
-        sys.exit(255)
+        return _fail("standardized", "Benchmark failed", e, format)
 
 
 @ai_benchmark.command()
@@ -570,6 +854,11 @@ def setup_models(ctx, host: str, models: str):
 
     Exit code: 0=success, 1=some failures, 255=complete failure
     """
+    sys.exit(_setup_models_impl(host, models))
+
+
+def _setup_models_impl(host: str, models: str) -> int:
+    """Run the setup-models command, returning its exit code"""
     try:
         import subprocess
 
@@ -608,15 +897,15 @@ def setup_models(ctx, host: str, models: str):
         click.echo(f"\n📊 Setup complete: {success_count}/{total_count} models installed")
 
         if success_count == total_count:
-            sys.exit(0)
+            return 0
         elif success_count > 0:
-            sys.exit(1)
+            return 1
         else:
-            sys.exit(255)
+            return 255
 
     except Exception as e:
         click.echo(f"Setup failed: {str(e)}", err=True)
-        sys.exit(255)
+        return 255
 
 
 if __name__ == "__main__":
@@ -12,12 +12,13 @@ from typing import List, Optional
 import click
 
 from ..core.ai_helper import AIHelper, HelperWorkflowResult
+from ..core.metrics_collector import dumps_indented_json
 
 
 def format_output(result: HelperWorkflowResult, format_type: str) -> str:
     """Format workflow result for output"""
     if format_type == "json":
-        return json.dumps(result.to_dict(), indent=2)
+        return dumps_indented_json(result.to_dict())
     elif format_type == "compact":
         return json.dumps(result.to_dict())
     else:  # human-readable
@@ -267,7 +268,7 @@ def workflows(ctx, format: str):
     }
 
     if format == "json":
-        click.echo(json.dumps(workflows_info, indent=2))
+        click.echo(dumps_indented_json(workflows_info))
     elif format == "compact":
         click.echo(json.dumps(workflows_info))
     else:  # human
@@ -21,6 +21,7 @@ from ..benchmark import (
 )
 from ..benchmark.core import quick_benchmark, compare_profiles, batch_benchmark
 from ..benchmark.config import WorkflowType
+from ..benchmark.execution import install_event_loop_policy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -47,8 +48,13 @@ logger = logging.getLogger(__name__)
     default="INFO",
     help="Logging level",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore the configured Ollama response cache and query the models fresh",
+)
 @click.pass_context
-def benchmark(ctx, config, output_dir, log_level):
+def benchmark(ctx, config, output_dir, log_level, no_cache):
     """AI Development Tools Benchmark Suite - Unified CLI Interface."""
     
     # Set logging level
@@ -65,6 +71,13 @@ def benchmark(ctx, config, output_dir, log_level):
         if output_dir:
             benchmark_config.output_directory = output_dir
         
+        # Disable the response cache for fresh runs
+        if no_cache:
+            benchmark_config.response_cache_path = None
+        
+        # Use uvloop for the benchmark event loop when available
+        install_event_loop_policy(benchmark_config.use_uvloop)
+        
         # Create benchmark runner
         runner = BenchmarkRunner(benchmark_config)
         
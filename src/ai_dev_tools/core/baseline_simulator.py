@@ -164,10 +164,13 @@ class BaselineSimulator:
                 # Simulate the work being done
                 time.sleep(min(duration / 10, 2.0))  # Scaled down for testing
 
-                context.record_tokens(input_tokens, output_tokens)
-                context.record_files_processed(files_read)
-                context.add_metadata("ai_rounds", ai_rounds)
-                context.add_metadata("simulated", True)
+                context.record(
+                    input_tokens,
+                    output_tokens,
+                    files_processed=files_read,
+                    ai_rounds=ai_rounds,
+                    simulated=True,
+                )
 
                 if not success:
                     raise Exception("Simulated workflow failure")
@@ -256,7 +259,8 @@ class BaselineSimulator:
 
         return results
 
-    def compare_with_current(self, current_metrics: Dict[str, Any], baseline_results: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def compare_with_current(current_metrics: Dict[str, Any], baseline_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Compare baseline simulation with current tool performance
 
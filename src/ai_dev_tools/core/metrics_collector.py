@@ -20,10 +20,52 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, ContextManager, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # import psutil  # Optional dependency for memory monitoring
 
+# Same output as json.dumps(data, indent=2), without building an encoder per call
+_encode_indented_json = json.JSONEncoder(indent=2).encode
+
+
+def dumps_indented_json(data: Any) -> str:
+    """Serialize data as JSON indented by two spaces, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the json module still handles
+            pass
+    return _encode_indented_json(data)
+
+
+def dumps_indented_json_bytes(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by two spaces, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the json module still handles
+            pass
+    return _encode_indented_json(data).encode("utf-8")
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """Load a JSON file, parsing it with orjson when installed"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or integers wider than 64 bits, which the json module accepts
+            pass
+    return json.loads(data)
+
 
 class WorkflowType(Enum):
     """Types of AI workflows we measure"""
@@ -346,18 +388,29 @@ class MetricsCollector:
 
         output_path = self.output_dir / filename
 
+        export_timestamp = datetime.now(timezone.utc).isoformat()
         with self._lock:
-            export_data = {
-                "export_timestamp": datetime.now(timezone.utc).isoformat(),
-                "total_metrics": len(self._metrics),
-                "total_workflows": len(self._workflows),
-                "metrics": [m.to_dict() for m in self._metrics],
-                "workflows": [w.to_dict() for w in self._workflows],
-                "summary": self.get_metrics_summary(),
-            }
-
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+            metrics = list(self._metrics)
+            workflows = list(self._workflows)
+        # get_metrics_summary takes the (non-reentrant) lock itself
+        summary = self.get_metrics_summary()
+
+        # Write the document one record at a time so only a single record's
+        # dict is built at once, indenting each to its depth in the document
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(
+                f'{{\n  "export_timestamp": {dumps_indented_json(export_timestamp)},'
+                f'\n  "total_metrics": {len(metrics)},'
+                f'\n  "total_workflows": {len(workflows)}'
+            )
+            for key, records in (("metrics", metrics), ("workflows", workflows)):
+                f.write(f',\n  "{key}": [')
+                for index, record in enumerate(records):
+                    record_json = dumps_indented_json(record.to_dict()).replace("\n", "\n    ")
+                    f.write(f"{',' if index else ''}\n    {record_json}")
+                f.write("\n  ]" if records else "]")
+            summary_json = dumps_indented_json(summary).replace("\n", "\n  ")
+            f.write(f',\n  "summary": {summary_json}\n}}')
 
         return output_path
 
@@ -397,6 +450,20 @@ class WorkflowContext:
         """Add metadata to this workflow"""
         self.metadata[key] = value
 
+    def record(
+        self,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        files_processed: int = 0,
+        **metadata: Any,
+    ) -> None:
+        """Record tokens, files processed and metadata for this workflow in one call"""
+        self.token_input += input_tokens
+        self.token_output += output_tokens
+        self.files_processed += files_processed
+        if metadata:
+            self.metadata.update(metadata)
+
 
 # Global metrics collector instance
 _global_collector: Optional[MetricsCollector] = None
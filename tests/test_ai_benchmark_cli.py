@@ -0,0 +1,146 @@
+"""
+Tests for the ai-benchmark CLI
+
+Covers the compare command's baseline cache and the error output that
+scripts rely on.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from ai_dev_tools.cli import ai_benchmark as cli
+from ai_dev_tools.core.baseline_simulator import BaselineSimulator
+
+
+@pytest.fixture
+def fast_simulator():
+    """Skip the simulated work delays and the project analysis"""
+    with patch("ai_dev_tools.core.baseline_simulator.time"), patch("ai_dev_tools.core.ai_helper.AIHelper"):
+        yield
+
+
+class TestCompareBaselineCache:
+    """Test compare reuses recent baseline suites consistently"""
+
+    @staticmethod
+    def compare(metrics_dir, *args):
+        """Run compare with JSON output, returning the exit code and comparison"""
+        result = CliRunner().invoke(
+            cli.ai_benchmark,
+            ["--metrics-dir", str(metrics_dir), "compare", "--format", "json", *args],
+        )
+        comparison = json.loads(result.stdout)["comparison"] if result.stdout else None
+        return result.exit_code, comparison
+
+    def test_cache_hit_matches_fresh_run(self, tmp_path, fast_simulator):
+        """Test a cached baseline gives the same comparison as the run that cached it"""
+        with patch.object(
+            BaselineSimulator, "run_baseline_suite", autospec=True, side_effect=BaselineSimulator.run_baseline_suite
+        ) as run_suite:
+            fresh_code, fresh = self.compare(tmp_path)
+            cached_code, cached = self.compare(tmp_path)
+
+        assert run_suite.call_count == 1
+        assert len(list((tmp_path / "baseline_cache").glob("*.json"))) == 1
+        assert cached_code == fresh_code
+        assert cached["baseline"] == fresh["baseline"]
+        assert cached["current"]["tokens"] == fresh["current"]["tokens"]
+        assert cached["verdict"] == fresh["verdict"]
+        assert cached["improvements"]["token_reduction_percent"] == fresh["improvements"]["token_reduction_percent"]
+
+    def test_expired_cache_entry_is_rerun(self, tmp_path, fast_simulator):
+        """Test a baseline older than the TTL is simulated again"""
+        with patch.object(
+            BaselineSimulator, "run_baseline_suite", autospec=True, side_effect=BaselineSimulator.run_baseline_suite
+        ) as run_suite, patch.object(cli, "_BASELINE_CACHE_TTL", 0):
+            self.compare(tmp_path)
+            self.compare(tmp_path)
+
+        assert run_suite.call_count == 2
+
+    def test_no_cache_skips_the_cache(self, tmp_path, fast_simulator):
+        """Test --no-cache neither fingerprints the project nor reads or writes the cache"""
+        with patch.object(
+            BaselineSimulator, "run_baseline_suite", autospec=True, side_effect=BaselineSimulator.run_baseline_suite
+        ) as run_suite, patch.object(cli, "_baseline_fingerprint") as fingerprint:
+            self.compare(tmp_path, "--no-cache")
+            self.compare(tmp_path, "--no-cache")
+
+        assert run_suite.call_count == 2
+        fingerprint.assert_not_called()
+        assert not (tmp_path / "baseline_cache").exists()
+
+
+class TestFailureOutput:
+    """Test the exit codes and error output scripts rely on"""
+
+    @staticmethod
+    def invoke(tmp_path, *args):
+        """Run an ai-benchmark command with its metrics under tmp_path"""
+        return CliRunner().invoke(cli.ai_benchmark, ["--metrics-dir", str(tmp_path / "metrics"), *args])
+
+    @pytest.mark.parametrize("format_type", ["json", "compact"])
+    def test_machine_readable_failure_is_one_json_line(self, tmp_path, format_type):
+        """Test json and compact failures print one JSON error line on stderr and exit 255"""
+        baseline_file = tmp_path / "baseline.json"
+        baseline_file.write_text("not json")
+
+        result = self.invoke(tmp_path, "compare", "--baseline-file", str(baseline_file), "--format", format_type)
+
+        assert result.exit_code == 255
+        assert result.stdout == ""
+        (error_line,) = result.stderr.splitlines()
+        error = json.loads(error_line)
+        assert error["command"] == "compare"
+        assert error["error"]
+
+    def test_human_failure_is_a_message(self, tmp_path):
+        """Test human-readable failures print the command's message on stderr and exit 255"""
+        with patch.object(BaselineSimulator, "run_baseline_suite", side_effect=RuntimeError("simulator broke")):
+            result = self.invoke(tmp_path, "baseline")
+
+        assert result.exit_code == 255
+        assert result.stdout == ""
+        assert result.stderr == "Baseline simulation failed: simulator broke\n"
+
+    @pytest.mark.parametrize(
+        "current, exit_code",
+        [
+            ({"tokens": {"total_avg": 100}, "execution_time": {"avg": 1.0}, "success_rate": 100}, 0),
+            ({"tokens": {"total_avg": 5000}, "execution_time": {"avg": 1.0}, "success_rate": 100}, 1),
+        ],
+    )
+    def test_compare_exit_code_reports_regressions(self, tmp_path, current, exit_code):
+        """Test compare exits 0 when the tools win and 1 on a regression"""
+        baseline_file = tmp_path / "baseline.json"
+        baseline_file.write_text(
+            json.dumps(
+                {
+                    "summary": {
+                        "average_tokens_per_workflow": 1000,
+                        "average_duration_per_workflow": 10.0,
+                        "overall_efficiency": 100.0,
+                        "success_rate": 90.0,
+                    }
+                }
+            )
+        )
+        current_file = tmp_path / "current.json"
+        current_file.write_text(json.dumps({"current_performance": current}))
+
+        result = self.invoke(
+            tmp_path,
+            "compare",
+            "--baseline-file",
+            str(baseline_file),
+            "--current-file",
+            str(current_file),
+            "--format",
+            "json",
+        )
+
+        assert result.exit_code == exit_code, result.stderr
+        assert json.loads(result.stdout)["comparison"]["verdict"]["more_token_efficient"] is (exit_code == 0)
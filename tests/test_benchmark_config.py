@@ -111,6 +111,8 @@ class TestBenchmarkConfig:
         assert config.output_format == OutputFormat.JSON
         assert config.output_directory == Path("benchmark_results")
         assert config.max_concurrent_batches == 2
+        assert config.max_concurrent_profiles == 1
+        assert config.max_concurrent_prewarm == 3
         assert config.container_startup_timeout == 180
         assert config.task_timeout == 30
         assert config.retry_attempts == 3
@@ -206,6 +208,8 @@ class TestConfigLoading:
 execution_mode = "parallel"
 output_format = "markdown"
 task_timeout = 45
+use_uvloop = false
+response_cache_path = ".cache/responses.sqlite"
 
 [tool.ai-dev-tools.benchmark.ollama_profiles]
 light = [
@@ -236,6 +240,8 @@ heavy = 12
             assert config.execution_mode == ExecutionMode.PARALLEL
             assert config.output_format == OutputFormat.MARKDOWN
             assert config.task_timeout == 45
+            assert config.use_uvloop is False
+            assert config.response_cache_path == Path(".cache/responses.sqlite")
             
             assert len(config.profiles) == 3
             assert len(config.get_profile_instances(HardwareProfile.LIGHT)) == 1
@@ -266,6 +272,9 @@ setting = "value"
             config = BenchmarkConfig.from_toml(f.name)
             assert len(config.profiles) == 3
             assert config.execution_mode == ExecutionMode.ASYNC
+            assert config.use_uvloop is True
+            assert config.response_cache_path is None
+            assert config.stream_responses is False
     
     def test_load_config_default(self):
         """Test loading default configuration."""
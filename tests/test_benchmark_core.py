@@ -5,8 +5,11 @@ Tests the new simplified benchmarking API and core functionality.
 """
 
 import asyncio
+import json
+import sqlite3
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from click.testing import CliRunner
+from unittest.mock import MagicMock, Mock, patch, AsyncMock
 from pathlib import Path
 from typing import Dict, Any
 
@@ -17,8 +20,11 @@ from ai_dev_tools.benchmark.core import (
     compare_profiles,
     batch_benchmark
 )
-from ai_dev_tools.benchmark.config import BenchmarkConfig, HardwareProfile, ModelInstance
-from ai_dev_tools.benchmark.tasks import BenchmarkTask, TaskRegistry
+from ai_dev_tools.benchmark.config import BenchmarkConfig, HardwareProfile, ModelInstance, OutputFormat
+from ai_dev_tools.benchmark.execution import ExecutionEngine
+from ai_dev_tools.benchmark.runner import BenchmarkRunner as ComparisonRunner
+from ai_dev_tools.benchmark.tasks import BenchmarkTask, TaskApproach, TaskRegistry
+from ai_dev_tools.cli import benchmark_cli
 
 
 class TestBenchmarkResult:
@@ -199,6 +205,27 @@ class TestBenchmarkRunner:
             assert result.status == "completed"
             assert result.error_message is None
     
+    @pytest.mark.asyncio
+    async def test_runner_shares_engine_across_runs(self, benchmark_runner):
+        """Test runs inside the runner's context reuse one execution engine."""
+        mock_engine = AsyncMock()
+        mock_engine.execute_benchmark.return_value = {"overall_metrics": {}, "comparison_metrics": {}}
+        
+        with patch('ai_dev_tools.benchmark.core.ExecutionEngine') as mock_engine_class:
+            mock_engine_class.return_value.__aenter__.return_value = mock_engine
+            
+            async with benchmark_runner:
+                await benchmark_runner.run_quick_benchmark(profile="light", tasks=["task1"], sample_size=1)
+                await benchmark_runner.run_quick_benchmark(profile="medium", tasks=["task1"], sample_size=1)
+            
+            assert mock_engine_class.call_count == 1
+            assert mock_engine.execute_benchmark.call_count == 2
+            mock_engine_class.return_value.__aexit__.assert_awaited_once()
+            
+            # Outside the context each run opens its own engine again
+            await benchmark_runner.run_quick_benchmark(profile="light", tasks=["task1"], sample_size=1)
+            assert mock_engine_class.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_run_quick_benchmark_failure(self, benchmark_runner):
         """Test quick benchmark run with failure."""
@@ -555,4 +582,310 @@ class TestIntegration:
                     assert result.tasks_executed == 1
                     assert result.success_rate == 1.0
                     assert result.token_reduction_percent == 10.0
-                    assert result.time_reduction_percent == 20.0
\ No newline at end of file
+                    assert result.time_reduction_percent == 20.0
+
+class TestExecutionEngine:
+    """Test ExecutionEngine profile lifecycle."""
+    
+    @pytest.mark.asyncio
+    async def test_engines_sharing_a_config_keep_their_own_semaphores(self):
+        """Test request limiters stay per engine and are dropped even if teardown fails."""
+        config = BenchmarkConfig._create_default_config()
+        engines = [ExecutionEngine(config), ExecutionEngine(config)]
+        for engine in engines:
+            engine.orchestrator = Mock()
+            engine.orchestrator.wait_for_instances = AsyncMock(side_effect=lambda instances, max_wait: instances)
+            await engine.start_profile(HardwareProfile.LIGHT)
+        
+        instance = config.get_profile_instances(HardwareProfile.LIGHT)[0]
+        first, second = (engine._semaphores[id(instance)] for engine in engines)
+        assert first is not second
+        
+        engines[0].orchestrator.down.side_effect = RuntimeError("compose down failed")
+        with pytest.raises(RuntimeError):
+            await engines[0].stop_profile(HardwareProfile.LIGHT)
+        
+        assert id(instance) not in engines[0]._semaphores
+        assert engines[1]._semaphores[id(instance)] is second
+
+    @staticmethod
+    def mock_session(payload=None, error=None):
+        """Create a mock HTTP session answering Ollama requests with a payload or an error."""
+        session = MagicMock()
+        session.close = AsyncMock()
+        if error is not None:
+            session.post.side_effect = error
+        else:
+            response = Mock(status=200)
+            response.json = AsyncMock(return_value=payload)
+            session.post.return_value.__aenter__.return_value = response
+        return session
+    
+    @staticmethod
+    async def run_tools_sample(config, session, sample_num=0):
+        """Run one TOOLS sample of a task on a fresh engine using the given session."""
+        task = TaskRegistry().get_task("safety_assessment")
+        instance = config.get_profile_instances(HardwareProfile.LIGHT)[0]
+        async with ExecutionEngine(config) as engine:
+            await engine._session.close()
+            engine._session = session
+            engine._semaphores[id(instance)] = asyncio.Semaphore(1)
+            result = await engine.execute_task_tools(task, instance, sample_num)
+            await engine._flush_response_cache()
+        return result
+    
+    @pytest.mark.asyncio
+    async def test_response_cache_replays_responses_with_their_duration(self, tmp_path):
+        """Test a cache miss stores the response and a later hit replays it with its measured duration."""
+        config = BenchmarkConfig._create_default_config().model_copy(
+            update={"response_cache_path": tmp_path / "responses.sqlite"}
+        )
+        payload = {"response": "safe", "prompt_eval_count": 12, "eval_count": 34}
+        
+        missed = await self.run_tools_sample(config, self.mock_session(payload))
+        assert missed.status.value == "completed"
+        assert "cached" not in missed.metadata
+        
+        offline = self.mock_session(error=AssertionError("cache hit expected"))
+        hit = await self.run_tools_sample(config, offline)
+        
+        offline.post.assert_not_called()
+        assert hit.status.value == "completed"
+        assert hit.metadata["cached"] is True
+        assert (hit.response, hit.input_tokens, hit.output_tokens) == ("safe", 12, 34)
+        
+        row = sqlite3.connect(str(tmp_path / "responses.sqlite")).execute("SELECT duration FROM responses").fetchone()
+        assert hit.duration == row[0]
+        assert hit.end_time == hit.start_time + hit.duration
+        
+        # Other samples have their own entries, so they are not served by sample 0
+        other_sample = await self.run_tools_sample(config, self.mock_session(payload), sample_num=1)
+        assert "cached" not in other_sample.metadata
+    
+    @pytest.mark.asyncio
+    async def test_no_response_cache_queries_every_time(self, tmp_path):
+        """Test without a cache path every sample is sent to the model and nothing is written."""
+        config = BenchmarkConfig._create_default_config()
+        assert config.response_cache_path is None
+        session = self.mock_session({"response": "safe", "prompt_eval_count": 1, "eval_count": 1})
+        
+        for _ in range(2):
+            result = await self.run_tools_sample(config, session)
+            assert "cached" not in result.metadata
+        
+        assert session.post.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_execute_benchmark_releases_task_results(self):
+        """Test a finished benchmark returns serialized results without keeping the TaskResult objects."""
+        config = BenchmarkConfig._create_default_config()
+        instance = config.get_profile_instances(HardwareProfile.LIGHT)[0]
+        task = TaskRegistry().get_task("safety_assessment")
+        engine = ExecutionEngine(config)
+        engine.start_profile = AsyncMock(return_value=[instance])
+        
+        results = await engine.execute_benchmark(
+            [task], HardwareProfile.LIGHT, sample_size=2, approaches=[TaskApproach.BASELINE]
+        )
+        
+        assert len(results["results"]) == 2
+        assert results["overall_metrics"]["completed_tasks"] == 2
+        assert engine.metrics.task_results == []
+    
+    @pytest.mark.asyncio
+    async def test_iter_batch_starts_each_profile_once_and_leaves_running_profiles(self):
+        """Test batch configurations are grouped by profile and only profiles the batch started are stopped."""
+        config = BenchmarkConfig._create_default_config()
+        engine = ExecutionEngine(config)
+        
+        async def start_profile(profile):
+            engine._active_profiles.add(profile)
+            engine._ready_instances[profile] = config.get_profile_instances(profile)
+            return engine._ready_instances[profile]
+        
+        async def stop_profile(profile):
+            engine._active_profiles.discard(profile)
+            engine._ready_instances.pop(profile, None)
+        
+        engine.start_profile = AsyncMock(side_effect=start_profile)
+        engine.stop_profile = AsyncMock(side_effect=stop_profile)
+        engine.execute_task_samples = AsyncMock(return_value=[])
+        await start_profile(HardwareProfile.MEDIUM)
+        
+        configs = [
+            {"name": "light-1", "profile": "light", "sample_size": 1},
+            {"name": "medium-1", "profile": "medium", "sample_size": 1},
+            {"name": "light-2", "profile": "light", "sample_size": 1},
+        ]
+        results = await engine.execute_batch(configs, [TaskRegistry().get_task("safety_assessment")])
+        
+        assert [result["batch_info"]["name"] for result in results] == ["light-1", "light-2", "medium-1"]
+        engine.start_profile.assert_awaited_once_with(HardwareProfile.LIGHT)
+        engine.stop_profile.assert_awaited_once_with(HardwareProfile.LIGHT)
+        assert engine.get_active_profiles() == {HardwareProfile.MEDIUM}
+    
+    def test_no_cache_option_disables_the_response_cache(self, tmp_path):
+        """Test --no-cache clears the configured response cache before the runner is built."""
+        config = BenchmarkConfig._create_default_config().model_copy(
+            update={"response_cache_path": tmp_path / "responses.sqlite"}
+        )
+        
+        with patch('ai_dev_tools.cli.benchmark_cli.load_config', return_value=config), \
+             patch('ai_dev_tools.cli.benchmark_cli.install_event_loop_policy'), \
+             patch('ai_dev_tools.cli.benchmark_cli.BenchmarkRunner') as mock_runner_class:
+            mock_runner_class.return_value.list_available_profiles.return_value = []
+            result = CliRunner().invoke(benchmark_cli.benchmark, ["--no-cache", "list-profiles"])
+        
+        assert result.exit_code == 0, result.output
+        assert mock_runner_class.call_args.args[0].response_cache_path is None
+
+
+class TestStreamedResponses:
+    """Test parsing of streamed Ollama responses."""
+    
+    @staticmethod
+    async def read(*lines):
+        """Parse NDJSON lines as a streamed response."""
+        async def content():
+            for line in lines:
+                yield line
+        
+        engine = ExecutionEngine(BenchmarkConfig._create_default_config())
+        return await engine._read_streamed_response(Mock(content=content()))
+    
+    @pytest.mark.asyncio
+    async def test_fragments_are_joined_with_final_counts(self):
+        """Test response fragments are joined and token counts come from the done message."""
+        result = await self.read(
+            b'{"response": "Looks ", "done": false}\n',
+            b"\n",
+            b'{"response": "safe", "done": false}\n',
+            b'{"response": "", "done": true, "prompt_eval_count": 12, "eval_count": 34}\n',
+        )
+        
+        assert result["response"] == "Looks safe"
+        assert (result["prompt_eval_count"], result["eval_count"]) == (12, 34)
+    
+    @pytest.mark.asyncio
+    async def test_error_line_raises(self):
+        """Test an error message in the stream fails the request."""
+        with pytest.raises(RuntimeError, match="model not found"):
+            await self.read(b'{"response": "Looks ", "done": false}\n', b'{"error": "model not found"}\n')
+    
+    @pytest.mark.asyncio
+    async def test_truncated_stream_raises(self):
+        """Test a stream ending without its done message is not taken as a successful empty reply."""
+        with pytest.raises(RuntimeError, match="Stream ended"):
+            await self.read(b'{"response": "Looks ", "done": false}\n')
+
+
+class TestComparisonRunner:
+    """Test comparison benchmarks in the benchmark CLI runner."""
+    
+    @staticmethod
+    def make_runner(config):
+        with patch('ai_dev_tools.benchmark.runner.ReportGenerator'):
+            return ComparisonRunner(config)
+    
+    @pytest.mark.asyncio
+    async def test_profiles_sharing_instances_run_sequentially(self):
+        """Test profiles sharing an instance run one after another on one engine."""
+        config = BenchmarkConfig._create_default_config().model_copy(update={"max_concurrent_profiles": 2})
+        runner = self.make_runner(config)
+        
+        with patch('ai_dev_tools.benchmark.runner.ExecutionEngine') as mock_engine_class:
+            mock_engine = AsyncMock()
+            mock_engine.execute_benchmark.return_value = {"overall_metrics": {}, "comparison_metrics": {}}
+            mock_engine_class.return_value.__aenter__.return_value = mock_engine
+            
+            results = await runner.run_comparison_benchmark(
+                [HardwareProfile.LIGHT, HardwareProfile.MEDIUM], task_ids=["safety_assessment"]
+            )
+        
+        assert mock_engine_class.call_count == 1
+        mock_engine.prewarm.assert_not_awaited()
+        assert [call.kwargs["profile"] for call in mock_engine.execute_benchmark.await_args_list] == [
+            HardwareProfile.LIGHT,
+            HardwareProfile.MEDIUM,
+        ]
+        assert set(results["results_by_profile"]) == {"light", "medium"}
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_profile_failure_raises_original_exception(self):
+        """Test a failing profile run concurrently raises its own exception, not a group."""
+        config = BenchmarkConfig(
+            profiles={
+                HardwareProfile.LIGHT: [ModelInstance(name="small", model="llama3.2:1b", port=11434)],
+                HardwareProfile.MEDIUM: [ModelInstance(name="medium", model="llama3.2:3b", port=11435)],
+                HardwareProfile.HEAVY: [ModelInstance(name="large", model="llama3.1:8b", port=11436)],
+            },
+            max_concurrent_profiles=2,
+        )
+        runner = self.make_runner(config)
+        
+        with patch('ai_dev_tools.benchmark.runner.ExecutionEngine') as mock_engine_class:
+            mock_engine = AsyncMock()
+            mock_engine.execute_benchmark.side_effect = RuntimeError("profile failed")
+            mock_engine_class.return_value.__aenter__.return_value = mock_engine
+            
+            with pytest.raises(RuntimeError, match="profile failed"):
+                await runner.run_comparison_benchmark(
+                    [HardwareProfile.LIGHT, HardwareProfile.HEAVY], task_ids=["safety_assessment"]
+                )
+        
+        assert mock_engine_class.call_count == 2
+        assert mock_engine.prewarm.await_count == 2
+
+
+class TestCustomBatchRunner:
+    """Test custom batches streaming their JSON report."""
+    
+    @staticmethod
+    def make_result(name):
+        """Create a configuration result with per-sample results."""
+        return {
+            "batch_info": {"name": name, "profile": "light"},
+            "results": [{"task_id": "safety_assessment", "sample_num": 0}],
+            "comparison_metrics": {"token_reduction_percent": 10.0, "time_reduction_percent": 20.0},
+        }
+    
+    async def run_batch(self, tmp_path, batch_results):
+        """Run a custom batch whose engine yields the given results, raising any exception instances."""
+        config = BenchmarkConfig._create_default_config().model_copy(update={"output_directory": tmp_path})
+        runner = ComparisonRunner(config)
+        
+        async def iter_batch(configurations, tasks):
+            for result in batch_results:
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        
+        with patch('ai_dev_tools.benchmark.runner.ExecutionEngine') as mock_engine_class:
+            mock_engine_class.return_value.__aenter__.return_value.iter_batch = iter_batch
+            return await runner.run_custom_batch(
+                [{"name": "a", "profile": "light"}, {"name": "b", "profile": "light"}],
+                task_ids=["safety_assessment"],
+                output_format=OutputFormat.JSON,
+                output_filename="batch",
+            )
+    
+    @pytest.mark.asyncio
+    async def test_results_are_streamed_to_the_report(self, tmp_path):
+        """Test each configuration reaches the report while only its metrics are returned."""
+        results = await self.run_batch(tmp_path, [self.make_result("a"), self.make_result("b")])
+        
+        report = json.loads((tmp_path / "batch.json").read_text())
+        assert [r["batch_info"]["name"] for r in report["batch_results"]] == ["a", "b"]
+        assert all(r["results"] for r in report["batch_results"])
+        assert [r["batch_info"]["name"] for r in results] == ["a", "b"]
+        assert all("results" not in r and r["comparison_metrics"] for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_report_is_completed_when_a_configuration_raises(self, tmp_path):
+        """Test a failing batch still leaves a valid report of the configurations that finished."""
+        with pytest.raises(RuntimeError, match="containers failed"):
+            await self.run_batch(tmp_path, [self.make_result("a"), RuntimeError("containers failed")])
+        
+        report = json.loads((tmp_path / "batch.json").read_text())
+        assert [r["batch_info"]["name"] for r in report["batch_results"]] == ["a"]
+
@@ -5,8 +5,10 @@ Tests for benchmark metrics collection and analysis.
 import pytest
 import asyncio
 import statistics
+import time
 from unittest.mock import Mock, AsyncMock
 
+from ai_dev_tools.benchmark import metrics as metrics_module
 from ai_dev_tools.benchmark.metrics import (
     BenchmarkMetrics,
     ComparisonMetrics,
@@ -163,8 +165,7 @@ class TestMetricsCollector:
         assert collector.end_time is not None
         assert collector.end_time >= collector.start_time
     
-    @pytest.mark.asyncio
-    async def test_add_task_result(self):
+    def test_add_task_result(self):
         """Test adding task results."""
         collector = MetricsCollector()
         
@@ -178,19 +179,18 @@ class TestMetricsCollector:
         
         result.mark_completed("Test response", 100, 200)
         
-        await collector.add_task_result(result)
+        collector.add_task_result(result)
         
         assert len(collector.task_results) == 1
         assert collector.task_results[0] == result
     
-    @pytest.mark.asyncio
-    async def test_record_retry(self):
+    def test_record_retry(self):
         """Test recording retry attempts."""
         collector = MetricsCollector()
         
-        await collector.record_retry("task_1")
-        await collector.record_retry("task_1")
-        await collector.record_retry("task_2")
+        collector.record_retry("task_1")
+        collector.record_retry("task_1")
+        collector.record_retry("task_2")
         
         assert collector.retry_counts["task_1"] == 2
         assert collector.retry_counts["task_2"] == 1
@@ -272,6 +272,141 @@ class TestMetricsCollector:
         assert metrics.total_output_tokens == 10 * 150
         assert metrics.average_tokens_per_task == 250.0
     
+    def test_calculate_metrics_duration_statistics(self):
+        """Test duration statistics and percentiles."""
+        collector = MetricsCollector()
+        
+        durations = [float(d) for d in range(1, 10)]
+        for i, duration in enumerate(durations):
+            result = TaskResult(
+                task_id=f"task_{i}",
+                approach=TaskApproach.BASELINE,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=duration
+            )
+            collector.task_results.append(result)
+        
+        metrics = collector.calculate_metrics()
+        
+        assert metrics.total_duration == sum(durations)
+        assert metrics.average_task_duration == statistics.mean(durations)
+        assert metrics.min_duration == 1.0
+        assert metrics.max_duration == 9.0
+        assert metrics.duration_std == pytest.approx(statistics.stdev(durations))
+        assert metrics.percentiles["p25"] == pytest.approx(statistics.quantiles(durations, n=4)[0])
+        assert metrics.percentiles["p50"] == statistics.median(durations)
+        assert metrics.percentiles["p75"] == pytest.approx(statistics.quantiles(durations, n=4)[2])
+        assert set(metrics.percentiles) == {"p25", "p50", "p75", "p90", "p95", "p99"}
+
+    def test_calculate_metrics_duration_std_large_offset(self):
+        """Test duration deviation stays accurate for values far from zero."""
+        collector = MetricsCollector()
+
+        durations = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+        for i, duration in enumerate(durations):
+            result = TaskResult(
+                task_id=f"task_{i}",
+                approach=TaskApproach.BASELINE,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=duration
+            )
+            collector.task_results.append(result)
+
+        metrics = collector.calculate_metrics()
+
+        assert metrics.average_task_duration == pytest.approx(statistics.mean(durations))
+        assert metrics.duration_std == pytest.approx(statistics.stdev(durations))
+
+    def test_calculate_metrics_percentiles_without_numpy(self, monkeypatch):
+        """Test nearest-rank percentiles are used when NumPy is unavailable."""
+        monkeypatch.setattr(metrics_module, "np", None)
+        collector = MetricsCollector()
+
+        for i in range(1, 11):
+            result = TaskResult(
+                task_id=f"task_{i}",
+                approach=TaskApproach.BASELINE,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=float(i)
+            )
+            collector.task_results.append(result)
+
+        metrics = collector.calculate_metrics()
+
+        assert metrics.percentiles == {"p25": 3.0, "p50": 5.0, "p75": 8.0, "p90": 9.0, "p95": 10.0, "p99": 10.0}
+
+    def test_calculate_metrics_cached(self):
+        """Test metrics are cached until results change."""
+        collector = MetricsCollector()
+        collector.start_time = 1000.0
+        collector.end_time = 1010.0
+
+        def make_result(task_id):
+            return TaskResult(
+                task_id=task_id,
+                approach=TaskApproach.BASELINE,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=1.0
+            )
+
+        collector.add_task_result(make_result("task_1"))
+        metrics = collector.calculate_metrics()
+        assert collector.calculate_metrics() is metrics
+
+        collector.add_task_result(make_result("task_2"))
+        updated = collector.calculate_metrics()
+        assert updated is not metrics
+        assert updated.total_tasks == 2
+
+    def test_get_live_percentiles(self):
+        """Test live percentiles track the exact percentiles."""
+        collector = MetricsCollector()
+
+        for i in range(1, 101):
+            result = TaskResult(
+                task_id=f"task_{i}",
+                approach=TaskApproach.BASELINE,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=float(i)
+            )
+            collector.add_task_result(result)
+
+        exact = collector.calculate_metrics().percentiles
+        live = collector.get_live_percentiles()
+
+        assert set(live) == set(exact)
+        for name, value in exact.items():
+            assert live[name] == pytest.approx(value, rel=0.05)
+        assert collector.get_live_percentiles(TaskApproach.BASELINE) == live
+        assert collector.get_live_percentiles(TaskApproach.TOOLS) == {}
+
+        # Results added after a poll are folded in by the next one
+        for i in range(101, 201):
+            collector.add_task_result(TaskResult(
+                task_id=f"task_{i}",
+                approach=TaskApproach.TOOLS,
+                model_instance="test_model",
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0,
+                duration=float(i)
+            ))
+
+        exact = collector.calculate_metrics().percentiles
+        live = collector.get_live_percentiles()
+        for name, value in exact.items():
+            assert live[name] == pytest.approx(value, rel=0.05)
+        assert collector.get_live_percentiles(TaskApproach.TOOLS)["p50"] == pytest.approx(150.5, rel=0.05)
+
     def test_calculate_metrics_with_filter(self):
         """Test calculating metrics with approach filter."""
         collector = MetricsCollector()
@@ -356,7 +491,107 @@ class TestMetricsCollector:
         assert comparison.baseline_metrics.total_tasks == 5
         assert comparison.tools_metrics.total_tasks == 5
         assert comparison.baseline_metrics.total_tokens > comparison.tools_metrics.total_tokens
-    
+        assert comparison.baseline_metrics == collector.calculate_metrics(TaskApproach.BASELINE)
+        assert comparison.tools_metrics == collector.calculate_metrics(TaskApproach.TOOLS)
+        assert comparison.token_reduction_percent == pytest.approx((3000 - 2000) / 3000 * 100.0)
+        assert comparison.time_reduction_percent == pytest.approx((50.0 - 30.0) / 50.0 * 100.0)
+        baseline_score = comparison.baseline_metrics.efficiency_score
+        tools_score = comparison.tools_metrics.efficiency_score
+        assert comparison.efficiency_improvement_percent == pytest.approx(
+            (tools_score - baseline_score) / baseline_score * 100.0
+        )
+
+    def test_calculate_comparison_metrics_without_baseline(self):
+        """Test improvement percentages are zero without baseline results."""
+        collector = MetricsCollector()
+
+        result = TaskResult(
+            task_id="tools_task",
+            approach=TaskApproach.TOOLS,
+            model_instance="test_model",
+            status=TaskStatus.COMPLETED,
+            start_time=1000.0
+        )
+        result.mark_completed("Tools response", 150, 250)
+        collector.task_results.append(result)
+
+        comparison = collector.calculate_comparison_metrics()
+
+        assert comparison.token_reduction_percent == 0.0
+        assert comparison.time_reduction_percent == 0.0
+        assert comparison.efficiency_improvement_percent == 0.0
+
+    def test_calculate_comparison_statistics(self):
+        """Test significance and confidence interval estimates."""
+        collector = MetricsCollector()
+        baseline_durations = [9.0, 10.0, 11.0, 12.0]
+        tools_durations = [5.0, 6.0, 7.0]
+
+        for approach, durations in (
+            (TaskApproach.BASELINE, baseline_durations),
+            (TaskApproach.TOOLS, tools_durations),
+        ):
+            for i, duration in enumerate(durations):
+                result = TaskResult(
+                    task_id=f"task_{i}",
+                    approach=approach,
+                    model_instance="test_model",
+                    status=TaskStatus.COMPLETED,
+                    start_time=1000.0,
+                    duration=duration
+                )
+                collector.task_results.append(result)
+
+        comparison = collector.calculate_comparison_metrics()
+
+        baseline_std = statistics.stdev(baseline_durations)
+        tools_std = statistics.stdev(tools_durations)
+        difference = statistics.mean(baseline_durations) - statistics.mean(tools_durations)
+        t_stat = difference / (baseline_std**2 + tools_std**2) ** 0.5
+        margin = 1.96 * (baseline_std**2 / 4 + tools_std**2 / 3) ** 0.5
+
+        assert comparison.sample_size == 3
+        assert comparison.statistical_significance == pytest.approx(max(0.0, 1.0 - t_stat / 5.0))
+        assert comparison.confidence_interval["difference"] == pytest.approx(difference)
+        assert comparison.confidence_interval["lower_bound"] == pytest.approx(difference - margin)
+        assert comparison.confidence_interval["upper_bound"] == pytest.approx(difference + margin)
+
+    def test_calculate_comparison_statistics_degenerate(self):
+        """Test significance and confidence intervals for constant or tiny samples."""
+        collector = MetricsCollector()
+
+        for approach, duration in ((TaskApproach.BASELINE, 10.0), (TaskApproach.TOOLS, 6.0)):
+            for i in range(3):
+                result = TaskResult(
+                    task_id=f"task_{i}",
+                    approach=approach,
+                    model_instance="test_model",
+                    status=TaskStatus.COMPLETED,
+                    start_time=1000.0,
+                    duration=duration
+                )
+                collector.task_results.append(result)
+
+        comparison = collector.calculate_comparison_metrics()
+
+        assert comparison.statistical_significance == 0.0
+        assert comparison.confidence_interval == {"lower_bound": 4.0, "upper_bound": 4.0, "difference": 4.0}
+
+        collector.task_results = [r for r in collector.task_results if r.approach is TaskApproach.BASELINE]
+        collector.task_results.append(TaskResult(
+            task_id="tools_task",
+            approach=TaskApproach.TOOLS,
+            model_instance="test_model",
+            status=TaskStatus.COMPLETED,
+            start_time=1000.0,
+            duration=6.0
+        ))
+
+        comparison = collector.calculate_comparison_metrics()
+
+        assert comparison.statistical_significance == 0.0
+        assert comparison.confidence_interval == {}
+
     def test_get_metrics_by_task(self):
         """Test getting metrics broken down by task."""
         collector = MetricsCollector()
@@ -413,6 +648,95 @@ class TestMetricsCollector:
             assert metrics.total_tasks == 4
             assert metrics.completed_tasks == 4
             assert metrics.total_tokens == 4 * 300
+
+    def test_group_results_cached(self):
+        """Test task and model groupings are cached until results change."""
+        collector = MetricsCollector()
+
+        def make_result(task_id, model_name):
+            result = TaskResult(
+                task_id=task_id,
+                approach=TaskApproach.TOOLS,
+                model_instance=model_name,
+                status=TaskStatus.COMPLETED,
+                start_time=1000.0
+            )
+            result.mark_completed("Response", 10, 20)
+            return result
+
+        collector.add_task_result(make_result("task_1", "model_a"))
+        groups = collector._group_results()
+        assert collector._group_results() is groups
+
+        collector.add_task_result(make_result("task_2", "model_b"))
+        assert set(collector.get_metrics_by_task()) == {"task_1", "task_2"}
+        assert set(collector.get_metrics_by_model()) == {"model_a", "model_b"}
+
+    def test_export_metrics(self):
+        """Test exporting all metrics in serialized form."""
+        collector = MetricsCollector()
+        
+        for approach in [TaskApproach.BASELINE, TaskApproach.TOOLS]:
+            for task_id in ["task_a", "task_b"]:
+                result = TaskResult(
+                    task_id=task_id,
+                    approach=approach,
+                    model_instance="test_model",
+                    status=TaskStatus.COMPLETED,
+                    start_time=1000.0
+                )
+                result.mark_completed("Response", 100, 150)
+                collector.task_results.append(result)
+        collector.start_time = 1000.0
+        collector.end_time = 1010.0
+        
+        exported = collector.export_metrics()
+        
+        assert exported["overall_metrics"] == collector.calculate_metrics().to_dict()
+        assert exported["comparison_metrics"]["sample_size"] == 2
+        assert set(exported["metrics_by_task"]) == {"task_a", "task_b"}
+        assert exported["metrics_by_task"]["task_a"]["total_tasks"] == 2
+        assert exported["metrics_by_model"]["test_model"]["total_tokens"] == 4 * 250
+    
+    def test_export_metrics_plain_types(self):
+        """Test exported metrics contain only plain JSON types."""
+        collector = MetricsCollector()
+        collector.start_time = 1000.0
+        collector.end_time = 1100.0
+
+        for approach, durations in ((TaskApproach.BASELINE, [9.0, 10.0, 12.0]), (TaskApproach.TOOLS, [5.0, 6.0, 8.0])):
+            for i, duration in enumerate(durations):
+                result = TaskResult(
+                    task_id=f"task_{i}",
+                    approach=approach,
+                    model_instance="test_model",
+                    status=TaskStatus.COMPLETED,
+                    start_time=1000.0
+                )
+                result.mark_completed("Response", 10, 20)
+                result.duration = duration
+                collector.add_task_result(result)
+
+        def assert_plain(value):
+            if isinstance(value, dict):
+                assert type(value) is dict
+                for item in value.values():
+                    assert_plain(item)
+            else:
+                assert type(value) in (int, float, str)
+
+        assert_plain(collector.export_metrics())
+
+    def test_classify_error(self):
+        """Test error classification keeps keyword priority."""
+        collector = MetricsCollector()
+        
+        assert collector._classify_error("Request timeout") == "timeout"
+        assert collector._classify_error("Connection refused") == "connection"
+        assert collector._classify_error("HTTP 500: model not loaded") == "http"
+        assert collector._classify_error("Invalid JSON body") == "json"
+        assert collector._classify_error("connection timeout") == "timeout"
+        assert collector._classify_error("Something else") == "unknown"
     
     def test_reset(self):
         """Test resetting the metrics collector."""
@@ -456,7 +780,7 @@ class TestMetricsCollector:
             start_time=1000.0
         )
         collector.task_results.append(result)
-        collector.start_time = 1000.0
+        collector.start_time = time.monotonic() - 1.0
         collector.concurrent_tasks = 2
         collector.max_concurrent = 3
         collector.retry_counts["task_1"] = 2
@@ -469,6 +793,26 @@ class TestMetricsCollector:
         assert summary["max_concurrent"] == 3
         assert summary["total_retries"] == 2
         assert summary["collection_duration"] > 0
+    
+    def test_get_summary_without_tdigest_skips_percentiles(self, monkeypatch):
+        """Test the summary does not fall back to an exact percentile calculation."""
+        collector = MetricsCollector()
+        collector.task_results.append(TaskResult(
+            task_id="test_task",
+            approach=TaskApproach.BASELINE,
+            model_instance="test_model",
+            status=TaskStatus.COMPLETED,
+            start_time=1000.0,
+            duration=1.0
+        ))
+        
+        monkeypatch.setattr(metrics_module, "TDigest", None)
+        monkeypatch.setattr(collector, "calculate_metrics", Mock())
+        
+        summary = collector.get_summary()
+        
+        assert "duration_percentiles" not in summary
+        collector.calculate_metrics.assert_not_called()
 
 
 if __name__ == "__main__":
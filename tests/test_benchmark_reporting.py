@@ -7,8 +7,12 @@ Tests the new visualization and reporting features.
 import pytest
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
+import io
 import json
+import statistics
+from datetime import datetime
 
+from ai_dev_tools.benchmark import reporting
 from ai_dev_tools.benchmark.reporting import ReportGenerator
 from ai_dev_tools.benchmark.config import OutputFormat
 
@@ -114,6 +118,32 @@ class TestReportGenerator:
             assert parsed_content["benchmark_info"]["profile"] == "medium"
             assert parsed_content["overall_metrics"]["success_rate"] == 1.0
     
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_report_serialization(self, report_generator, monkeypatch, tmp_path, use_orjson):
+        """Test JSON reports match the json module with and without orjson."""
+        if not use_orjson:
+            monkeypatch.setattr(reporting, "orjson", None)
+
+        data = {
+            "benchmark_info": {"profile": "medium", "timestamp": datetime(2024, 1, 1, 12, 0)},
+            "results": [{"task_name": "naïve", "tokens": 1500, "ratio": 1e-05}],
+            "by_id": {1: "x"},
+        }
+        content = report_generator._generate_json_report(data)
+
+        assert json.loads(content) == json.loads(json.dumps(data, indent=2, default=str))
+        assert content.startswith('{\n  "benchmark_info"')
+
+        # Streaming to a file writes the same document
+        stream = io.StringIO()
+        report_generator._write_json_report(data, stream)
+        assert stream.getvalue() == content
+        report_file = tmp_path / "report.json"
+        report_generator._write_file(report_file, report_generator._write_json_report, data)
+        assert report_file.read_bytes() == content.encode("utf-8")
+        # Integers orjson cannot encode fall back to the json module
+        assert json.loads(report_generator._generate_json_report({"tokens": 2**70})) == {"tokens": 2**70}
+
     def test_generate_markdown_report(self, report_generator, sample_benchmark_data):
         """Test generating Markdown format report."""
         with patch("builtins.open", mock_open()) as mock_file:
@@ -306,6 +336,10 @@ class TestReportGenerator:
         # Test stable trend
         stable_trend = report_generator._calculate_trend([15.0, 15.05, 15.02])
         assert stable_trend == "Stable"
+
+        # Middle runs count, not just the endpoints
+        assert report_generator._calculate_trend([10.0, 12.0, 14.0, 16.0, 18.0, 9.5]) == "Improving ↗"
+        assert report_generator._calculate_trend([1e9, 1e9 + 1, 1e9 + 2]) == "Improving ↗"
         
         # Test insufficient data
         no_trend = report_generator._calculate_trend([10.0])
@@ -400,7 +434,49 @@ class TestReportGenerator:
         assert stats["token_reduction"]["mean"] == 30.0  # (25.0 + 35.0) / 2
         assert stats["time_reduction"]["mean"] == 35.0   # (30.0 + 40.0) / 2
         assert stats["efficiency_improvement"]["mean"] == 17.5  # (15.0 + 20.0) / 2
-    
+
+    @pytest.mark.parametrize("batch_size", [0, 1, 2])
+    def test_batch_report_writer(self, report_generator, sample_benchmark_data, batch_size):
+        """Test a streamed batch report matches the one-shot JSON report."""
+        batch_results = [sample_benchmark_data, {"batch_info": {"name": "bad"}, "error": "boom", "success": False}]
+        batch_results = batch_results[:batch_size]
+
+        stream = io.StringIO()
+        with patch("ai_dev_tools.benchmark.reporting.time.time", return_value=1234567890.0):
+            writer = reporting.BatchReportWriter(stream)
+            for result in batch_results:
+                writer.add(result)
+            writer.close()
+            expected = report_generator._generate_json_report(
+                report_generator._aggregate_batch_data(batch_results)
+            )
+
+        assert stream.getvalue() == expected
+        json.loads(stream.getvalue())
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_aggregate_batch_data_statistics(self, report_generator, sample_benchmark_data, monkeypatch, use_numpy):
+        """Test batch statistics with and without NumPy."""
+        if not use_numpy:
+            monkeypatch.setattr(reporting, "np", None)
+
+        reductions = [25.0, 35.0, 10.0]
+        batch_results = [
+            {
+                **sample_benchmark_data,
+                "comparison_metrics": {**sample_benchmark_data["comparison_metrics"], "token_reduction_percent": value},
+            }
+            for value in reductions
+        ]
+
+        stats = report_generator._aggregate_batch_data(batch_results)["aggregated_stats"]["token_reduction"]
+
+        assert stats["mean"] == pytest.approx(statistics.mean(reductions))
+        assert stats["median"] == 25.0
+        assert stats["std"] == pytest.approx(statistics.stdev(reductions))
+        assert stats["min"] == 10.0
+        assert stats["max"] == 35.0
+
     def test_create_summary_table(self, report_generator, sample_benchmark_data):
         """Test creating summary table."""
         batch_results = [
@@ -452,6 +528,19 @@ class TestReportGenerator:
             assert generator.output_dir == Path("/custom/output/path")
             mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
     
+    def test_output_dir_created_once(self, tmp_path, sample_benchmark_data):
+        """Test generators share created output directories and recreate removed ones."""
+        output_dir = tmp_path / "reports"
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            ReportGenerator(output_dir)
+            generator = ReportGenerator(output_dir)
+
+        assert mock_mkdir.call_count == 1
+
+        output_dir.rmdir()
+        result_path = generator.generate_report(sample_benchmark_data, OutputFormat.JSON, "report")
+        assert Path(result_path).is_file()
+
     def test_auto_filename_generation(self, report_generator, sample_benchmark_data):
         """Test automatic filename generation."""
         with patch("builtins.open", mock_open()) as mock_file:
@@ -467,6 +556,24 @@ class TestReportGenerator:
                 assert "benchmark_medium_20240101_120000.json" in result_path
                 mock_file.assert_called_once()
     
+    def test_report_timestamp_shared(self, report_generator, sample_benchmark_data):
+        """Test the filename and report body use the same timestamp."""
+        formats = {"%Y%m%d_%H%M%S": "20240101_120000", "%Y-%m-%d %H:%M:%S": "2024-01-01 12:00:00"}
+
+        with patch("builtins.open", mock_open()) as mock_file:
+            with patch("ai_dev_tools.benchmark.reporting.datetime") as mock_datetime:
+                mock_datetime.now.return_value.strftime.side_effect = formats.__getitem__
+
+                result_path = report_generator.generate_report(sample_benchmark_data, OutputFormat.MARKDOWN)
+
+                mock_datetime.now.assert_called_once()
+
+            handle = mock_file()
+            written_content = "".join(call.args[0] for call in handle.write.call_args_list)
+
+        assert result_path.endswith("benchmark_medium_20240101_120000.markdown")
+        assert "**Generated:** 2024-01-01 12:00:00" in written_content
+
     def test_unsupported_format_error(self, report_generator, sample_benchmark_data):
         """Test error handling for unsupported format."""
         with pytest.raises(ValueError, match="Unsupported format"):
@@ -483,6 +590,26 @@ class TestReportGenerator:
         csv_content = report_generator._generate_csv_report(empty_data)
         assert csv_content == "No results found"
     
+    def test_csv_report_escaping(self, report_generator):
+        """Test CSV generation quotes embedded separators and blanks missing values."""
+        data = {
+            "results": [
+                {
+                    "task_id": "task,1",
+                    "approach": "baseline",
+                    "status": "failed",
+                    "error": 'HTTP 500: "bad"',
+                    "response": "ignored",
+                }
+            ]
+        }
+
+        csv_content = report_generator._generate_csv_report(data)
+        header, row = csv_content.splitlines()
+
+        assert header.startswith("task_id,approach,model_instance")
+        assert row == '"task,1",baseline,,failed,,,,,,,,"HTTP 500: ""bad"""'
+
     def test_minimal_data_handling(self, report_generator):
         """Test handling of minimal data structures."""
         minimal_data = {
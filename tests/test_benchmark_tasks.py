@@ -2,9 +2,12 @@
 Tests for benchmark task management system.
 """
 
+import asyncio
 import pytest
+import sys
 import time
-from unittest.mock import Mock, AsyncMock
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock, AsyncMock, patch
 
 from ai_dev_tools.benchmark.tasks import (
     BenchmarkTask,
@@ -184,6 +187,26 @@ class TestBenchmarkTask:
         assert result.sample_num == 3
         assert result.start_time > 0
 
+    def test_created_result_duration_is_monotonic(self):
+        """Test durations of created results ignore wall-clock jumps."""
+        task = BenchmarkTask(
+            task_id="test_task",
+            name="Test Task",
+            description="A test task",
+            workflow_type=WorkflowType.CONTEXT_ANALYSIS,
+            baseline_prompt="Test baseline prompt",
+            tools_prompt="Test tools prompt"
+        )
+        result = task.create_result(TaskApproach.TOOLS, "test_model")
+
+        # Wall clock stepped back an hour while the task ran
+        with patch("ai_dev_tools.benchmark.tasks.time.time", return_value=result.start_time - 3600):
+            result.mark_completed("Test response", 1, 2)
+
+        assert 0 <= result.duration < 60
+        assert result.end_time == result.start_time + result.duration
+        assert "_start_ns" not in result.to_dict()
+
 
 class TestTaskRegistry:
     """Test TaskRegistry class."""
@@ -224,6 +247,35 @@ class TestTaskRegistry:
         assert registry.get_task("custom_task") is not None
         assert registry.get_task("custom_task").name == "Custom Task"
     
+    def test_register_task_interns_expected_outputs(self):
+        """Test registered tasks share interned expected output strings and are frozen."""
+        registry = TaskRegistry()
+        level, issue = "".join(["HI", "GH"]), "".join(["ev", "al"])
+        task = BenchmarkTask(
+            task_id="interned_task",
+            name="Interned Task",
+            description="Task with expected outputs",
+            workflow_type=WorkflowType.SAFETY_CHECK,
+            baseline_prompt="Baseline prompt",
+            tools_prompt="Tools prompt",
+            expected_outputs={"risk_level": level, "issues": [issue], "matches": 2},
+        )
+        
+        issues = task.expected_outputs["issues"]
+        
+        registry.register_task(task)
+        registered = registry.get_task("interned_task")
+        
+        assert registered.expected_outputs == {"risk_level": "HIGH", "issues": ["eval"], "matches": 2}
+        assert registered.expected_outputs["risk_level"] is sys.intern("HIGH")
+        assert registered.expected_outputs["issues"][0] is sys.intern("eval")
+        with pytest.raises(FrozenInstanceError):
+            registered.timeout = 60
+        
+        # The caller's task and its values are not modified
+        assert task.expected_outputs["risk_level"] is level
+        assert task.expected_outputs["issues"] is issues and issues[0] is issue
+    
     def test_get_task(self):
         """Test getting a task by ID."""
         registry = TaskRegistry()
@@ -289,6 +341,51 @@ class TestTaskRegistry:
         assert len(registry.get_all_tasks()) == 0
         assert len(registry.list_task_ids()) == 0
     
+    def test_get_all_tasks_cached(self):
+        """Test the cached task tuple is reused until the registry changes."""
+        registry = TaskRegistry()
+
+        tasks = registry.get_all_tasks_cached()
+        assert registry.get_all_tasks_cached() is tasks
+        assert list(tasks) == registry.get_all_tasks()
+
+        task = BenchmarkTask(
+            task_id="cached_task",
+            name="Cached Task",
+            description="Task added after caching",
+            workflow_type=WorkflowType.SAFETY_CHECK,
+            baseline_prompt="Baseline prompt",
+            tools_prompt="Tools prompt",
+        )
+        registry.register_task(task)
+        assert registry.get_all_tasks_cached()[-1] == task
+
+        registry.remove_task("cached_task")
+        assert registry.get_all_tasks_cached() == tasks
+
+        registry.clear_tasks()
+        assert registry.get_all_tasks_cached() == ()
+
+    def test_workflow_index_follows_changes(self):
+        """Test workflow lookups and stats reflect registered and removed tasks."""
+        registry = TaskRegistry()
+        initial = registry.get_tasks_by_workflow(WorkflowType.SAFETY_CHECK)
+        initial_count = registry.get_task_stats()["workflow_distribution"]["safety_check"]
+
+        registry.create_custom_task(
+            task_id="indexed_task",
+            name="Indexed Task",
+            description="Task added after indexing",
+            workflow_type=WorkflowType.SAFETY_CHECK,
+            baseline_prompt="Baseline prompt",
+            tools_prompt="Tools prompt",
+        )
+        assert registry.get_tasks_by_workflow(WorkflowType.SAFETY_CHECK)[-1].task_id == "indexed_task"
+        assert registry.get_task_stats()["workflow_distribution"]["safety_check"] == initial_count + 1
+
+        registry.remove_task("indexed_task")
+        assert registry.get_tasks_by_workflow(WorkflowType.SAFETY_CHECK) == initial
+
     def test_create_custom_task(self):
         """Test creating a custom task."""
         registry = TaskRegistry()
@@ -363,6 +460,36 @@ class TestTaskRegistry:
         assert len(issues) > 0
         assert any("Timeout must be positive" in issue for issue in issues)
     
+    def test_validate_task_target_files(self, tmp_path):
+        """Test target file checks with and without a batched directory scan."""
+        registry = TaskRegistry()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").touch()
+        (tmp_path / "src" / "broken.py").symlink_to(tmp_path / "nowhere.py")
+
+        target_files = [str(tmp_path / "src" / name) for name in ("main.py", "broken.py", "missing.py")]
+        target_files.append(str(tmp_path / "nodir" / "file.py"))
+        task = BenchmarkTask(
+            task_id="file_task",
+            name="File Task",
+            description="Task with target files",
+            workflow_type=WorkflowType.SAFETY_CHECK,
+            baseline_prompt="Baseline prompt",
+            tools_prompt="Tools prompt",
+            target_files=target_files,
+        )
+
+        existing_files = registry.find_existing_target_files([task])
+        assert existing_files == {target_files[0]}
+
+        issues = registry.validate_task(task, existing_files)
+        assert issues == registry.validate_task(task)
+        assert issues == [f"Target file not found: {path}" for path in target_files[1:]]
+
+        # The async variants list directories concurrently with the same results
+        assert asyncio.run(registry.find_existing_target_files_async([task])) == existing_files
+        assert asyncio.run(registry.validate_task_async(task)) == issues
+
     def test_get_task_stats(self):
         """Test getting task statistics."""
         registry = TaskRegistry()
@@ -72,6 +72,18 @@ class TestMetricsCollector:
         assert workflow.metadata["test"] == "metadata"
         assert workflow.metadata["result"] == "success"
 
+    def test_measure_workflow_record(self):
+        """Test recording tokens, files and metadata in one call"""
+        with self.collector.measure_workflow(WorkflowType.PATTERN_ANALYSIS) as context:
+            context.record(50, 25, files_processed=5, result="success")
+            context.record(10, 5)
+
+        workflow = self.collector._workflows[0]
+        assert workflow.token_input == 60
+        assert workflow.token_output == 30
+        assert workflow.files_processed == 5
+        assert workflow.metadata["result"] == "success"
+
     def test_measure_workflow_failure(self):
         """Test workflow measurement with exception"""
         with pytest.raises(ValueError):